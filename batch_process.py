@@ -4,140 +4,651 @@ Batch RDC Processing Tool
 Process multiple capture files with progress tracking and error handling
 """
 
+import os
 import sys
+import glob
+import fnmatch
 import json
 import argparse
+import functools
+import hashlib
+import shlex
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, Iterator, List, Optional
 from datetime import datetime
 import time
 
-from renderdoc_tools.workflows import WorkflowRunner, get_preset
+if TYPE_CHECKING:
+    from renderdoc_tools.workflows import WorkflowRunner
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_runner(preset: str) -> "WorkflowRunner":
+    """
+    Build a WorkflowRunner for a preset once per process
+    
+    Runners and their workflows hold no per-file state, so each worker
+    reuses one instead of rebuilding the preset for every file. The
+    workflow package is imported here so --help and argument errors
+    don't pay for loading it.
+    """
+    from renderdoc_tools.workflows import WorkflowRunner, get_preset
+    return WorkflowRunner(get_preset(preset))
+
+
+def _process_one(rdc_file: Path, preset: str, out_base: Path) -> dict:
+    """
+    Run a workflow preset on a single RDC file
+    
+    Top-level so it can be pickled into worker processes. The preset is
+    passed by name and resolved (once per process) inside the worker.
+    
+    Returns:
+        Result dict for the batch report
+    """
+    file_output_dir = out_base / rdc_file.stem
+    try:
+        _cached_runner(preset).run(rdc_file, file_output_dir)
+        return {
+            'file': str(rdc_file),
+            'status': 'success',
+            'output_dir': str(file_output_dir),
+        }
+    except Exception as e:
+        return {
+            'file': str(rdc_file),
+            'status': 'error',
+            'error': str(e),
+        }
+
+
+class ResultCache:
+    """
+    Persistent index of previously processed captures
+    
+    Entries are keyed on the capture's absolute path and preset. A capture
+    is a hit when its (size, mtime_ns) are unchanged, or when the size
+    matches and a digest of its first and last 1 MiB does (e.g. after a
+    copy that reset mtime). The index lives in the batch output directory,
+    next to the outputs it points at.
+    """
+    
+    SAMPLE_BYTES = 1 << 20
+    
+    def __init__(self, index_path: Path):
+        self.index_path = index_path
+        try:
+            with open(index_path, encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+        self._dirty = False
+    
+    @classmethod
+    def _digest(cls, path: Path, size: int) -> str:
+        """Hash the head and tail of a file"""
+        h = hashlib.blake2b(digest_size=16)
+        with open(path, 'rb') as f:
+            h.update(f.read(cls.SAMPLE_BYTES))
+            if size > cls.SAMPLE_BYTES:
+                f.seek(max(cls.SAMPLE_BYTES, size - cls.SAMPLE_BYTES))
+                h.update(f.read())
+        return h.hexdigest()
+    
+    @staticmethod
+    def _key(rdc_file: Path, preset: str) -> str:
+        return f"{preset}:{os.path.abspath(str(rdc_file))}"
+    
+    def lookup(self, rdc_file: Path, preset: str) -> Optional[str]:
+        """Return the cached output directory for a capture, if still valid"""
+        entry = self.entries.get(self._key(rdc_file, preset))
+        if not entry or not os.path.isdir(entry['output_dir']):
+            return None
+        
+        st = os.stat(str(rdc_file))
+        if st.st_size != entry['size']:
+            return None
+        if st.st_mtime_ns != entry['mtime_ns']:
+            if self._digest(rdc_file, st.st_size) != entry['digest']:
+                return None
+            entry['mtime_ns'] = st.st_mtime_ns
+            self._dirty = True
+        return entry['output_dir']
+    
+    def store(self, rdc_file: Path, preset: str, output_dir: str):
+        """Record a successfully processed capture"""
+        st = os.stat(str(rdc_file))
+        self.entries[self._key(rdc_file, preset)] = {
+            'size': st.st_size,
+            'mtime_ns': st.st_mtime_ns,
+            'digest': self._digest(rdc_file, st.st_size),
+            'output_dir': output_dir,
+        }
+        self._dirty = True
+    
+    def save(self):
+        """
+        Write the index back to disk if it changed
+        
+        The index is written to a temporary file and renamed into place, so
+        a crash mid-save never leaves a truncated index.
+        """
+        if not self._dirty:
+            return
+        tmp_path = self.index_path.with_name(self.index_path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f)
+        os.replace(str(tmp_path), str(self.index_path))
+        self._dirty = False
+
+
+class _DaskExecutor:
+    """
+    Executor over a dask.distributed cluster
+    
+    Connects to DASK_SCHEDULER_ADDRESS when set, otherwise starts a local
+    cluster with one single-threaded worker per job. The client is closed
+    on exit so the context-manager usage matches the stdlib executors.
+    """
+    
+    def __init__(self, max_workers: Optional[int] = None):
+        from distributed import Client
+        address = os.environ.get('DASK_SCHEDULER_ADDRESS')
+        if address:
+            self._client = Client(address)
+        else:
+            self._client = Client(n_workers=max_workers, threads_per_worker=1)
+        self._executor = self._client.get_executor()
+    
+    def submit(self, fn, *args, **kwargs):
+        return self._executor.submit(fn, *args, **kwargs)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self._executor.shutdown(wait=True)
+        self._client.close()
+        return False
+
+
+def _mpi_executor(max_workers: Optional[int] = None):
+    """
+    MPI pool from mpi4py; run under mpiexec/srun with -m mpi4py.futures
+    
+    With max_workers=None the pool uses every rank the launcher started
+    besides rank 0.
+    """
+    from mpi4py.futures import MPIPoolExecutor
+    return MPIPoolExecutor(max_workers=max_workers)
+
+
+# Worker pool per --backend. Each factory takes max_workers and returns a
+# concurrent.futures-style executor, so process_files drives them all the
+# same way. The thread backend only scales if the RenderDoc bindings release
+# the GIL inside the replay controller calls. 'mpi' and 'dask' spread work
+# across nodes and need the captures and output directory on shared storage.
+BACKENDS = {
+    'process': ProcessPoolExecutor,
+    'thread': ThreadPoolExecutor,
+    'mpi': _mpi_executor,
+    'dask': _DaskExecutor,
+}
+
+
+SLURM_TEMPLATE = """#!/bin/bash
+#SBATCH --job-name=rdc-batch
+#SBATCH --nodes={nodes}
+#SBATCH --ntasks-per-node={tasks_per_node}
+#SBATCH --output=rdc-batch-%j.log
+
+# Rank 0 runs the batch; the remaining ranks become MPIPoolExecutor workers
+srun python -m mpi4py.futures {command}
+"""
+
+
+def write_slurm_script(path: Path, argv: List[str], nodes: int, tasks_per_node: int):
+    """
+    Write an sbatch script that reruns this batch on the MPI backend
+    
+    Args:
+        path: Script path to write
+        argv: Batch arguments to forward (without Slurm or backend options)
+        nodes: Number of nodes to request
+        tasks_per_node: MPI ranks per node
+    """
+    command = ' '.join(shlex.quote(a) for a in [os.path.abspath(__file__)] + argv + ['--backend', 'mpi'])
+    Path(path).write_text(SLURM_TEMPLATE.format(
+        nodes=nodes,
+        tasks_per_node=tasks_per_node,
+        command=command,
+    ))
+
+
+def _strip_options(argv: List[str], names: List[str]) -> List[str]:
+    """
+    Drop value-taking options from an argv list
+    
+    Matches '--name value', '--name=value' and '-nvalue', as well as long
+    names abbreviated the way argparse accepts them ('--slurm-n 3'). The
+    argv must already have parsed, so an abbreviation is unambiguous.
+    """
+    long_names = [name for name in names if name.startswith('--')]
+    short_names = [name for name in names if not name.startswith('--')]
+    kept = []
+    skip = False
+    for i, arg in enumerate(argv):
+        if skip:
+            skip = False
+            continue
+        if arg == '--':
+            # Everything after is positional
+            kept.extend(argv[i:])
+            break
+        option, eq, _ = arg.partition('=')
+        if option.startswith('--') and len(option) > 2:
+            if any(name.startswith(option) for name in long_names):
+                skip = not eq
+                continue
+        elif arg in short_names:
+            skip = True
+            continue
+        elif any(arg.startswith(name) for name in short_names):
+            continue
+        kept.append(arg)
+    return kept
+
+
+# Directories never searched for captures (unless --include-hidden)
+SKIP_DIRS = frozenset({'__pycache__', 'node_modules', '.git', 'venv', 'venv36'})
 
 
 class BatchProcessor:
     """Process multiple RDC files in batch"""
     
-    def __init__(self, output_base_dir: str = './batch_output'):
+    def __init__(
+        self,
+        output_base_dir: str = './batch_output',
+        flush_every: int = 1,
+        use_cache: bool = True,
+        refresh: bool = False
+    ):
+        """
+        Initialize batch processor
+        
+        Per-file results are appended to batch_results.jsonl as they complete,
+        so a crashed batch keeps everything finished so far and memory stays
+        flat regardless of batch size. Earlier runs' records are kept; the
+        report only covers records from this run. The cache index is saved
+        whenever the sidecar is flushed, so a crashed batch can be resumed.
+        
+        Args:
+            output_base_dir: Base output directory
+            flush_every: Flush the results sidecar and cache index every N results
+            use_cache: Skip captures unchanged since a previous run
+            refresh: Reprocess everything, but still update the cache index
+        """
         self.output_base_dir = Path(output_base_dir)
         self.output_base_dir.mkdir(parents=True, exist_ok=True)
-        self.results = []
+        self.results_path = self.output_base_dir / 'batch_results.jsonl'
+        self._results_file = open(self.results_path, 'a', encoding='utf-8', buffering=8192)
+        self._results_start = self._results_file.tell()
+        if self._results_start and not self._ends_with_newline(self.results_path):
+            # Terminate a record left half-written by a crashed run
+            self._results_file.write('\n')
+            self._results_start += 1
+        self.flush_every = max(1, flush_every)
+        self._unflushed = 0
+        self.counts = {'success': 0, 'error': 0, 'cached': 0}
+        self.cache = ResultCache(self.output_base_dir / 'cache_index.json') if use_cache else None
+        self.refresh = refresh
         self.start_time = None
     
+    @staticmethod
+    def _ends_with_newline(path: Path) -> bool:
+        with open(path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b'\n'
+    
+    def _record(self, result: dict):
+        """Append a per-file result to the JSONL sidecar"""
+        self._results_file.write(json.dumps(result) + '\n')
+        self.counts[result['status']] += 1
+        self._unflushed += 1
+        if self._unflushed >= self.flush_every:
+            self._results_file.flush()
+            if self.cache is not None:
+                self.cache.save()
+            self._unflushed = 0
+    
     def process_files(self, 
                      rdc_files: List[Path], 
                      preset: str = 'quick',
-                     continue_on_error: bool = True):
-        """Process multiple RDC files"""
+                     continue_on_error: bool = True,
+                     jobs: Optional[int] = None,
+                     backend: str = 'process'):
+        """
+        Process multiple RDC files
+        
+        Files are independent, so they are fanned out across a worker pool.
+        
+        Args:
+            rdc_files: RDC files to process
+            preset: Workflow preset name
+            continue_on_error: Keep going after a failed file
+            jobs: Number of workers (default: CPU count; for 'mpi', every
+                worker rank the launcher started)
+            backend: A BACKENDS name. The thread backend avoids pickling and
+                process startup, but relies on RenderDoc dropping the GIL;
+                'mpi' and 'dask' distribute files across nodes.
+        """
         
         self.start_time = time.time()
         total = len(rdc_files)
+        if backend != 'mpi':
+            jobs = jobs or os.cpu_count() or 1
+        
+        # Validate workflow preset before spinning up workers
+        try:
+            workflow_preset = _cached_runner(preset).workflow
+        except ValueError as e:
+            print(f"ERROR: {e}")
+            sys.exit(1)
+        
+        # Analyzers are pure Python and hold the GIL, so threads won't help
+        if backend == 'thread' and workflow_preset.analyzers:
+            print(f"Note: preset '{preset}' runs Python analyzers, using process backend")
+            backend = 'process'
         
         print(f"\n{'='*60}")
         print(f"Batch Processing: {total} file(s)")
         print(f"Preset: {preset}")
+        print(f"Jobs: {jobs or 'all MPI worker ranks'} ({backend})")
         print(f"Output: {self.output_base_dir}")
         print(f"{'='*60}\n")
         
-        # Get workflow preset
+        # Captures unchanged since a previous run skip the workflow entirely
+        to_process = []
+        idx = 0
+        for rdc_file in rdc_files:
+            cached_dir = None
+            if self.cache is not None and not self.refresh:
+                cached_dir = self.cache.lookup(rdc_file, preset)
+            if cached_dir is None:
+                to_process.append(rdc_file)
+                continue
+            idx += 1
+            self._record({
+                'file': str(rdc_file),
+                'status': 'cached',
+                'output_dir': cached_dir,
+            })
+            print(f"= [{idx}/{total}] Cached: {rdc_file.name}")
+        
         try:
-            workflow_preset = get_preset(preset)
-        except ValueError as e:
-            print(f"ERROR: {e}")
+            executor = BACKENDS[backend](max_workers=jobs)
+        except ImportError as e:
+            print(f"ERROR: '{backend}' backend is unavailable: {e}")
             sys.exit(1)
         
-        for idx, rdc_file in enumerate(rdc_files, 1):
-            print(f"\n[{idx}/{total}] Processing: {rdc_file.name}")
-            print("-" * 60)
-            
-            try:
-                # Create per-file output directory
-                file_output_dir = self.output_base_dir / rdc_file.stem
-                
-                runner = WorkflowRunner(workflow_preset)
-                runner.run(rdc_file, file_output_dir)
-                
-                self.results.append({
-                    'file': str(rdc_file),
-                    'status': 'success',
-                    'output_dir': str(file_output_dir),
-                })
-                print(f"✓ [{idx}/{total}] Completed: {rdc_file.name}")
-                
-            except Exception as e:
-                error_msg = str(e)
-                print(f"✗ [{idx}/{total}] Failed: {rdc_file.name}")
-                print(f"  Error: {error_msg}")
-                
-                self.results.append({
-                    'file': str(rdc_file),
-                    'status': 'error',
-                    'error': error_msg,
-                })
+        try:
+            with executor as ex:
+                futures = {
+                    ex.submit(_process_one, rdc_file, preset, self.output_base_dir): rdc_file
+                    for rdc_file in to_process
+                }
                 
-                if not continue_on_error:
-                    print("\nStopping batch processing due to error")
-                    break
-        
-        # Generate batch report
-        self._generate_batch_report(preset)
+                for idx, future in enumerate(as_completed(futures), idx + 1):
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        # A native crash in a worker breaks the whole pool
+                        # (BrokenProcessPool); every file still in it lands here
+                        result = {
+                            'file': str(futures[future]),
+                            'status': 'error',
+                            'error': f"{type(e).__name__}: {e}",
+                        }
+                    # Store before recording, so the flush checkpoints it
+                    if result['status'] == 'success' and self.cache is not None:
+                        self.cache.store(Path(result['file']), preset, result['output_dir'])
+                    self._record(result)
+                    name = Path(result['file']).name
+                    
+                    if result['status'] == 'success':
+                        print(f"✓ [{idx}/{total}] Completed: {name}")
+                        continue
+                    
+                    print(f"✗ [{idx}/{total}] Failed: {name}")
+                    print(f"  Error: {result['error']}")
+                    
+                    if not continue_on_error:
+                        print("\nStopping batch processing due to error")
+                        # Drop queued files; already-running ones finish on exit
+                        for pending in futures:
+                            pending.cancel()
+                        break
+        finally:
+            # Keep what finished so far even if the batch is aborted
+            if self.cache is not None:
+                self.cache.save()
+            
+            # Generate batch report
+            self._generate_batch_report(preset)
     
     def _generate_batch_report(self, preset: str):
         """Generate summary report for batch processing"""
         elapsed = time.time() - self.start_time
         
-        successful = [r for r in self.results if r['status'] == 'success']
-        failed = [r for r in self.results if r['status'] == 'error']
+        self._results_file.close()
         
         report = {
             'timestamp': datetime.now().isoformat(),
             'preset': preset,
             'summary': {
-                'total': len(self.results),
-                'successful': len(successful),
-                'failed': len(failed),
+                'total': sum(self.counts.values()),
+                'successful': self.counts['success'] + self.counts['cached'],
+                'cached': self.counts['cached'],
+                'failed': self.counts['error'],
                 'elapsed_seconds': round(elapsed, 2),
             },
-            'results': self.results,
         }
         
+        # Compose the report by streaming results back out of the sidecar.
+        # The layout matches json.dumps(report, indent=2) with a trailing
+        # 'results' list.
+        failed = []
         report_path = self.output_base_dir / 'batch_report.json'
-        with open(report_path, 'w') as f:
-            json.dump(report, f, indent=2)
+        head = json.dumps(report, indent=2)[:-2] + ',\n  "results": ['
+        with open(report_path, 'wb', buffering=1 << 20) as out, \
+                open(self.results_path, encoding='utf-8') as results:
+            results.seek(self._results_start)
+            out.write(head.encode('utf-8'))
+            sep = '\n    '
+            for line in results:
+                result = json.loads(line)
+                if result['status'] == 'error':
+                    failed.append(result)
+                item = json.dumps(result, indent=2).replace('\n', '\n    ')
+                out.write((sep + item).encode('utf-8'))
+                sep = ',\n    '
+            out.write(b'\n  ]\n}' if sep != '\n    ' else b']\n}')
         
-        print(f"\n{'='*60}")
-        print(f"Batch Processing Complete")
-        print(f"{'='*60}")
-        print(f"Total files:    {report['summary']['total']}")
-        print(f"Successful:     {report['summary']['successful']}")
-        print(f"Failed:         {report['summary']['failed']}")
-        print(f"Elapsed time:   {report['summary']['elapsed_seconds']:.2f}s")
-        print(f"\nReport saved:   {report_path}")
+        # Assemble the summary and write it in one call rather than per line
+        summary = report['summary']
+        lines = [
+            f"\n{'='*60}",
+            "Batch Processing Complete",
+            f"{'='*60}",
+            f"Total files:    {summary['total']}",
+            f"Successful:     {summary['successful']}",
+            f"Cached:         {summary['cached']}",
+            f"Failed:         {summary['failed']}",
+            f"Elapsed time:   {summary['elapsed_seconds']:.2f}s",
+            f"\nReport saved:   {report_path}",
+        ]
         
         if failed:
-            print(f"\nFailed files:")
-            for result in failed:
-                print(f"  - {Path(result['file']).name}: {result.get('error', 'Unknown error')}")
+            lines.append("\nFailed files:")
+            lines.extend(
+                f"  - {Path(result['file']).name}: {result.get('error', 'Unknown error')}"
+                for result in failed
+            )
+        
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
 
 
-def find_rdc_files(paths: List[str], recursive: bool = False) -> List[Path]:
-    """Find all RDC files from given paths"""
-    rdc_files = []
+def _walk_rdc(
+    root: str,
+    recursive: bool = False,
+    include_hidden: bool = False
+) -> Iterator[os.DirEntry]:
+    """
+    Yield directory entries of .rdc files under a directory
+    
+    Uses os.scandir so file type checks come from the directory listing
+    instead of an extra stat per entry. Hidden directories and SKIP_DIRS
+    are pruned without being entered.
+    
+    Args:
+        root: Directory to search
+        recursive: Descend into subdirectories
+        include_hidden: Also descend into hidden directories and SKIP_DIRS
+    """
+    pending = deque([root])
+    while pending:
+        current = pending.popleft()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not recursive:
+                            continue
+                        if not include_hidden and (
+                            entry.name.startswith('.') or entry.name in SKIP_DIRS
+                        ):
+                            continue
+                        pending.append(entry.path)
+                    elif entry.name.lower().endswith('.rdc') and entry.is_file():
+                        yield entry
+        except OSError as e:
+            print(f"Warning: Cannot read directory {current}: {e}")
+
+
+def _walk_layout(root: str, layout: str, include_hidden: bool = False) -> Iterator[os.DirEntry]:
+    """
+    Yield .rdc entries matching a fixed-depth layout under a directory
+    
+    The layout is matched one level at a time ('*/*/*.rdc' lists the
+    root, then each matching child, then each matching grandchild), so
+    deeper directories are never listed. Matching is case-insensitive.
+    
+    Args:
+        root: Directory to search
+        layout: Relative glob pattern, one component per level
+        include_hidden: Also descend into hidden directories and SKIP_DIRS
+    """
+    *dir_parts, file_part = [p.lower() for p in Path(layout).parts]
+    level = [root]
+    for part in dir_parts:
+        next_level = []
+        for current in level:
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        name = entry.name
+                        if not include_hidden and (name.startswith('.') or name in SKIP_DIRS):
+                            continue
+                        if entry.is_dir() and fnmatch.fnmatchcase(name.lower(), part):
+                            next_level.append(entry.path)
+            except OSError as e:
+                print(f"Warning: Cannot read directory {current}: {e}")
+        level = next_level
+    
+    for current in level:
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    name = entry.name.lower()
+                    if name.endswith('.rdc') and fnmatch.fnmatchcase(name, file_part) and entry.is_file():
+                        yield entry
+        except OSError as e:
+            print(f"Warning: Cannot read directory {current}: {e}")
+
+
+def _expand_pattern(pattern: str) -> Iterator[Path]:
+    """
+    Expand a glob pattern, scanning only below its literal prefix
+    
+    'captures/2024/*.rdc' lists 'captures/2024' alone rather than
+    matching the pattern against everything under the working directory.
+    """
+    parts = Path(pattern).parts
+    literal = []
+    for part in parts:
+        if glob.has_magic(part):
+            break
+        literal.append(part)
+    
+    base = Path(*literal) if literal else Path('.')
+    rest = parts[len(literal):]
+    return base.glob(str(Path(*rest)))
+
+
+def find_rdc_files(
+    paths: List[str],
+    recursive: bool = False,
+    include_hidden: bool = False,
+    layout: Optional[str] = None
+) -> List[Path]:
+    """
+    Find all RDC files from given paths
+    
+    Directories are searched with a recursive walk, or only at the levels
+    given by ``layout`` (e.g. '*/*/*.rdc') when it is set.
+    
+    Files reached more than once (overlapping directories, symlinks or
+    hardlinks) are kept once, keyed by (st_dev, st_ino); the path that
+    sorts first is used so the result doesn't depend on scandir order.
+    """
+    seen = {}
+    
+    def add(path: str, st: os.stat_result):
+        if not st.st_ino:
+            # DirEntry.stat() leaves st_ino zero on Windows
+            st = os.stat(path)
+        key = (st.st_dev, st.st_ino)
+        if key not in seen or path < seen[key]:
+            seen[key] = path
     
     for path_str in paths:
-        path = Path(path_str)
-        
-        if path.is_file() and path.suffix.lower() == '.rdc':
-            rdc_files.append(path)
-        elif path.is_dir():
-            if recursive:
-                rdc_files.extend(path.rglob('*.rdc'))
-            else:
-                rdc_files.extend(path.glob('*.rdc'))
-        else:
-            print(f"Warning: Skipping invalid path: {path}")
+        # Literal paths take the direct is_file/is_dir fast path
+        candidates = _expand_pattern(path_str) if glob.has_magic(path_str) else [Path(path_str)]
+        
+        matched = False
+        for path in candidates:
+            try:
+                if path.is_file() and path.suffix.lower() == '.rdc':
+                    add(str(path), path.stat())
+                    matched = True
+                elif path.is_dir():
+                    if layout:
+                        entries = _walk_layout(str(path), layout, include_hidden)
+                    else:
+                        entries = _walk_rdc(str(path), recursive, include_hidden)
+                    for entry in entries:
+                        add(entry.path, entry.stat())
+                    matched = True
+            except OSError as e:
+                print(f"Warning: Cannot stat {path}: {e}")
+        
+        if not matched:
+            print(f"Warning: Skipping invalid path: {path_str}")
     
-    return sorted(set(rdc_files))  # Remove duplicates and sort
+    return [Path(p) for p in sorted(seen.values())]
 
 
 def main():
@@ -152,16 +663,35 @@ Examples:
   # Process specific files
   python batch_process.py file1.rdc file2.rdc --preset quest
   
+  # Glob patterns (quote them so the shell doesn't expand)
+  python batch_process.py "captures/2024/*.rdc" --preset quick
+  
   # Recursive directory search
   python batch_process.py captures/ --recursive --preset full
   
+  # Captures stored at a fixed depth (<project>/<date>/*.rdc)
+  python batch_process.py captures/ --depth 2 --preset quick
+  
   # Custom output directory
   python batch_process.py captures/ --output-dir ./results --preset quick
+  
+  # Limit parallel workers
+  python batch_process.py captures/ --jobs 4 --preset quick
+  
+  # Use threads instead of processes
+  python batch_process.py captures/ --backend thread --preset quick
+  
+  # Spread across a Dask cluster (set DASK_SCHEDULER_ADDRESS)
+  python batch_process.py captures/ --backend dask --preset quick
+  
+  # Generate a Slurm job that runs the batch on 4 nodes over MPI
+  python batch_process.py captures/ --slurm-script batch.sbatch --slurm-nodes 4
+  sbatch batch.sbatch
         """
     )
     
     parser.add_argument('paths', nargs='+',
-                       help='RDC files or directories containing .rdc files')
+                       help='RDC files, directories, or glob patterns')
     parser.add_argument('--preset', '-p',
                        default='quick',
                        help='Workflow preset to use (default: quick)')
@@ -170,13 +700,53 @@ Examples:
                        help='Base output directory (default: ./batch_output)')
     parser.add_argument('--recursive', '-r', action='store_true',
                        help='Recursively search directories')
+    parser.add_argument('--depth', type=int, metavar='D',
+                       help='Only look for captures exactly D directories below each path '
+                            '(lists D levels instead of walking the whole tree)')
+    parser.add_argument('--layout', metavar='PATTERN',
+                       help='Only look for captures matching a relative pattern such as '
+                            '"*/*/*.rdc" under each directory')
+    parser.add_argument('--include-hidden', action='store_true',
+                       help='Also search hidden directories and ' + ', '.join(sorted(SKIP_DIRS)))
     parser.add_argument('--stop-on-error', action='store_true',
                        help='Stop processing on first error')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Ignore and do not update cache_index.json')
+    parser.add_argument('--refresh', action='store_true',
+                       help='Reprocess all files and rebuild cache_index.json')
+    parser.add_argument('--flush-every', type=int, default=1,
+                       help='Flush batch_results.jsonl every N results (default: 1)')
+    parser.add_argument('--jobs', '-j', type=int, default=None,
+                       help='Number of parallel workers (default: CPU count; all worker ranks for mpi)')
+    parser.add_argument('--backend', choices=sorted(BACKENDS), default='process',
+                       help='Worker pool type (default: process). "thread" requires '
+                            'RenderDoc bindings that release the GIL during replay; '
+                            '"mpi" needs mpi4py and "dask" needs distributed')
+    parser.add_argument('--slurm-script', metavar='FILE',
+                       help='Write an sbatch script running this batch with --backend mpi, then exit')
+    parser.add_argument('--slurm-nodes', type=int, default=2,
+                       help='Nodes to request in --slurm-script (default: 2)')
+    parser.add_argument('--slurm-tasks-per-node', type=int, default=None,
+                       help='MPI ranks per node in --slurm-script (default: CPU count)')
     
     args = parser.parse_args()
     
+    if args.slurm_script:
+        # The MPI pool is sized by the ranks srun starts, so --jobs is not forwarded
+        argv = _strip_options(sys.argv[1:], [
+            '--slurm-script', '--slurm-nodes', '--slurm-tasks-per-node',
+            '--backend', '--jobs', '-j',
+        ])
+        tasks_per_node = args.slurm_tasks_per_node or os.cpu_count() or 1
+        write_slurm_script(args.slurm_script, argv, args.slurm_nodes, tasks_per_node)
+        print(f"Wrote Slurm script: {args.slurm_script}")
+        return
+    
     # Find all RDC files
-    rdc_files = find_rdc_files(args.paths, args.recursive)
+    layout = args.layout
+    if layout is None and args.depth is not None:
+        layout = '*/' * args.depth + '*.rdc'
+    rdc_files = find_rdc_files(args.paths, args.recursive, args.include_hidden, layout)
     
     if not rdc_files:
         print("ERROR: No .rdc files found")
@@ -185,11 +755,18 @@ Examples:
     print(f"Found {len(rdc_files)} RDC file(s)")
     
     # Process files
-    processor = BatchProcessor(args.output_dir)
+    processor = BatchProcessor(
+        args.output_dir,
+        flush_every=args.flush_every,
+        use_cache=not args.no_cache,
+        refresh=args.refresh
+    )
     processor.process_files(
         rdc_files,
         preset=args.preset,
-        continue_on_error=not args.stop_on_error
+        continue_on_error=not args.stop_on_error,
+        jobs=args.jobs,
+        backend=args.backend
     )
 
 
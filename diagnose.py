@@ -6,34 +6,58 @@ Checks the setup and provides actionable fixes.
 import sys
 import os
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Per-thread output buffer so checks can run concurrently but print in order
+_output = threading.local()
+
 
 class Colors:
-    """ANSI color codes."""
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    CYAN = '\033[96m'
-    RESET = '\033[0m'
-    BOLD = '\033[1m'
+    """ANSI color codes (disabled when not writing to a terminal)."""
+    if sys.stdout is not None and sys.stdout.isatty():
+        GREEN = '\033[92m'
+        YELLOW = '\033[93m'
+        RED = '\033[91m'
+        CYAN = '\033[96m'
+        RESET = '\033[0m'
+        BOLD = '\033[1m'
+    else:
+        GREEN = YELLOW = RED = CYAN = RESET = BOLD = ''
+
+
+# Styled fragments built once rather than on every print
+_RULE = f"{Colors.CYAN}{Colors.BOLD}{'=' * 60}{Colors.RESET}"
+_HEADER_START = f"\n{_RULE}\n{Colors.CYAN}{Colors.BOLD}"
+_HEADER_END = f"{Colors.RESET}\n{_RULE}\n\n"
+_OK = f"{Colors.GREEN}✓{Colors.RESET} "
+_FAIL = f"{Colors.RED}✗{Colors.RESET} "
+_FIX = f"\n  {Colors.YELLOW}→ Fix:{Colors.RESET} "
 
 
 def print_header(text):
     """Print a styled header."""
-    print(f"\n{Colors.CYAN}{Colors.BOLD}{'=' * 60}{Colors.RESET}")
-    print(f"{Colors.CYAN}{Colors.BOLD}{text}{Colors.RESET}")
-    print(f"{Colors.CYAN}{Colors.BOLD}{'=' * 60}{Colors.RESET}\n")
+    sys.stdout.write(_HEADER_START + text + _HEADER_END)
+
+
+def _emit(text):
+    """Print text, or collect it if the current thread is buffering."""
+    lines = getattr(_output, 'lines', None)
+    if lines is None:
+        sys.stdout.write(text + '\n')
+    else:
+        lines.append(text)
 
 
 def print_check(passed, message, fix_hint=None):
     """Print a check result with optional fix hint."""
     if passed:
-        print(f"{Colors.GREEN}✓{Colors.RESET} {message}")
+        _emit(_OK + message)
+    elif fix_hint:
+        _emit(_FAIL + message + _FIX + fix_hint)
     else:
-        print(f"{Colors.RED}✗{Colors.RESET} {message}")
-        if fix_hint:
-            print(f"  {Colors.YELLOW}→ Fix:{Colors.RESET} {fix_hint}")
+        _emit(_FAIL + message)
 
 
 def check_python_version():
@@ -141,19 +165,39 @@ def check_wrapper_scripts():
     return all_exist
 
 
+CHECKS = [
+    ("Python 3.6", check_python_version),
+    ("Virtual Environment", check_virtual_environment),
+    ("Package Installed", check_package_installed),
+    ("RenderDoc", check_renderdoc),
+    ("Wrapper Scripts", check_wrapper_scripts),
+]
+
+
+def _run_buffered(check):
+    """Run a check in this thread, returning (result, output lines)."""
+    _output.lines = []
+    try:
+        return check(), _output.lines
+    finally:
+        _output.lines = None
+
+
 def run_diagnostics():
     """Run all diagnostic checks."""
     print_header("RenderDocTools Diagnostics")
     
     print(f"{Colors.BOLD}Running checks...{Colors.RESET}\n")
     
-    results = {
-        "Python 3.6": check_python_version(),
-        "Virtual Environment": check_virtual_environment(),
-        "Package Installed": check_package_installed(),
-        "RenderDoc": check_renderdoc(),
-        "Wrapper Scripts": check_wrapper_scripts()
-    }
+    # Checks are independent and mostly I/O, so run them together and
+    # print each one's buffered output in the original order
+    with ThreadPoolExecutor(max_workers=len(CHECKS)) as executor:
+        futures = [(name, executor.submit(_run_buffered, check)) for name, check in CHECKS]
+        results = {}
+        for name, future in futures:
+            results[name], lines = future.result()
+            if lines:
+                print('\n'.join(lines))
     
     # Summary
     print_header("Summary")
@@ -162,13 +206,18 @@ def run_diagnostics():
     total = len(results)
     
     if passed == total:
-        print(f"{Colors.GREEN}{Colors.BOLD}✓ All checks passed ({passed}/{total}){Colors.RESET}")
-        print(f"\n{Colors.CYAN}You're ready to use RenderDocTools!{Colors.RESET}")
-        print(f"\nTry: {Colors.BOLD}rdc-tools workflow --list-presets{Colors.RESET}")
+        lines = [
+            f"{Colors.GREEN}{Colors.BOLD}✓ All checks passed ({passed}/{total}){Colors.RESET}",
+            f"\n{Colors.CYAN}You're ready to use RenderDocTools!{Colors.RESET}",
+            f"\nTry: {Colors.BOLD}rdc-tools workflow --list-presets{Colors.RESET}",
+        ]
     else:
-        print(f"{Colors.YELLOW}⚠ {passed}/{total} checks passed{Colors.RESET}")
-        print(f"\n{Colors.YELLOW}Please fix the issues above.{Colors.RESET}")
-        print(f"\n{Colors.CYAN}Quick fix:{Colors.RESET} Run {Colors.BOLD}.\\setup.ps1{Colors.RESET} to auto-setup")
+        lines = [
+            f"{Colors.YELLOW}⚠ {passed}/{total} checks passed{Colors.RESET}",
+            f"\n{Colors.YELLOW}Please fix the issues above.{Colors.RESET}",
+            f"\n{Colors.CYAN}Quick fix:{Colors.RESET} Run {Colors.BOLD}.\\setup.ps1{Colors.RESET} to auto-setup",
+        ]
+    print('\n'.join(lines))
     
     return passed == total
 
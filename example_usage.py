@@ -4,102 +4,188 @@ Example: Advanced RDC data extraction
 Shows how to use the new renderdoc_tools package
 """
 
-from renderdoc_tools.parser import Parser
-from renderdoc_tools.core import CaptureFile
-from renderdoc_tools.extractors import ActionExtractor, ResourceExtractor
-from renderdoc_tools.exporters import JSONExporter
 from pathlib import Path
+import heapq
+import importlib
 import json
+from operator import itemgetter
+
+# renderdoc_tools, numpy and pandas are imported inside the functions that
+# use them so the usage message doesn't pay for loading them.
+
+
+def _optional_import(name: str):
+    """Import an optional dependency, returning None if it's missing"""
+    try:
+        return importlib.import_module(name)
+    except ImportError:  # Optional: pip install renderdoc-tools[analysis]
+        return None
 
 
 def analyze_draw_calls(rdc_path: str):
     """Extract and analyze draw call patterns"""
+    from renderdoc_tools.parser import Parser
     
+    np = _optional_import('numpy')
     parser = Parser()
     capture_data = parser.parse(Path(rdc_path))
     
-    # Filter only draw calls
-    draw_calls = [a for a in capture_data.actions if 'Drawcall' in a.flags]
+    if np is not None:
+        from renderdoc_tools import analytics_fast
+        from renderdoc_tools.core.arrays import DRAWCALL, actions_to_array, top_k_indices
+        
+        arr = actions_to_array(capture_data.actions)
+        if analytics_fast.use_jit(len(arr)):
+            # Very large captures: one parallel compiled scan
+            draw_count, total_indices, total_instances, costs, idx = analytics_fast.draw_stats(
+                arr['flags'], arr['num_indices'], arr['num_instances'], DRAWCALL, 5
+            )
+            expensive = [(int(arr['event_id'][i]), int(c)) for c, i in zip(costs, idx)]
+        else:
+            # Struct-of-arrays view: filtering and totals become vector ops
+            draws = arr[(arr['flags'] & DRAWCALL) != 0]
+            ni = draws['num_indices'].astype(np.int64)
+            nn = draws['num_instances'].astype(np.int64)
+            draw_count = len(draws)
+            total_indices = int(ni.sum())
+            total_instances = int(nn.sum())
+            
+            cost = ni * np.maximum(nn, 1)
+            order = top_k_indices(cost, 5)
+            expensive = [(int(draws['event_id'][i]), int(cost[i])) for i in order]
+    else:
+        # Single pass: count draws, accumulate totals, keep a top-5 min-heap.
+        # Ties keep the earliest event, matching a stable descending sort.
+        draw_count = total_indices = total_instances = 0
+        top = []  # (cost, -event_id)
+        push, replace = heapq.heappush, heapq.heapreplace
+        for a in capture_data.actions:
+            if 'Drawcall' not in a.flags:
+                continue
+            ni = a.num_indices or 0
+            nn = a.num_instances or 0
+            draw_count += 1
+            total_indices += ni
+            total_instances += nn
+            entry = (ni * (nn or 1), -a.event_id)
+            if len(top) < 5:
+                push(top, entry)
+            elif entry > top[0]:
+                replace(top, entry)
+        expensive = [(-neg_id, cost) for cost, neg_id in sorted(top, reverse=True)]
     
     print(f"\n=== Draw Call Analysis ===")
     print(f"Total actions: {len(capture_data.actions)}")
-    print(f"Draw calls: {len(draw_calls)}")
+    print(f"Draw calls: {draw_count}")
     
     # Analyze by type
-    if draw_calls:
-        total_indices = sum(a.num_indices or 0 for a in draw_calls)
-        total_instances = sum(a.num_instances or 0 for a in draw_calls)
-        
+    if draw_count:
         print(f"Total indices drawn: {total_indices:,}")
         print(f"Total instances: {total_instances:,}")
         
-        # Find expensive draws
-        expensive = sorted(draw_calls, 
-                         key=lambda x: (x.num_indices or 0) * (x.num_instances or 1),
-                         reverse=True)[:5]
-        
         print(f"\nTop 5 most expensive draws:")
-        for i, dc in enumerate(expensive, 1):
-            cost = (dc.num_indices or 0) * (dc.num_instances or 1)
-            print(f"  {i}. Event {dc.event_id}: {cost:,} vertices")
+        for i, (event_id, cost) in enumerate(expensive, 1):
+            print(f"  {i}. Event {event_id}: {cost:,} vertices")
 
 
 def analyze_textures(rdc_path: str):
     """Extract and analyze texture usage"""
+    from renderdoc_tools.parser import Parser
     
+    np = _optional_import('numpy')
     parser = Parser()
     capture_data = parser.parse(Path(rdc_path))
     
-    textures = [r for r in capture_data.resources if r.resource_type == 'Texture' and r.texture]
+    resources = capture_data.resources
+    if np is not None:
+        from renderdoc_tools import analytics_fast
+        from renderdoc_tools.core.arrays import textures_to_array, top_k_indices
+        tex = textures_to_array(resources)
+        texture_count = len(tex)
+    else:
+        textures = [r for r in resources if r.resource_type == 'Texture' and r.texture]
+        texture_count = len(textures)
     
     print(f"\n=== Texture Analysis ===")
-    print(f"Total resources: {len(capture_data.resources)}")
-    print(f"Textures: {len(textures)}")
+    print(f"Total resources: {len(resources)}")
+    print(f"Textures: {texture_count}")
+    
+    if not texture_count:
+        return
     
-    if textures:
-        # Memory estimation (rough)
+    if np is not None:
+        w = tex['width'].astype(np.int64)
+        h = tex['height'].astype(np.int64)
+        d = tex['depth'].astype(np.int64)
+        m = tex['mips'].astype(np.int64)
+        
+        # Rough estimate: width * height * depth * mips * 4 bytes
+        if analytics_fast.use_jit(texture_count):
+            total_mem = int(analytics_fast.texture_vram(w, h, d, m))
+        else:
+            total_mem = int((w * h * d * m).sum()) * 4
+        
+        # O(N) selection of the 5 largest, then sort just those
+        top = top_k_indices(w * h, 5)
+        largest = [resources[i] for i in tex['index'][top]]
+    else:
         total_mem = 0
+        areas = []
         for tex_res in textures:
             tex = tex_res.texture
+            width, height = tex.width, tex.height
             # Rough estimate: width * height * depth * mips * 4 bytes
-            mem = tex.width * tex.height * tex.depth * tex.mips * 4
-            total_mem += mem
-        
-        print(f"Estimated VRAM usage: {total_mem / (1024*1024):.2f} MB")
-        
-        # Find largest textures
-        largest = sorted(textures, 
-                       key=lambda x: x.texture.width * x.texture.height if x.texture else 0,
-                       reverse=True)[:5]
+            total_mem += width * height * tex.depth * tex.mips * 4
+            areas.append((width * height, tex_res))
         
-        print(f"\nTop 5 largest textures:")
-        for i, tex_res in enumerate(largest, 1):
-            if tex_res.texture:
-                tex = tex_res.texture
-                print(f"  {i}. {tex_res.name}: {tex.width}x{tex.height} {tex.format}")
+        # Areas are computed once above; nlargest keeps a 5-item heap
+        # rather than sorting everything (ties stay in input order)
+        largest = [t for _, t in heapq.nlargest(5, areas, key=itemgetter(0))]
+    
+    print(f"Estimated VRAM usage: {total_mem / (1024*1024):.2f} MB")
+    
+    print(f"\nTop 5 largest textures:")
+    for i, tex_res in enumerate(largest, 1):
+        tex = tex_res.texture
+        print(f"  {i}. {tex_res.name}: {tex.width}x{tex.height} {tex.format}")
 
 
 def export_shader_summary(rdc_path: str, output: str):
     """Create a shader usage summary"""
+    from renderdoc_tools.parser import Parser
     
+    pd = _optional_import('pandas')
     parser = Parser()
     capture_data = parser.parse(Path(rdc_path))
     
+    shaders = capture_data.shaders
     summary = {
-        'total_shaders': len(capture_data.shaders),
+        'total_shaders': len(shaders),
         'by_stage': {},
         'shaders': []
     }
     
-    for shader in capture_data.shaders:
-        stage = shader.stage
-        summary['by_stage'][stage] = summary['by_stage'].get(stage, 0) + 1
-        
-        summary['shaders'].append({
-            'name': shader.name,
-            'stage': stage,
-            'entry': shader.entry_point,
-        })
+    if pd is not None:
+        df = pd.DataFrame({
+            'name': [s.name for s in shaders],
+            'stage': [s.stage for s in shaders],
+            'entry': [s.entry_point for s in shaders],
+        }, dtype=object)  # Keep missing entry points as None, not NaN
+        # value_counts yields numpy ints, which json cannot serialize
+        summary['by_stage'] = {
+            stage: int(count) for stage, count in df['stage'].value_counts().items()
+        }
+        summary['shaders'] = df.to_dict(orient='records')
+    else:
+        for shader in shaders:
+            stage = shader.stage
+            summary['by_stage'][stage] = summary['by_stage'].get(stage, 0) + 1
+            
+            summary['shaders'].append({
+                'name': shader.name,
+                'stage': stage,
+                'entry': shader.entry_point,
+            })
     
     with open(output, 'w') as f:
         json.dump(summary, f, indent=2)
@@ -6,14 +6,40 @@ if PowerShell scripts are unavailable or don't work.
 """
 import sys
 import os
+import re
+import json
+import shutil
+import argparse
+import functools
+import hashlib
 import subprocess
-import platform
 from pathlib import Path
 
+# Interpreter found by a previous run, so re-runs skip the --version probes
+CACHE_DIR = Path(os.path.expanduser("~")) / ".cache" / "renderdoctools"
+PYTHON36_CACHE = CACHE_DIR / "python36.json"
+
+VENV_DIR = Path("venv36")
+
+# Written after a verified install; re-runs with a matching version and
+# packaging metadata skip pip
+INSTALL_MARKER = VENV_DIR / ".rdt_installed"
+
+# Files whose changes need a reinstall (the install is editable, so source
+# changes don't)
+METADATA_FILES = ("setup.py", "pyproject.toml", "requirements.txt")
+
+# os.name is a constant; platform.system() can shell out to uname at import
+IS_WINDOWS = os.name == "nt"
+
+
+# Escape codes only help a terminal; redirected output stays plain text
+IS_TTY = sys.stdout is not None and sys.stdout.isatty()
+
 
 class Colors:
-    """ANSI color codes (disabled on Windows cmd)."""
-    if platform.system() != "Windows" or os.getenv("WT_SESSION"):
+    """ANSI color codes (disabled on Windows cmd and when not writing to a terminal)."""
+    if IS_TTY and (not IS_WINDOWS or os.getenv("WT_SESSION")):
         GREEN = '\033[92m'
         YELLOW = '\033[93m'
         RED = '\033[91m'
@@ -24,93 +50,199 @@ class Colors:
         GREEN = YELLOW = RED = CYAN = RESET = BOLD = ''
 
 
+# Styled fragments built once rather than on every print
+_STATUS_PREFIXES = {
+    "success": f"{Colors.GREEN}✓{Colors.RESET} ",
+    "error": f"{Colors.RED}✗{Colors.RESET} ",
+    "warning": f"{Colors.YELLOW}⚠{Colors.RESET} ",
+}
+_INFO_PREFIX = f"{Colors.CYAN}→{Colors.RESET} "
+_RULE = f"{Colors.CYAN}{Colors.BOLD}{'=' * 60}{Colors.RESET}"
+_HEADER_START = f"\n{_RULE}\n{Colors.CYAN}{Colors.BOLD}"
+_HEADER_END = f"{Colors.RESET}\n{_RULE}\n"
+
+
 def print_status(message, level="info"):
     """Print styled status message."""
-    if level == "success":
-        print(f"{Colors.GREEN}✓{Colors.RESET} {message}")
-    elif level == "error":
-        print(f"{Colors.RED}✗{Colors.RESET} {message}")
-    elif level == "warning":
-        print(f"{Colors.YELLOW}⚠{Colors.RESET} {message}")
-    else:
-        print(f"{Colors.CYAN}→{Colors.RESET} {message}")
+    print(_STATUS_PREFIXES.get(level, _INFO_PREFIX) + message)
 
 
 def print_header(text):
     """Print section header."""
-    print(f"\n{Colors.CYAN}{Colors.BOLD}{'=' * 60}{Colors.RESET}")
-    print(f"{Colors.CYAN}{Colors.BOLD}{text}{Colors.RESET}")
-    print(f"{Colors.CYAN}{Colors.BOLD}{'=' * 60}{Colors.RESET}\n")
+    print(_HEADER_START + text + _HEADER_END)
+
+
+def _run(cmd, **kwargs):
+    """
+    subprocess.run without closing inherited descriptors on POSIX.
+    
+    The installer holds no descriptors worth hiding from its children.
+    close_fds=False skips the loop in the child that closes every inherited
+    descriptor before exec. On CPython 3.8+ it is also one of the
+    preconditions for posix_spawn instead of fork + exec, which further
+    requires an executable path with a directory component, no cwd/env
+    overrides and a supported platform; otherwise fork + exec is still used.
+    """
+    kwargs.setdefault("close_fds", IS_WINDOWS)
+    return subprocess.run(cmd, **kwargs)
+
+
+@functools.lru_cache(maxsize=None)
+def _exists(path):
+    """Cached existence check; call _exists.cache_clear() after changing the venv."""
+    return os.path.exists(path)
+
+
+@functools.lru_cache(maxsize=1)
+def _venv_python():
+    """Path of the venv interpreter for this platform."""
+    if IS_WINDOWS:
+        return VENV_DIR / "Scripts" / "python.exe"
+    return VENV_DIR / "bin" / "python"
+
+
+def _load_cached_python36():
+    """Return the cached interpreter entry if the executable is unchanged."""
+    try:
+        with open(PYTHON36_CACHE, encoding="utf-8") as f:
+            cached = json.load(f)
+        if os.stat(cached["path"]).st_mtime_ns == cached["mtime_ns"]:
+            return cached
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _save_cached_python36(python_exe, version):
+    """Record a found interpreter by absolute path and mtime."""
+    try:
+        path = os.path.abspath(shutil.which(python_exe) or python_exe)
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        PYTHON36_CACHE.write_text(json.dumps({
+            "path": path,
+            "mtime_ns": os.stat(path).st_mtime_ns,
+            "version": version,
+        }))
+    except OSError:
+        pass  # Caching is best-effort
+
+
+def _package_version():
+    """Read __version__ from the source tree without importing the package."""
+    try:
+        text = Path("renderdoc_tools", "__init__.py").read_text(encoding="utf-8")
+    except OSError:
+        return None
+    match = re.search(r'^__version__\s*=\s*["\']([^"\']+)["\']', text, re.M)
+    return match.group(1) if match else None
+
+
+def _metadata_digest():
+    """Hash of the packaging metadata files that are present."""
+    digest = hashlib.blake2b(digest_size=16)
+    for name in METADATA_FILES:
+        try:
+            data = Path(name).read_bytes()
+        except OSError:
+            continue
+        digest.update(name.encode() + b"\0" + data + b"\0")
+    return digest.hexdigest()
+
+
+def _read_install_marker():
+    """(version, metadata digest) recorded by the last verified install, or None."""
+    try:
+        lines = INSTALL_MARKER.read_text(encoding="utf-8").split()
+    except OSError:
+        return None
+    # Markers from older installers hold only the version
+    return tuple(lines) if len(lines) == 2 else None
 
 
+def _write_install_marker(version):
+    """Record a verified install so the next run can skip pip."""
+    try:
+        INSTALL_MARKER.write_text(f"{version}\n{_metadata_digest()}\n", encoding="utf-8")
+    except OSError:
+        pass  # Marker is best-effort
+
+
+@functools.lru_cache(maxsize=1)
 def find_python36():
     """Find Python 3.6 installation."""
+    cached = _load_cached_python36()
+    if cached:
+        print_status(f"Found: {cached['path']} ({cached['version']}, cached)", "success")
+        return cached["path"]
+    
     print_status("Searching for Python 3.6...")
     
     # Common Python 3.6 command names
     candidates = ["python3.6", "python36", "python"]
     
     # Common installation paths (Windows)
-    if platform.system() == "Windows":
+    if IS_WINDOWS:
         candidates.extend([
             Path(os.path.expanduser("~")) / "scoop/apps/python36/current/python.exe",
             Path("C:/Python36/python.exe"),
             Path("C:/Program Files/Python36/python.exe"),
         ])
     
+    probed = set()
     for candidate in candidates:
+        # Resolve with PATH lookups / stat first; only spawn existing executables
+        if isinstance(candidate, str):
+            exe = shutil.which(candidate)
+        else:
+            exe = str(candidate) if candidate.is_file() else None
+        if exe is None or exe in probed:
+            continue
+        probed.add(exe)
+        
         try:
-            # Try as command
-            if isinstance(candidate, str):
-                result = subprocess.run(
-                    [candidate, "--version"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if result.returncode == 0 and "3.6" in result.stdout:
-                    print_status(f"Found: {candidate} ({result.stdout.strip()})", "success")
-                    return candidate
-            # Try as path
-            elif candidate.exists():
-                result = subprocess.run(
-                    [str(candidate), "--version"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if result.returncode == 0 and "3.6" in result.stdout:
-                    print_status(f"Found: {candidate} ({result.stdout.strip()})", "success")
-                    return str(candidate)
-        except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+            result = _run(
+                [exe, "--version"],
+                capture_output=True,
+                text=True,
+                timeout=5
+            )
+        except (subprocess.TimeoutExpired, OSError):
             continue
+        
+        if result.returncode == 0 and "3.6" in result.stdout:
+            version = result.stdout.strip()
+            print_status(f"Found: {candidate} ({version})", "success")
+            _save_cached_python36(exe, version)
+            return candidate if isinstance(candidate, str) else exe
     
     return None
 
 
-def create_venv(python_exe):
-    """Create Python 3.6 virtual environment."""
+def create_venv(python_exe, assume_yes=False):
+    """Create Python 3.6 virtual environment; assume_yes recreates without asking."""
     print_header("Creating Virtual Environment")
     
-    venv_path = Path("venv36")
+    venv_path = VENV_DIR
     
-    if venv_path.exists():
+    if _exists(str(venv_path)):
         print_status(f"Virtual environment already exists: {venv_path}", "warning")
-        response = input(f"{Colors.YELLOW}Recreate? (y/N):{Colors.RESET} ").lower()
-        if response != 'y':
-            return True
+        if not assume_yes:
+            response = input(f"{Colors.YELLOW}Recreate? (y/N):{Colors.RESET} ").lower()
+            if response != 'y':
+                return True
         
         # Remove existing venv
-        import shutil
         shutil.rmtree(venv_path)
+        _exists.cache_clear()
     
     print_status(f"Creating venv36 with {python_exe}...")
     
     try:
-        subprocess.run(
-            [python_exe, "-m", "venv", "venv36"],
+        _run(
+            [python_exe, "-m", "venv", str(VENV_DIR)],
             check=True
         )
+        _exists.cache_clear()
         print_status("Virtual environment created successfully", "success")
         return True
     except subprocess.CalledProcessError as e:
@@ -118,69 +250,87 @@ def create_venv(python_exe):
         return False
 
 
-def install_package():
-    """Install the package in editable mode."""
+# Run by the venv interpreter: upgrade pip, install, then import the package,
+# so the installer starts one child interpreter instead of three
+_INSTALL_SCRIPT = """
+import subprocess, sys
+pip = [sys.executable, "-m", "pip", "install"]
+if subprocess.call(pip + ["--upgrade", "pip"]) != 0:
+    print("RDT_PIP_UPGRADE_FAILED", flush=True)
+if subprocess.call(pip + ["-e", "."]) != 0:
+    sys.exit(2)
+try:
+    import renderdoc_tools
+except ImportError:
+    sys.exit(3)
+print("RDT_VERSION=" + renderdoc_tools.__version__)
+"""
+
+
+def install_package(force=False):
+    """
+    Install the package in editable mode and import it.
+    
+    Skipped when the install marker matches the source version, unless force.
+    Returns (installed, version); version is None if the import failed.
+    """
     print_header("Installing Package")
     
-    # Determine pip path
-    if platform.system() == "Windows":
-        pip_exe = Path("venv36/Scripts/pip.exe")
-        python_exe = Path("venv36/Scripts/python.exe")
-    else:
-        pip_exe = Path("venv36/bin/pip")
-        python_exe = Path("venv36/bin/python")
+    python_exe = _venv_python()
     
-    if not pip_exe.exists():
-        print_status(f"Pip not found: {pip_exe}", "error")
-        return False
+    if not _exists(str(python_exe)):
+        print_status(f"Python not found: {python_exe}", "error")
+        return False, None
     
-    # Upgrade pip first
-    print_status("Upgrading pip...")
-    try:
-        subprocess.run(
-            [str(python_exe), "-m", "pip", "install", "--upgrade", "pip"],
-            check=True
-        )
-    except subprocess.CalledProcessError:
-        print_status("Failed to upgrade pip (continuing anyway)", "warning")
+    if not force:
+        marker = _read_install_marker()
+        if marker is not None and marker == (_package_version(), _metadata_digest()):
+            installed_version = marker[0]
+            print_status(f"renderdoc-tools {installed_version} already installed "
+                         f"(use --force to reinstall)", "success")
+            return True, installed_version
     
-    # Install package
-    print_status("Installing renderdoc-tools...")
+    print_status("Upgrading pip and installing renderdoc-tools...")
+    version = None
     try:
-        subprocess.run(
-            [str(pip_exe), "install", "-e", "."],
-            check=True
+        proc = subprocess.Popen(
+            [str(python_exe), "-c", _INSTALL_SCRIPT],
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+            close_fds=IS_WINDOWS
         )
-        print_status("Package installed successfully", "success")
-        return True
-    except subprocess.CalledProcessError as e:
+    except OSError as e:
         print_status(f"Failed to install package: {e}", "error")
-        return False
+        return False, None
+    
+    # Pass pip's output through, picking out the script's status lines
+    for line in proc.stdout:
+        if line.startswith("RDT_VERSION="):
+            version = line.split("=", 1)[1].strip()
+        elif line.strip() == "RDT_PIP_UPGRADE_FAILED":
+            print_status("Failed to upgrade pip (continuing anyway)", "warning")
+        else:
+            sys.stdout.write(line)
+    returncode = proc.wait()
+    
+    if returncode not in (0, 3):
+        print_status(f"Failed to install package (exit code {returncode})", "error")
+        return False, None
+    
+    print_status("Package installed successfully", "success")
+    return True, version
 
 
-def verify_installation():
-    """Verify the installation."""
+def verify_installation(version):
+    """Report whether the installed package imported."""
     print_header("Verifying Installation")
     
-    # Determine python path
-    if platform.system() == "Windows":
-        python_exe = Path("venv36/Scripts/python.exe")
-    else:
-        python_exe = Path("venv36/bin/python")
-    
-    try:
-        result = subprocess.run(
-            [str(python_exe), "-c", "import renderdoc_tools; print(renderdoc_tools.__version__)"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        version = result.stdout.strip()
-        print_status(f"Package version: {version}", "success")
-        return True
-    except subprocess.CalledProcessError:
+    if version is None:
         print_status("Package verification failed", "error")
         return False
+    
+    print_status(f"Package version: {version}", "success")
+    return True
 
 
 def show_next_steps():
@@ -191,7 +341,7 @@ def show_next_steps():
     
     print(f"{Colors.CYAN}Next steps:{Colors.RESET}\n")
     
-    if platform.system() == "Windows":
+    if IS_WINDOWS:
         print(f"1. Use the wrapper script (recommended):")
         print(f"   {Colors.BOLD}.\\rdc-tools.ps1 workflow capture.rdc --preset quick{Colors.RESET}\n")
         print(f"2. Or activate the virtual environment:")
@@ -208,8 +358,20 @@ def show_next_steps():
     print(f"   {Colors.BOLD}python diagnose.py{Colors.RESET}\n")
 
 
+def parse_args(argv=None):
+    """Parse installer command-line options."""
+    parser = argparse.ArgumentParser(description="Install RenderDocTools into venv36")
+    parser.add_argument('--force', action='store_true',
+                        help='Reinstall even if venv36 already has this version')
+    parser.add_argument('-y', '--yes', action='store_true',
+                        help='Recreate an existing venv36 without prompting')
+    return parser.parse_args(argv)
+
+
 def main():
     """Main installation flow."""
+    args = parse_args()
+    
     print_header("RenderDocTools Installer")
     
     print(f"{Colors.CYAN}This script will:{Colors.RESET}")
@@ -225,21 +387,24 @@ def main():
         print_status("Python 3.6 not found", "error")
         print(f"\n{Colors.YELLOW}Install Python 3.6:{Colors.RESET}")
         print(f"  • Download: https://www.python.org/downloads/release/python-3615/")
-        if platform.system() == "Windows":
+        if IS_WINDOWS:
             print(f"  • Or via Scoop: {Colors.BOLD}scoop bucket add versions; scoop install versions/python36{Colors.RESET}")
         print(f"\nSee INSTALL_PYTHON36.md for detailed instructions.")
         sys.exit(1)
     
     # Step 2: Create venv
-    if not create_venv(python36):
+    if not create_venv(python36, assume_yes=args.yes):
         sys.exit(1)
     
     # Step 3: Install package
-    if not install_package():
+    installed, version = install_package(force=args.force)
+    if not installed:
         sys.exit(1)
     
     # Step 4: Verify
-    if not verify_installation():
+    if verify_installation(version):
+        _write_install_marker(version)
+    else:
         print_status("Verification failed, but package may still work", "warning")
     
     # Show next steps
@@ -5,29 +5,37 @@ Uses the renderdoc_tools package for Quest-specific analysis
 """
 
 import sys
+import io
+import json
+import argparse
+import functools
+from contextlib import redirect_stdout
 from pathlib import Path
 
-from renderdoc_tools.core import CaptureFile
-from renderdoc_tools.analyzers.quest import (
-    QuestPerformanceAnalyzer,
-    MultiviewAnalyzer,
-    FoveationAnalyzer,
-    QuestReportGenerator
-)
+try:
+    import orjson
+except ImportError:  # Optional: pip install renderdoc-tools[fast]
+    orjson = None
+
+from renderdoc_tools.core import CaptureData
+from renderdoc_tools.analyzers.quest import report_generator
 from renderdoc_tools.parser import Parser
 from renderdoc_tools.utils.logging_config import setup_logging
 
 
-def analyze_quest_performance(rdc_path: str):
-    """Extract Quest-specific profiling data"""
-    setup_logging(level="INFO")
-    
-    parser = Parser(include_counters=True)
-    capture_data = parser.parse(Path(rdc_path))
-    
-    analyzer = QuestPerformanceAnalyzer()
-    result = analyzer.analyze(capture_data.dict(by_alias=True))
-    
+@functools.lru_cache(maxsize=1)
+def _load(rdc_path: str) -> CaptureData:
+    """
+    Parse a capture once for all analyses
+    
+    Analyzers read the CaptureData model directly, so the RenderDoc replay
+    happens once per capture and no .dict() copy is made.
+    """
+    return Parser(include_counters=True).parse(Path(rdc_path))
+
+
+def print_quest_performance(result: dict):
+    """Print Quest-specific profiling data"""
     print(f"\n=== Quest Performance Analysis ===")
     if result.get('performance_counters_available'):
         print(f"✓ Performance counters available!")
@@ -42,16 +50,8 @@ def analyze_quest_performance(rdc_path: str):
         print(f"   Note: This feature requires RenderDoc Meta Fork with Quest capture")
 
 
-def analyze_multiview_rendering(rdc_path: str):
-    """Analyze multiview/stereo rendering patterns"""
-    setup_logging(level="INFO")
-    
-    parser = Parser()
-    capture_data = parser.parse(Path(rdc_path))
-    
-    analyzer = MultiviewAnalyzer()
-    result = analyzer.analyze(capture_data.dict(by_alias=True))
-    
+def print_multiview_rendering(result: dict):
+    """Print multiview/stereo rendering patterns"""
     print(f"\n=== Multiview/Stereo Analysis ===")
     multiview_rts = result.get('multiview_render_targets', [])
     print(f"Found {len(multiview_rts)} potential multiview render targets")
@@ -62,16 +62,8 @@ def analyze_multiview_rendering(rdc_path: str):
             print(f"  {rt['name']}: {rt['width']}x{rt['height']} (array={rt['array_size']})")
 
 
-def analyze_foveation(rdc_path: str):
-    """Check for fixed foveated rendering artifacts"""
-    setup_logging(level="INFO")
-    
-    parser = Parser()
-    capture_data = parser.parse(Path(rdc_path))
-    
-    analyzer = FoveationAnalyzer()
-    result = analyzer.analyze(capture_data.dict(by_alias=True))
-    
+def print_foveation(result: dict):
+    """Print fixed foveated rendering check"""
     print(f"\n=== Fixed Foveated Rendering Check ===")
     print(f"Total actions: {result['total_actions']}")
     print(f"Render passes found: {result['summary']['render_pass_count']}")
@@ -82,21 +74,13 @@ def analyze_foveation(rdc_path: str):
         print(f"   Check tile timeline in RenderDoc Meta Fork for confirmation")
 
 
-def quest_optimization_report(rdc_path: str, output: str):
-    """Generate Quest optimization report"""
-    setup_logging(level="INFO")
-    
-    parser = Parser(include_counters=True)
-    capture_data = parser.parse(Path(rdc_path))
-    
-    report_gen = QuestReportGenerator()
-    report_path = report_gen.generate_report_file(
-        capture_data.dict(by_alias=True),
-        Path(output)
-    )
-    
-    report = report_gen.analyze(capture_data.dict(by_alias=True))
-    
+def quest_optimization_report(data: CaptureData, output: str):
+    """Generate Quest optimization report, returning (report_path, report)"""
+    return report_generator.generate_report_file(data, Path(output))
+
+
+def print_optimization_report(report_path: Path, report: dict):
+    """Print Quest optimization report summary"""
     print(f"\n=== Quest Optimization Report ===")
     stats = report.get('statistics', {})
     print(f"Draw calls: {stats.get('draw_calls', 0)}")
@@ -113,26 +97,72 @@ def quest_optimization_report(rdc_path: str, output: str):
     print(f"\n✓ Full report saved to: {report_path}")
 
 
+def write_json(results: dict):
+    """Write all analysis results to stdout as one JSON document"""
+    if orjson is not None:
+        data = orjson.dumps(results, option=orjson.OPT_INDENT_2, default=str)
+    else:
+        data = json.dumps(results, indent=2, default=str).encode('utf-8')
+    sys.stdout.flush()
+    sys.stdout.buffer.write(data + b'\n')
+    sys.stdout.buffer.flush()
+
+
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python quest_analysis.py <quest_capture.rdc>")
-        print("\nThis script analyzes Quest-specific capture data:")
-        print("  - Performance counters (Meta fork)")
-        print("  - Multiview rendering detection")
-        print("  - Fixed foveated rendering check")
-        print("  - Optimization recommendations")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description='Analyze Quest-specific capture data',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+This script analyzes Quest-specific capture data:
+  - Performance counters (Meta fork)
+  - Multiview rendering detection
+  - Fixed foveated rendering check
+  - Optimization recommendations
+"""
+    )
+    parser.add_argument('rdc_path', help='Quest capture (.rdc) to analyze')
+    parser.add_argument(
+        '--format',
+        choices=['text', 'json'],
+        default='text',
+        help='Output format; json writes all results as one document (default: text)'
+    )
+    args = parser.parse_args()
     
-    rdc_path = sys.argv[1]
+    # Logging shares stdout, so keep it quiet when stdout carries JSON
+    setup_logging(level="WARNING" if args.format == 'json' else "INFO")
     
     try:
-        analyze_quest_performance(rdc_path)
-        analyze_multiview_rendering(rdc_path)
-        analyze_foveation(rdc_path)
-        quest_optimization_report(rdc_path, 'quest_report.json')
+        data = _load(args.rdc_path)
+        
+        # The report already runs the performance, multiview and foveation
+        # analyzers, so reuse its results rather than analyzing twice
+        report_path, report_data = quest_optimization_report(data, 'quest_report.json')
+        analysis = report_data['analysis']
+        performance = analysis['performance']
+        multiview = analysis['multiview']
+        foveation = analysis['foveation']
         
-        print("\n✓ Quest analysis complete!")
+        if args.format == 'json':
+            write_json({
+                'performance': performance,
+                'multiview': multiview,
+                'foveation': foveation,
+                'report': report_data,
+                'report_path': str(report_path),
+            })
+            return
         
+        # Collect the text report and write it in one call
+        out = io.StringIO()
+        with redirect_stdout(out):
+            print_quest_performance(performance)
+            print_multiview_rendering(multiview)
+            print_foveation(foveation)
+            print_optimization_report(report_path, report_data)
+            print("\n✓ Quest analysis complete!")
+        sys.stdout.write(out.getvalue())
+    
     except Exception as e:
         print(f"\nERROR: {e}")
         import traceback
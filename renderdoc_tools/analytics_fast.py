@@ -0,0 +1,104 @@
+"""Optional Numba-compiled kernels for analytics over very large captures"""
+
+import logging
+
+try:
+    import numpy as np
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # Optional: pip install renderdoc-tools[jit]
+    NUMBA_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Below this many actions the NumPy path is faster than paying for JIT compilation
+JIT_THRESHOLD = 100_000
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, cache=True)
+    def draw_stats(flags, num_indices, num_instances, drawcall_bit, k):
+        """
+        Scan actions for draw-call totals and the k most expensive draws
+        
+        Cost is num_indices * max(num_instances, 1). Ties keep the earlier
+        action, matching a stable descending sort.
+        
+        Args:
+            flags: Flag bitmask per action
+            num_indices: Index count per action
+            num_instances: Instance count per action
+            drawcall_bit: Bit marking a draw call in flags
+            k: Number of top draws to return
+        
+        Returns:
+            Tuple of (count, total_indices, total_instances, top_costs, top_idx)
+            where top_idx are positions into the input arrays
+        """
+        n = flags.shape[0]
+        cost = np.empty(n, dtype=np.int64)
+        count = 0
+        total_idx = 0
+        total_inst = 0
+        for i in prange(n):
+            if flags[i] & drawcall_bit:
+                ni = np.int64(num_indices[i])
+                nn = np.int64(num_instances[i])
+                count += 1
+                total_idx += ni
+                total_inst += nn
+                cost[i] = ni * max(nn, 1)
+            else:
+                cost[i] = -1
+        
+        # Sequential insertion into a k-slot descending list
+        top_costs = np.full(k, -1, dtype=np.int64)
+        top_idx = np.full(k, -1, dtype=np.int64)
+        for i in range(n):
+            c = cost[i]
+            if c <= top_costs[k - 1]:
+                continue
+            j = k - 1
+            while j > 0 and top_costs[j - 1] < c:
+                top_costs[j] = top_costs[j - 1]
+                top_idx[j] = top_idx[j - 1]
+                j -= 1
+            top_costs[j] = c
+            top_idx[j] = i
+        
+        used = min(count, k)
+        return count, total_idx, total_inst, top_costs[:used], top_idx[:used]
+    
+    @njit(parallel=True, cache=True)
+    def texture_vram(width, height, depth, mips):
+        """
+        Estimate texture memory as the sum of width * height * depth * mips * 4
+        
+        Args:
+            width: Width per texture
+            height: Height per texture
+            depth: Depth per texture
+            mips: Mip count per texture
+        
+        Returns:
+            Estimated bytes
+        """
+        total = 0
+        for i in prange(width.shape[0]):
+            total += (np.int64(width[i]) * np.int64(height[i])
+                      * np.int64(depth[i]) * np.int64(mips[i]))
+        return total * 4
+
+
+def use_jit(n: int) -> bool:
+    """
+    Whether the JIT kernels should be used for n rows
+    
+    Args:
+        n: Number of rows to process
+    
+    Returns:
+        True if Numba is installed and n exceeds JIT_THRESHOLD
+    """
+    return NUMBA_AVAILABLE and n > JIT_THRESHOLD
@@ -1,7 +1,7 @@
 """Base classes for analyzers"""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Sequence
 import logging
 
 logger = logging.getLogger(__name__)
@@ -10,8 +10,13 @@ logger = logging.getLogger(__name__)
 class BaseAnalyzer(ABC):
     """Abstract base class for all analyzers"""
     
-    def __init__(self):
-        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+    logger = logging.getLogger(__name__)
+    
+    def __init_subclass__(cls, **kwargs):
+        # One logger per analyzer class, resolved at class creation rather
+        # than on every instantiation
+        super().__init_subclass__(**kwargs)
+        cls.logger = logging.getLogger(f"{__name__}.{cls.__name__}")
     
     @abstractmethod
     def analyze(self, capture_data: Dict[str, Any], controller=None) -> Dict[str, Any]:
@@ -27,6 +32,65 @@ class BaseAnalyzer(ABC):
         """
         pass
     
+    @staticmethod
+    def _field(capture_data: Any, name: str, alias: Optional[str] = None, default: Any = None) -> Any:
+        """
+        Read a top-level field from a CaptureData model or its dict form
+        
+        Models are read by attribute, with no .dict() copy needed. Dicts are
+        read by field name and then by alias.
+        
+        Args:
+            capture_data: CaptureData model or dictionary
+            name: Field name (snake_case)
+            alias: Optional camelCase alias used in by-alias dicts
+            default: Value returned when the field is missing or None
+            
+        Returns:
+            Field value or default
+        """
+        if isinstance(capture_data, dict):
+            value = capture_data.get(name)
+            if value is None and alias:
+                value = capture_data.get(alias)
+        else:
+            value = getattr(capture_data, name, None)
+        return default if value is None else value
+    
+    @staticmethod
+    def _holds_models(items: Sequence[Any]) -> bool:
+        """
+        Check whether a list holds Pydantic models rather than dicts
+        
+        Only the first item is inspected, so analyzers pick attribute or
+        key access once per list instead of probing every element.
+        
+        Args:
+            items: Actions, resources or counters from capture data
+            
+        Returns:
+            True if items are models, False for dicts or an empty list
+        """
+        return bool(items) and not isinstance(items[0], dict)
+    
+    @staticmethod
+    def _dict_key(sample: Optional[Dict[str, Any]], name: str, alias: str) -> str:
+        """
+        Resolve which spelling of a field a list of dicts uses
+        
+        Checked on one sample so per-item reads are a single lookup instead
+        of a get() with a get() fallback.
+        
+        Args:
+            sample: First dict of the list (or None for an empty list)
+            name: Field name (snake_case)
+            alias: Alias used in by-alias dicts
+            
+        Returns:
+            alias if the sample uses it, otherwise name
+        """
+        return alias if sample is not None and alias in sample else name
+    
     @property
     @abstractmethod
     def name(self) -> str:
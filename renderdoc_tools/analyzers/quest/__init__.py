@@ -5,10 +5,20 @@ from renderdoc_tools.analyzers.quest.multiview import MultiviewAnalyzer
 from renderdoc_tools.analyzers.quest.foveation import FoveationAnalyzer
 from renderdoc_tools.analyzers.quest.report import QuestReportGenerator
 
+# Analyzers hold no per-capture state, so one shared instance of each suffices
+performance_analyzer = QuestPerformanceAnalyzer()
+multiview_analyzer = MultiviewAnalyzer()
+foveation_analyzer = FoveationAnalyzer()
+report_generator = QuestReportGenerator()
+
 __all__ = [
     "QuestPerformanceAnalyzer",
     "MultiviewAnalyzer",
     "FoveationAnalyzer",
     "QuestReportGenerator",
+    "performance_analyzer",
+    "multiview_analyzer",
+    "foveation_analyzer",
+    "report_generator",
 ]
 
@@ -1,11 +1,46 @@
 """Fixed foveated rendering analysis"""
 
-from typing import Dict, Any
-import logging
+from typing import Dict, Any, List
+import re
 
 from renderdoc_tools.analyzers.base import BaseAnalyzer
 
-logger = logging.getLogger(__name__)
+# One scan per name for both spellings ('RenderPass' / 'Renderpass')
+_RENDER_PASS = re.compile(r'Render[Pp]ass')
+
+# Above this many actions, names are scanned as one joined string
+BULK_SCAN_THRESHOLD = 100_000
+
+
+def _render_pass_indices(names: List[str]) -> List[int]:
+    """
+    Positions of names containing a render pass, via one regex scan
+    
+    Names are joined with NUL so the regex engine walks a single contiguous
+    string instead of being called once per name. Match offsets map back to
+    positions by counting delimiters between consecutive matches. Falls back
+    to per-name search if a name contains the delimiter itself.
+    
+    Args:
+        names: Action names
+        
+    Returns:
+        Sorted positions into names
+    """
+    joined = '\0'.join(names)
+    if joined.count('\0') != len(names) - 1:
+        return [i for i, name in enumerate(names) if _RENDER_PASS.search(name)]
+    
+    indices = []
+    index = 0
+    pos = 0
+    for match in _RENDER_PASS.finditer(joined):
+        start = match.start()
+        index += joined.count('\0', pos, start)
+        pos = start
+        if not indices or indices[-1] != index:
+            indices.append(index)
+    return indices
 
 
 class FoveationAnalyzer(BaseAnalyzer):
@@ -18,7 +53,7 @@ class FoveationAnalyzer(BaseAnalyzer):
         Args:
             capture_data: Capture data dictionary or CaptureData model
             controller: Optional RenderDoc controller
-            
+        
         Returns:
             Dictionary with foveation analysis results
         """
@@ -32,23 +67,36 @@ class FoveationAnalyzer(BaseAnalyzer):
         }
         
         # Extract actions
-        actions = capture_data.get('actions', [])
+        actions = self._field(capture_data, 'actions', default=[])
         result['total_actions'] = len(actions)
         
-        # Check for render passes
-        render_passes = []
-        for action in actions:
-            # Handle both dict and Pydantic model
-            if hasattr(action, 'name'):
-                name = action.name
+        # Check for render passes (shape is resolved once, not per action)
+        models = self._holds_models(actions)
+        if len(actions) > BULK_SCAN_THRESHOLD:
+            if models:
+                names = [a.name for a in actions]
+                render_passes = [
+                    {'name': names[i], 'event_id': actions[i].event_id}
+                    for i in _render_pass_indices(names)
+                ]
+            else:
+                names = [a.get('name', '') for a in actions]
+                render_passes = [
+                    {'name': names[i], 'event_id': actions[i].get('eventId', 0)}
+                    for i in _render_pass_indices(names)
+                ]
+        else:
+            if models:
+                rows = ((a.name, a.event_id) for a in actions)
             else:
-                name = action.get('name', '')
+                rows = ((a.get('name', ''), a.get('eventId', 0)) for a in actions)
             
-            if 'RenderPass' in name or 'Renderpass' in name:
-                render_passes.append({
-                    'name': name,
-                    'event_id': action.event_id if hasattr(action, 'event_id') else action.get('eventId', 0)
-                })
+            is_render_pass = _RENDER_PASS.search
+            render_passes = [
+                {'name': name, 'event_id': event_id}
+                for name, event_id in rows
+                if is_render_pass(name)
+            ]
         
         result['render_passes'] = render_passes
         result['multiple_passes_detected'] = len(render_passes) > 1
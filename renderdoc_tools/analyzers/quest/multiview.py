@@ -1,12 +1,9 @@
 """Multiview rendering analysis"""
 
 from typing import Dict, Any, List
-import logging
 
 from renderdoc_tools.analyzers.base import BaseAnalyzer
 
-logger = logging.getLogger(__name__)
-
 
 class MultiviewAnalyzer(BaseAnalyzer):
     """Analyzes multiview/stereo rendering patterns"""
@@ -18,7 +15,7 @@ class MultiviewAnalyzer(BaseAnalyzer):
         Args:
             capture_data: Capture data dictionary or CaptureData model
             controller: Optional RenderDoc controller
-            
+        
         Returns:
             Dictionary with multiview analysis results
         """
@@ -31,38 +28,35 @@ class MultiviewAnalyzer(BaseAnalyzer):
         }
         
         # Extract resources
-        resources = capture_data.get('resources', [])
+        resources = self._field(capture_data, 'resources', default=[])
         
-        # Find multiview render targets (array size 2 typically indicates stereo)
-        multiview_rts = []
-        for res in resources:
-            # Handle both dict and Pydantic model
-            if hasattr(res, 'resource_type'):
-                res_type = res.resource_type
-                texture = res.texture
-            else:
-                res_type = res.get('type', '')
-                texture = res.get('texture')
+        # Resolve dict vs Pydantic model access once, then filter to textures
+        # before reading any texture fields
+        if self._holds_models(resources):
+            textures = [r for r in resources if r.resource_type == 'Texture' and r.texture]
+            stereo = [r for r in textures if r.texture.array_size == 2]
             
-            if res_type == 'Texture' and texture:
-                # Handle both dict and Pydantic model
-                if hasattr(texture, 'array_size'):
-                    array_size = texture.array_size
-                    width = texture.width
-                    height = texture.height
-                else:
-                    array_size = texture.get('arraysize', texture.get('array_size', 0))
-                    width = texture.get('width', 0)
-                    height = texture.get('height', 0)
-                
-                # Quest typically uses array size 2 for stereo
-                if array_size == 2:
-                    multiview_rts.append({
-                        'name': res.name if hasattr(res, 'name') else res.get('name', ''),
-                        'width': width,
-                        'height': height,
-                        'array_size': array_size
-                    })
+            def _make_rt(r):
+                t = r.texture
+                return {'name': r.name, 'width': t.width, 'height': t.height, 'array_size': 2}
+        else:
+            textures = [r for r in resources if r.get('type', '') == 'Texture' and r.get('texture')]
+            size_key = self._dict_key(
+                textures[0]['texture'] if textures else None, 'array_size', 'arraysize'
+            )
+            stereo = [r for r in textures if r['texture'].get(size_key, 0) == 2]
+            
+            def _make_rt(r):
+                t = r['texture']
+                return {
+                    'name': r.get('name', ''),
+                    'width': t.get('width', 0),
+                    'height': t.get('height', 0),
+                    'array_size': 2
+                }
+        
+        # Quest typically uses array size 2 for stereo
+        multiview_rts = [_make_rt(r) for r in stereo]
         
         result['multiview_render_targets'] = multiview_rts
         result['stereo_textures'] = multiview_rts  # Alias for clarity
@@ -1,12 +1,10 @@
 """Quest performance analysis"""
 
+from collections import Counter
 from typing import Dict, Any
-import logging
 
 from renderdoc_tools.analyzers.base import BaseAnalyzer
 
-logger = logging.getLogger(__name__)
-
 
 class QuestPerformanceAnalyzer(BaseAnalyzer):
     """Analyzes Quest-specific performance data"""
@@ -32,33 +30,24 @@ class QuestPerformanceAnalyzer(BaseAnalyzer):
         }
         
         # Extract performance counters from capture data
-        perf_counters = capture_data.get('performance_counters') or capture_data.get('performanceCounters')
+        perf_counters = self._field(capture_data, 'performance_counters', 'performanceCounters')
         
         if perf_counters and perf_counters.get('available'):
             result['performance_counters_available'] = True
             counters = perf_counters.get('counters', [])
             result['counter_count'] = len(counters)
             
-            # Group by category
-            by_category = {}
-            for counter in counters:
-                # Handle both dict and Pydantic model
-                if hasattr(counter, 'category'):
-                    cat = counter.category
-                else:
-                    cat = counter.get('category', 'Unknown')
-                
-                if cat not in by_category:
-                    by_category[cat] = []
-                by_category[cat].append(counter)
+            # Count per category (first-seen order, like the old grouping)
+            if self._holds_models(counters):
+                by_category = Counter(c.category for c in counters)
+            else:
+                by_category = Counter(c.get('category', 'Unknown') for c in counters)
             
-            result['counters_by_category'] = {
-                cat: len(ctrs) for cat, ctrs in by_category.items()
-            }
+            result['counters_by_category'] = dict(by_category)
             
             result['summary'] = {
                 'total_counters': len(counters),
-                'categories': list(by_category.keys())
+                'categories': list(by_category)
             }
         else:
             result['summary'] = {
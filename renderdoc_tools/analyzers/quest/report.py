@@ -1,23 +1,85 @@
 """Quest optimization report generator"""
 
-from typing import Dict, Any, List
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Tuple
 from pathlib import Path
 import json
-import logging
+
+try:
+    import orjson
+except ImportError:  # Optional: pip install renderdoc-tools[fast]
+    orjson = None
 
 from renderdoc_tools.analyzers.base import BaseAnalyzer
 from renderdoc_tools.analyzers.quest.performance import QuestPerformanceAnalyzer
 from renderdoc_tools.analyzers.quest.multiview import MultiviewAnalyzer
 from renderdoc_tools.analyzers.quest.foveation import FoveationAnalyzer
 
-logger = logging.getLogger(__name__)
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    if orjson is not None else 0
+)
+
+
+def _write_report_orjson(f, report: Dict[str, Any]) -> None:
+    """
+    Write a report one top-level section at a time
+    
+    Each section is serialized and written on its own, so only one
+    section's bytes are held at a time rather than the whole document.
+    Output is byte-identical to dumping the report with OPT_INDENT_2.
+    
+    Args:
+        f: Binary file handle
+        report: Report dictionary
+    """
+    if not report:
+        f.write(b'{}')
+        return
+    
+    f.write(b'{\n')
+    for i, (key, value) in enumerate(report.items()):
+        if i:
+            f.write(b',\n')
+        section = orjson.dumps(value, option=_ORJSON_OPTIONS, default=str)
+        # Nest the section one level deeper
+        f.write(b'  ' + orjson.dumps(key, default=str) + b': ' + section.replace(b'\n', b'\n  '))
+    f.write(b'\n}')
+
+
+def _write_report(output_path: Path, report: Dict[str, Any]) -> None:
+    """Write a report as indented JSON, with orjson when available"""
+    # Paths and other non-JSON values are written as strings either way
+    if orjson is not None:
+        with open(output_path, 'wb', buffering=1 << 20) as f:
+            _write_report_orjson(f, report)
+    else:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, default=str)
 
 
 class QuestReportGenerator(BaseAnalyzer):
     """Generates comprehensive Quest optimization reports"""
     
-    def __init__(self):
+    # Recommendation thresholds
+    DRAW_CALL_HIGH = 500
+    VRAM_HIGH_MB = 500
+    LARGE_TEX_PIXELS = 2048 * 2048
+    
+    def __init__(self, parallel: bool = False):
+        """
+        Initialize report generator
+        
+        Args:
+            parallel: Run the sub-analyzers on threads when no controller is
+                passed (RenderDoc controllers are not thread-safe). Off by
+                default: the analyzers are pure Python and hold the GIL, so
+                this only pays off on a free-threaded interpreter
+        """
         super().__init__()
+        self.parallel = parallel
         self.performance_analyzer = QuestPerformanceAnalyzer()
         self.multiview_analyzer = MultiviewAnalyzer()
         self.foveation_analyzer = FoveationAnalyzer()
@@ -29,110 +91,106 @@ class QuestReportGenerator(BaseAnalyzer):
         Args:
             capture_data: Capture data dictionary or CaptureData model
             controller: Optional RenderDoc controller
-            
+        
         Returns:
             Dictionary with optimization report
         """
         self.logger.info("Generating Quest optimization report...")
         
-        # Run all Quest analyzers
-        perf_analysis = self.performance_analyzer.analyze(capture_data, controller)
-        multiview_analysis = self.multiview_analyzer.analyze(capture_data, controller)
-        foveation_analysis = self.foveation_analyzer.analyze(capture_data, controller)
+        # Run all Quest analyzers. They only read capture_data, so they may
+        # share a thread pool when asked to, but never with a controller
+        analyzers = (self.performance_analyzer, self.multiview_analyzer, self.foveation_analyzer)
+        if self.parallel and controller is None:
+            with ThreadPoolExecutor(max_workers=len(analyzers)) as executor:
+                futures = [executor.submit(a.analyze, capture_data, controller) for a in analyzers]
+            perf_analysis, multiview_analysis, foveation_analysis = (f.result() for f in futures)
+        else:
+            perf_analysis, multiview_analysis, foveation_analysis = (
+                a.analyze(capture_data, controller) for a in analyzers
+            )
         
         # Extract statistics
-        actions = capture_data.get('actions', [])
-        resources = capture_data.get('resources', [])
-        
-        # Count draw calls
-        draw_calls = []
-        for action in actions:
-            if hasattr(action, 'flags'):
-                flags = action.flags
-            else:
-                flags = action.get('flags', '')
-            
-            if 'Drawcall' in str(flags):
-                draw_calls.append(action)
-        
-        # Count textures and estimate VRAM
-        textures = []
-        total_mem = 0
-        for res in resources:
-            if hasattr(res, 'resource_type'):
-                res_type = res.resource_type
-                texture = res.texture
-            else:
-                res_type = res.get('type', '')
-                texture = res.get('texture')
-            
-            if res_type == 'Texture' and texture:
-                textures.append(res)
-                
-                # Estimate memory
-                if hasattr(texture, 'width'):
-                    w, h, d, mips = texture.width, texture.height, texture.depth, texture.mips
-                else:
-                    w = texture.get('width', 0)
-                    h = texture.get('height', 0)
-                    d = texture.get('depth', 1)
-                    mips = texture.get('mips', 1)
-                
-                # Rough estimate: w * h * d * mips * 4 bytes
-                mem = w * h * d * mips * 4
-                total_mem += mem
-        
+        actions = self._field(capture_data, 'actions', default=[])
+        resources = self._field(capture_data, 'resources', default=[])
+        
+        # Resolve dict vs Pydantic model access once per list
+        if self._holds_models(actions):
+            flags = (a.flags for a in actions)
+        else:
+            flags = (a.get('flags', '') for a in actions)
+        # Captures repeat a handful of flag values; Counter tallies them in C,
+        # then each distinct value is stringified and tested once
+        draw_call_count = sum(
+            n for f, n in Counter(flags).items() if 'Drawcall' in str(f)
+        )
+        
+        # Texture dimensions as (width, height, depth, mips)
+        if not resources:
+            textures = ()
+        elif self._holds_models(resources):
+            textures = (
+                (t.width, t.height, t.depth, t.mips)
+                for t in (r.texture for r in resources if r.resource_type == 'Texture')
+                if t
+            )
+        else:
+            textures = (
+                (t.get('width', 0), t.get('height', 0), t.get('depth', 1), t.get('mips', 1))
+                for t in (r.get('texture') for r in resources if r.get('type', '') == 'Texture')
+                if t
+            )
+        
+        # One pass for texture count, memory and large-texture count
+        # Rough estimate: w * h * d * mips * 4 bytes
+        large_tex_pixels = self.LARGE_TEX_PIXELS
+        texture_count = 0
+        total_texels = 0
+        large_textures = 0
+        for w, h, d, mips in textures:
+            texture_count += 1
+            area = w * h
+            total_texels += area * d * mips
+            if area > large_tex_pixels:
+                large_textures += 1
+        # Integer sum throughout; bytes per texel and MB conversion applied once
+        total_mem = total_texels * 4
         estimated_vram_mb = round(total_mem / (1024 * 1024), 2)
         
-        # Generate recommendations
-        recommendations = []
-        
-        if len(draw_calls) > 500:
-            recommendations.append({
+        # Generate recommendations: one candidate per rule, built only when
+        # its condition holds
+        candidates = (
+            {
                 'priority': 'HIGH',
                 'issue': 'High draw call count',
-                'detail': f'{len(draw_calls)} draw calls detected',
+                'detail': f'{draw_call_count} draw calls detected',
                 'suggestion': 'Consider GPU instancing or mesh merging'
-            })
-        
-        if estimated_vram_mb > 500:
-            recommendations.append({
+            } if draw_call_count > self.DRAW_CALL_HIGH else None,
+            {
                 'priority': 'MEDIUM',
                 'issue': 'High VRAM usage',
                 'detail': f'~{estimated_vram_mb} MB estimated',
                 'suggestion': 'Check texture compression (use ASTC) and mipmap usage'
-            })
-        
-        # Check for large textures
-        large_textures = []
-        for tex_res in textures:
-            if hasattr(tex_res, 'texture'):
-                tex = tex_res.texture
-                w = tex.width
-                h = tex.height
-            else:
-                tex = tex_res.get('texture', {})
-                w = tex.get('width', 0)
-                h = tex.get('height', 0)
-            
-            if w * h > 2048 * 2048:
-                large_textures.append(tex_res)
-        
-        if large_textures:
-            recommendations.append({
+            } if estimated_vram_mb > self.VRAM_HIGH_MB else None,
+            {
                 'priority': 'MEDIUM',
                 'issue': 'Large textures detected',
-                'detail': f'{len(large_textures)} textures larger than 2048x2048',
+                'detail': f'{large_textures} textures larger than 2048x2048',
                 'suggestion': 'Reduce texture resolution for Quest hardware'
-            })
+            } if large_textures else None,
+        )
+        recommendations = [rec for rec in candidates if rec is not None]
+        
+        capture_info = self._field(capture_data, 'capture_info', 'captureInfo', {})
+        if not isinstance(capture_info, dict):
+            capture_info = capture_info.dict(by_alias=True)
         
         # Build report
         report = {
-            'capture_info': capture_data.get('capture_info') or capture_data.get('captureInfo', {}),
+            'capture_info': capture_info,
             'statistics': {
                 'total_actions': len(actions),
-                'draw_calls': len(draw_calls),
-                'total_textures': len(textures),
+                'draw_calls': draw_call_count,
+                'total_textures': texture_count,
                 'estimated_vram_mb': estimated_vram_mb
             },
             'analysis': {
@@ -150,7 +208,7 @@ class QuestReportGenerator(BaseAnalyzer):
         capture_data: Dict[str, Any],
         output_path: Path,
         controller=None
-    ) -> Path:
+    ) -> Tuple[Path, Dict[str, Any]]:
         """
         Generate report and save to file
         
@@ -158,20 +216,25 @@ class QuestReportGenerator(BaseAnalyzer):
             capture_data: Capture data dictionary or CaptureData model
             output_path: Output file path
             controller: Optional RenderDoc controller
-            
+        
         Returns:
-            Path to generated report file
+            Tuple of (path to generated report file, report dictionary)
         """
         report = self.analyze(capture_data, controller)
         
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        if not isinstance(output_path, Path):
+            output_path = Path(output_path)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2)
+        # Create the directory only if the first write finds it missing, so
+        # repeat reports into an existing directory skip the mkdir
+        try:
+            _write_report(output_path, report)
+        except FileNotFoundError:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            _write_report(output_path, report)
         
         self.logger.info(f"Quest optimization report saved to: {output_path}")
-        return output_path
+        return output_path, report
     
     @property
     def name(self) -> str:
@@ -1,13 +1,17 @@
 """Parse CLI command"""
 
+import os
 import sys
 import argparse
+import logging
 from pathlib import Path
 
 from renderdoc_tools.parser import Parser
 from renderdoc_tools.exporters import JSONExporter, CSVExporter
 from renderdoc_tools.utils.logging_config import setup_logging
 
+logger = logging.getLogger(__name__)
+
 
 def parse_command(args):
     """Execute parse command"""
@@ -18,6 +22,7 @@ def parse_command(args):
     parser.add_argument('--resources', help='Export resources to CSV')
     parser.add_argument('--pipeline', action='store_true', help='Include pipeline state')
     parser.add_argument('--counters', action='store_true', help='Include performance counters')
+    parser.add_argument('--cache', action='store_true', help='Reuse cached results for unchanged captures')
     parser.add_argument('--log-level', default='INFO', help='Logging level')
     
     parsed_args = parser.parse_args(args)
@@ -25,9 +30,13 @@ def parse_command(args):
     setup_logging(level=parsed_args.log_level)
     
     rdc_path = Path(parsed_args.rdc_file)
-    if not rdc_path.exists():
+    # One stat both checks the file and gives its size for the log
+    try:
+        rdc_size = os.stat(rdc_path).st_size
+    except FileNotFoundError:
         print(f"ERROR: File not found: {rdc_path}")
         sys.exit(1)
+    logger.info(f"Capture file: {rdc_path} ({rdc_size / (1024 * 1024):.1f} MB)")
     
     if not any([parsed_args.output, parsed_args.actions, parsed_args.resources]):
         print("ERROR: Specify at least one output option (-o, --actions, or --resources)")
@@ -37,7 +46,8 @@ def parse_command(args):
     try:
         parser = Parser(
             include_pipeline=parsed_args.pipeline,
-            include_counters=parsed_args.counters
+            include_counters=parsed_args.counters,
+            use_cache=parsed_args.cache
         )
         capture_data = parser.parse(rdc_path)
         
@@ -53,27 +63,21 @@ def parse_command(args):
             
             if parsed_args.actions:
                 # Export just actions
-                from renderdoc_tools.core.models import CaptureData
-                actions_only = CaptureData(
-                    capture_info=capture_data.capture_info,
-                    actions=capture_data.actions
-                )
-                csv_exporter.export(actions_only, base_path)
+                csv_exporter.export_actions(capture_data.actions, base_path)
             
             if parsed_args.resources:
                 # Export just resources
-                from renderdoc_tools.core.models import CaptureData
-                resources_only = CaptureData(
-                    capture_info=capture_data.capture_info,
-                    resources=capture_data.resources
-                )
-                csv_exporter.export(resources_only, Path(parsed_args.resources))
+                csv_exporter.export_resources(capture_data.resources, Path(parsed_args.resources))
         
         print("\n✓ Parsing complete!")
         
     except Exception as e:
-        print(f"\n✗ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        print(f"\n✗ Error: {type(e).__name__}: {e}")
+        # Full tracebacks only when debugging; formatting one reads source files
+        if parsed_args.log_level.upper() == 'DEBUG':
+            import traceback
+            traceback.print_exc()
+        else:
+            print("  (rerun with --log-level DEBUG for the full traceback)")
         sys.exit(1)
 
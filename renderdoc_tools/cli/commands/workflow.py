@@ -1,15 +1,21 @@
 """Workflow CLI command"""
 
+import os
 import sys
 import argparse
+import logging
+import functools
 from pathlib import Path
 
 from renderdoc_tools.workflows import WorkflowRunner, get_preset, list_presets
 from renderdoc_tools.utils.logging_config import setup_logging
 
+logger = logging.getLogger(__name__)
 
-def workflow_command(args):
-    """Execute workflow command"""
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the workflow argument parser once per process"""
     parser = argparse.ArgumentParser(description='Run workflow preset on RDC file')
     parser.add_argument('rdc_file', nargs='?', help='Path to RDC capture file')
     
@@ -31,8 +37,13 @@ def workflow_command(args):
     parser.add_argument('--output-dir', '-o', help='Output directory')
     parser.add_argument('--list-presets', action='store_true', help='List all presets')
     parser.add_argument('--log-level', default='INFO', help='Logging level')
-
     
+    return parser
+
+
+def workflow_command(args):
+    """Execute workflow command"""
+    parser = _build_parser()
     parsed_args = parser.parse_args(args)
     
     if parsed_args.list_presets:
@@ -50,9 +61,13 @@ def workflow_command(args):
     setup_logging(level=parsed_args.log_level)
     
     rdc_path = Path(parsed_args.rdc_file)
-    if not rdc_path.exists():
+    # One stat both checks the file and gives its size for the log
+    try:
+        rdc_size = os.stat(rdc_path).st_size
+    except FileNotFoundError:
         print(f"ERROR: File not found: {rdc_path}")
         sys.exit(1)
+    logger.info(f"Capture file: {rdc_path} ({rdc_size / (1024 * 1024):.1f} MB)")
     
     output_dir = Path(parsed_args.output_dir) if parsed_args.output_dir else None
     
@@ -71,8 +86,12 @@ def workflow_command(args):
         print(f"  Shaders: {len(capture_data.shaders)}")
         
     except Exception as e:
-        print(f"\n✗ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        print(f"\n✗ Error: {type(e).__name__}: {e}")
+        # Full tracebacks only when debugging; formatting one reads source files
+        if parsed_args.log_level.upper() == 'DEBUG':
+            import traceback
+            traceback.print_exc()
+        else:
+            print("  (rerun with --log-level DEBUG for the full traceback)")
         sys.exit(1)
 
@@ -5,15 +5,25 @@ This ensures rdc-tools always runs with the correct Python environment
 
 import sys
 import os
+import functools
 from pathlib import Path
 
+# Project root (where setup.py/pyproject.toml is); this script is in
+# renderdoc_tools/cli/, so go up 2 levels
+PROJECT_ROOT = Path(__file__).parent.parent.parent
 
+
+def _running_in_venv36() -> bool:
+    """Whether the current interpreter already belongs to venv36"""
+    # sys.prefix is the venv directory inside a venv, even when the venv's
+    # python is a symlink to the base interpreter
+    return Path(sys.prefix).resolve() == (PROJECT_ROOT / "venv36").resolve()
+
+
+@functools.lru_cache(maxsize=1)
 def find_venv36_python():
     """Find Python executable in venv36"""
-    # Get the project root (where setup.py/pyproject.toml is)
-    # This script is in renderdoc_tools/cli/, so go up 2 levels
-    project_root = Path(__file__).parent.parent.parent
-    venv36_python = project_root / "venv36"
+    venv36_python = PROJECT_ROOT / "venv36"
     
     if sys.platform == "win32":
         python_exe = venv36_python / "Scripts" / "python.exe"
@@ -28,18 +38,30 @@ def find_venv36_python():
 
 def main():
     """Main entry point that uses venv36 Python"""
+    # Already inside venv36: run the CLI here instead of starting another
+    # interpreter
+    if _running_in_venv36():
+        from renderdoc_tools.cli.main import main as cli_main
+        sys.exit(cli_main())
+    
     # Try to find venv36 Python
     venv36_python = find_venv36_python()
     
     if venv36_python:
-        # Use venv36 Python to run the actual CLI
-        import subprocess
-        
         # Build command: python -m renderdoc_tools.cli.main <args>
         cmd = [venv36_python, "-m", "renderdoc_tools.cli.main"] + sys.argv[1:]
         
-        # Run with venv36 Python
-        sys.exit(subprocess.call(cmd))
+        if sys.platform == "win32":
+            # Windows exec spawns a new process and returns immediately, which
+            # detaches the CLI from the console; wait for a child instead
+            import subprocess
+            sys.exit(subprocess.call(cmd))
+        
+        # Replace this process with venv36 Python (no second interpreter
+        # left waiting on the child)
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.execv(venv36_python, cmd)
     else:
         # Fallback: try to run normally (might work if installed in current Python)
         # But warn the user
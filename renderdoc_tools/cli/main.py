@@ -1,32 +1,49 @@
 """Main CLI entry point"""
 
 import sys
-from pathlib import Path
+import importlib
+
+# Command name -> "module:function"; only the selected module is imported
+COMMANDS = {
+    'workflow': 'renderdoc_tools.cli.commands.workflow:workflow_command',
+    'parse': 'renderdoc_tools.cli.commands.parse:parse_command',
+}
+
 
 # Simple CLI implementation - can be enhanced with Click/Typer later
-def main():
-    """Main CLI entry point"""
-    if len(sys.argv) < 2:
+def main(argv=None) -> int:
+    """
+    Main CLI entry point
+    
+    Args:
+        argv: Arguments after the program name (defaults to sys.argv[1:])
+    
+    Returns:
+        Process exit code
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    if not argv:
         print("RenderDoc Tools CLI")
         print("\nUsage:")
         print("  rdc-tools workflow <file.rdc> --preset <preset>")
         print("  rdc-tools parse <file.rdc> -o <output.json>")
         print("\nPresets: quick, full, quest, csv-only, performance")
-        sys.exit(1)
+        return 1
     
-    command = sys.argv[1]
+    command = argv[0]
+    spec = COMMANDS.get(command)
     
-    if command == "workflow":
-        from renderdoc_tools.cli.commands.workflow import workflow_command
-        workflow_command(sys.argv[2:])
-    elif command == "parse":
-        from renderdoc_tools.cli.commands.parse import parse_command
-        parse_command(sys.argv[2:])
-    else:
+    if spec is None:
         print(f"Unknown command: {command}")
-        sys.exit(1)
+        return 1
+    
+    module_name, func_name = spec.split(':')
+    handler = getattr(importlib.import_module(module_name), func_name)
+    handler(argv[1:])
+    return 0
 
 
 if __name__ == '__main__':
-    main()
-
+    sys.exit(main())
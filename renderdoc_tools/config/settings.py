@@ -1,53 +1,88 @@
 """Application settings"""
 
-from pydantic import BaseSettings, Field
+import os
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
+try:
+    from dotenv import dotenv_values
+except ImportError:  # Optional: .env files are read only if python-dotenv is installed
+    dotenv_values = None
 
-class Settings(BaseSettings):
+
+def _env_values(env_file: str = ".env") -> Dict[str, str]:
+    """
+    Collect environment values, with the process environment taking
+    precedence over the .env file
+    
+    Names are upper-cased so lookups are case-insensitive.
+    
+    Args:
+        env_file: Path of the optional .env file
+    
+    Returns:
+        Dictionary of upper-cased variable names to values
+    """
+    values = {}
+    if dotenv_values is not None and os.path.isfile(env_file):
+        for key, value in dotenv_values(env_file, encoding="utf-8").items():
+            if value is not None:
+                values[key.upper()] = value
+    for key, value in os.environ.items():
+        values[key.upper()] = value
+    return values
+
+
+@dataclass(frozen=True)
+class Settings:
     """Application settings"""
     
     # RenderDoc paths
-    renderdoc_path: Optional[Path] = Field(
-        None,
-        env="RENDERDOC_PATH",
-        description="Path to RenderDoc installation"
-    )
+    renderdoc_path: Optional[Path] = None  # RENDERDOC_PATH: Path to RenderDoc installation
     
     # Output settings
-    output_dir: Path = Field(
-        Path("./rdc_output"),
-        env="RDC_OUTPUT_DIR",
-        description="Default output directory"
-    )
+    output_dir: Path = Path("./rdc_output")  # RDC_OUTPUT_DIR: Default output directory
     
     # Logging settings
-    log_level: str = Field(
-        "INFO",
-        env="LOG_LEVEL",
-        description="Logging level"
-    )
-    
-    log_format: str = Field(
-        "text",
-        env="LOG_FORMAT",
-        description="Log format (text or json)"
-    )
+    log_level: str = "INFO"  # LOG_LEVEL: Logging level
+    log_format: str = "text"  # LOG_FORMAT: Log format (text or json)
     
     # Performance settings
-    max_memory_mb: int = Field(
-        4096,
-        env="MAX_MEMORY_MB",
-        description="Maximum memory usage in MB"
-    )
+    max_memory_mb: int = 4096  # MAX_MEMORY_MB: Maximum memory usage in MB
+    cache_dir: Path = Path.home() / ".cache" / "renderdoc_tools"  # RDC_CACHE_DIR: Parse cache directory
     
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
+    @classmethod
+    def from_env(cls, env_file: str = ".env") -> "Settings":
+        """
+        Build settings from environment variables and an optional .env file
+        
+        Args:
+            env_file: Path of the .env file (used if present)
+        
+        Returns:
+            Settings instance
+        
+        Raises:
+            ValueError: If MAX_MEMORY_MB is not an integer
+        """
+        env = _env_values(env_file)
+        defaults = cls()
+        
+        renderdoc_path = env.get("RENDERDOC_PATH")
+        output_dir = env.get("RDC_OUTPUT_DIR")
+        max_memory_mb = env.get("MAX_MEMORY_MB")
+        cache_dir = env.get("RDC_CACHE_DIR")
+        
+        return cls(
+            renderdoc_path=Path(renderdoc_path) if renderdoc_path else None,
+            output_dir=Path(output_dir) if output_dir else defaults.output_dir,
+            log_level=env.get("LOG_LEVEL", defaults.log_level),
+            log_format=env.get("LOG_FORMAT", defaults.log_format),
+            max_memory_mb=int(max_memory_mb) if max_memory_mb else defaults.max_memory_mb,
+            cache_dir=Path(cache_dir) if cache_dir else defaults.cache_dir,
+        )
 
 
 # Global settings instance
-settings = Settings()
-
+settings = Settings.from_env()
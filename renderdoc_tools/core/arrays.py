@@ -0,0 +1,156 @@
+"""Struct-of-arrays NumPy views over capture data"""
+
+from typing import Dict, Iterable
+
+from renderdoc_tools.core.models import Action, Resource
+
+try:
+    import numpy as np
+except ImportError:  # Optional: pip install renderdoc-tools[analysis]
+    np = None
+
+
+# Bitmask for the RenderDoc ActionFlags names we care about in analysis.
+# Flags are stored as strings on Action (e.g. "ActionFlags.Drawcall|Indexed")
+# so they are folded into these bits once per distinct string.
+DRAWCALL = 1 << 0
+DISPATCH = 1 << 1
+CLEAR = 1 << 2
+COPY = 1 << 3
+INDEXED = 1 << 4
+INSTANCED = 1 << 5
+PRESENT = 1 << 6
+PASS_BOUNDARY = 1 << 7
+
+ACTION_FLAG_BITS = {
+    'Drawcall': DRAWCALL,
+    'Dispatch': DISPATCH,
+    'Clear': CLEAR,
+    'Copy': COPY,
+    'Indexed': INDEXED,
+    'Instanced': INSTANCED,
+    'Present': PRESENT,
+    'PassBoundary': PASS_BOUNDARY,
+}
+
+if np is not None:
+    ACTION_DTYPE = np.dtype([
+        ('event_id', '<u4'),
+        ('flags', '<u4'),
+        ('num_indices', '<u4'),
+        ('num_instances', '<u4'),
+    ])
+    TEXTURE_DTYPE = np.dtype([
+        ('index', '<u4'),  # Position in the source resource list
+        ('width', '<u4'),
+        ('height', '<u4'),
+        ('depth', '<u4'),
+        ('mips', '<u4'),
+        ('array_size', '<u4'),
+    ])
+else:
+    ACTION_DTYPE = None
+    TEXTURE_DTYPE = None
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError(
+            "NumPy is required for array views. "
+            "Install with: pip install renderdoc-tools[analysis]"
+        )
+
+
+def flag_mask(flags: str) -> int:
+    """
+    Fold an action flags string into an ACTION_FLAG_BITS bitmask
+    
+    Args:
+        flags: Flags string as stored on Action
+    
+    Returns:
+        Integer bitmask
+    """
+    mask = 0
+    for name, bit in ACTION_FLAG_BITS.items():
+        if name in flags:
+            mask |= bit
+    return mask
+
+
+def actions_to_array(actions: Iterable[Action]) -> "np.ndarray":
+    """
+    Convert actions to a structured array with ACTION_DTYPE
+    
+    Missing draw counts are stored as 0.
+    
+    Args:
+        actions: Action models
+    
+    Returns:
+        Structured NumPy array, one row per action
+    
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    _require_numpy()
+    masks: Dict[str, int] = {}
+    rows = []
+    for a in actions:
+        mask = masks.get(a.flags)
+        if mask is None:
+            mask = masks[a.flags] = flag_mask(a.flags)
+        rows.append((a.event_id, mask, a.num_indices or 0, a.num_instances or 0))
+    return np.array(rows, dtype=ACTION_DTYPE)
+
+
+def textures_to_array(resources: Iterable[Resource]) -> "np.ndarray":
+    """
+    Convert texture resources to a structured array with TEXTURE_DTYPE
+    
+    Only resources of type 'Texture' with texture info are included; the
+    'index' field maps each row back to its position in ``resources``.
+    
+    Args:
+        resources: Resource models
+    
+    Returns:
+        Structured NumPy array, one row per texture
+    
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    _require_numpy()
+    rows = []
+    for i, r in enumerate(resources):
+        t = r.texture
+        if r.resource_type == 'Texture' and t:
+            rows.append((i, t.width, t.height, t.depth, t.mips, t.array_size))
+    return np.array(rows, dtype=TEXTURE_DTYPE)
+
+
+def top_k_indices(values: "np.ndarray", k: int) -> "np.ndarray":
+    """
+    Indices of the k largest values, largest first
+    
+    Uses np.partition for O(N) selection, then sorts only the candidates
+    at or above the k-th value. Ties keep input order, matching
+    ``sorted(..., reverse=True)[:k]``.
+    
+    Args:
+        values: 1-D numeric array
+        k: Number of indices to return
+    
+    Returns:
+        Integer index array of length min(k, len(values))
+    
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    _require_numpy()
+    k = min(k, len(values))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    kth = np.partition(values, len(values) - k)[len(values) - k]
+    candidates = np.flatnonzero(values >= kth)
+    return candidates[np.argsort(-values[candidates], kind='stable')[:k]]
@@ -0,0 +1,111 @@
+"""On-disk cache of parsed capture data"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Optional
+
+try:
+    import orjson
+except ImportError:  # Optional: pip install renderdoc-tools[fast]
+    orjson = None
+
+from renderdoc_tools.core.models import CaptureData, dump_model
+
+logger = logging.getLogger(__name__)
+
+# Read size for hashing capture files
+_HASH_CHUNK = 1 << 20
+
+
+def capture_digest(rdc_path: Path) -> str:
+    """
+    SHA-256 of a capture file's contents
+    
+    Args:
+        rdc_path: Path to RDC capture file
+    
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(rdc_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_path(cache_dir: Path, rdc_path: Path, variant: str) -> Path:
+    """
+    Cache file for a capture
+    
+    Args:
+        cache_dir: Cache directory
+        rdc_path: Path to RDC capture file
+        variant: Tag for everything besides the file that shapes the parsed
+            data (package version, enabled extractors)
+    
+    Returns:
+        Path of the cache entry (which may not exist yet)
+    """
+    return Path(cache_dir) / f"{capture_digest(rdc_path)}-{variant}.json"
+
+
+def load_cached(path: Path) -> Optional[CaptureData]:
+    """
+    Load capture data from a cache entry
+    
+    Args:
+        path: Cache entry path
+    
+    Returns:
+        CaptureData, or None if the entry is missing or unreadable
+    """
+    try:
+        raw = Path(path).read_bytes()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning(f"Could not read parse cache {path}: {e}")
+        return None
+    
+    try:
+        if hasattr(CaptureData, 'model_validate_json'):
+            return CaptureData.model_validate_json(raw)
+        return CaptureData.parse_raw(raw)
+    except Exception as e:
+        logger.warning(f"Ignoring invalid parse cache {path}: {e}")
+        return None
+
+
+def store_cached(path: Path, capture_data: CaptureData) -> None:
+    """
+    Write capture data to a cache entry
+    
+    The entry is written to a temporary file and renamed into place, so
+    an interrupted write never leaves a truncated entry. Failures are
+    logged, not raised: the cache is only an optimization.
+    
+    Args:
+        path: Cache entry path
+        capture_data: Parsed capture data
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = dump_model(capture_data)
+        if orjson is not None:
+            tmp_path.write_bytes(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.warning(f"Could not write parse cache {path}: {e}")
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
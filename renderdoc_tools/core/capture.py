@@ -2,7 +2,9 @@
 
 from pathlib import Path
 from typing import Optional
+import atexit
 import logging
+import threading
 
 from renderdoc_tools.utils.renderdoc_loader import get_renderdoc_module
 from renderdoc_tools.core.exceptions import (
@@ -14,6 +16,52 @@ from renderdoc_tools.core.exceptions import (
 logger = logging.getLogger(__name__)
 
 
+class _ReplayGlobal:
+    """
+    Process-wide RenderDoc replay initialisation
+    
+    InitialiseReplay loads the driver and replayer, so it runs once per
+    process rather than once per capture. Open captures hold a reference;
+    ShutdownReplay runs at interpreter exit (or on an explicit shutdown())
+    once no capture is open.
+    """
+    
+    _lock = threading.Lock()
+    _rd = None
+    _refs = 0
+    _atexit_registered = False
+    
+    @classmethod
+    def acquire(cls, rd) -> None:
+        """Initialise replay on first use and take a reference"""
+        with cls._lock:
+            if cls._rd is None:
+                rd.InitialiseReplay(rd.GlobalEnvironment(), [])
+                cls._rd = rd
+                if not cls._atexit_registered:
+                    atexit.register(cls.shutdown)
+                    cls._atexit_registered = True
+            cls._refs += 1
+    
+    @classmethod
+    def release(cls) -> None:
+        """Drop a reference; replay stays initialised for the next capture"""
+        with cls._lock:
+            cls._refs = max(cls._refs - 1, 0)
+    
+    @classmethod
+    def shutdown(cls) -> None:
+        """Shut replay down if it is initialised and no capture is open"""
+        with cls._lock:
+            if cls._rd is None or cls._refs:
+                return
+            rd, cls._rd = cls._rd, None
+        try:
+            rd.ShutdownReplay()
+        except Exception as e:
+            logger.warning(f"Error shutting down replay: {e}")
+
+
 class CaptureFile:
     """Context manager for RenderDoc capture files"""
     
@@ -34,6 +82,7 @@ class CaptureFile:
         self.cap = None
         self.controller = None
         self._rd = None
+        self._replay_acquired = False
     
     def __enter__(self):
         """Open capture file and initialize replay"""
@@ -41,8 +90,9 @@ class CaptureFile:
             # Load RenderDoc module
             self._rd = get_renderdoc_module()
             
-            # Initialize replay
-            self._rd.InitialiseReplay(self._rd.GlobalEnvironment(), [])
+            # Initialize replay (shared by every capture in this process)
+            _ReplayGlobal.acquire(self._rd)
+            self._replay_acquired = True
             
             # Open capture file
             self.cap = self._rd.OpenCaptureFile()
@@ -66,8 +116,11 @@ class CaptureFile:
         except RenderDocNotFoundError:
             raise
         except (CaptureOpenError, CaptureReplayError):
+            # __exit__ is not called when __enter__ raises
+            self.__exit__(None, None, None)
             raise
         except Exception as e:
+            self.__exit__(None, None, None)
             logger.error(f"Failed to open capture: {e}")
             raise CaptureOpenError(f"Failed to open capture: {e}") from e
     
@@ -78,11 +131,12 @@ class CaptureFile:
                 self.controller.Shutdown()
             if self.cap:
                 self.cap.Shutdown()
-            if self._rd:
-                self._rd.ShutdownReplay()
         except Exception as e:
             logger.warning(f"Error during cleanup: {e}")
         finally:
+            if self._replay_acquired:
+                _ReplayGlobal.release()
+                self._replay_acquired = False
             self.controller = None
             self.cap = None
             self._rd = None
@@ -3,8 +3,9 @@
 from typing import Dict, Any
 import logging
 
-from renderdoc_tools.core.models import CaptureInfo
+from renderdoc_tools.core.models import CaptureInfo, construct_model
 from renderdoc_tools.core.exceptions import ExtractionError
+from renderdoc_tools.utils.renderdoc_loader import get_renderdoc_module
 
 logger = logging.getLogger(__name__)
 
@@ -12,9 +13,6 @@ logger = logging.getLogger(__name__)
 class CaptureInfoExtractor:
     """Extracts basic capture metadata"""
     
-    def __init__(self):
-        self.logger = logging.getLogger(__name__)
-    
     def extract(self, controller) -> CaptureInfo:
         """
         Extract basic capture metadata
@@ -29,7 +27,6 @@ class CaptureInfoExtractor:
             ExtractionError: If extraction fails
         """
         try:
-            from renderdoc_tools.utils.renderdoc_loader import get_renderdoc_module
             rd = get_renderdoc_module()
             
             api_props = controller.GetAPIProperties()
@@ -51,10 +48,13 @@ class CaptureInfoExtractor:
                 frame_info['uncompressed_size'] = frame_desc.uncompressedFileSize
                 frame_info['compressed_size'] = frame_desc.compressedFileSize
             except Exception as e:
-                self.logger.debug(f"Could not extract frame info: {e}")
+                logger.debug(f"Could not extract frame info: {e}")
             
-            capture_info = CaptureInfo(
-                api=api_props.pipelineType,
+            # Values come straight from RenderDoc, so skip Pydantic validation;
+            # the API enum is converted to int here instead
+            capture_info = construct_model(
+                CaptureInfo,
+                api=int(api_props.pipelineType),
                 is_meta_fork=is_meta_fork,
                 frame_info=frame_info
             )
@@ -62,6 +62,6 @@ class CaptureInfoExtractor:
             return capture_info
             
         except Exception as e:
-            self.logger.error(f"Failed to extract capture info: {e}")
+            logger.error(f"Failed to extract capture info: {e}")
             raise ExtractionError(f"Capture info extraction failed: {e}") from e
 
@@ -1,7 +1,8 @@
 """Data models for RenderDoc capture data"""
 
+from functools import lru_cache
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from typing import Any, Callable, Dict, List, Optional, Type, TypeVar
 from enum import Enum
 
 
@@ -123,7 +124,99 @@ class CaptureData(BaseModel):
         None,
         alias="performanceCounters"
     )
+    # Analyzer name -> result, filled in by workflows that run analyzers
+    analysis: Optional[Dict[str, Any]] = None
     
     class Config:
         allow_population_by_field_name = True
 
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def construct_model(model_cls: Type[ModelT], **values: Any) -> ModelT:
+    """
+    Build a model from already-trusted values without running validation
+    
+    Uses model_construct on Pydantic 2 and construct on Pydantic 1. Values
+    are stored as given, so callers must pass the final field types and
+    use field names (Pydantic 1 does not map aliases here).
+    
+    Args:
+        model_cls: Model class to build
+        **values: Field values by field name
+        
+    Returns:
+        Model instance (defaults filled in for missing fields)
+    """
+    return model_constructor(model_cls)(**values)
+
+
+def model_constructor(model_cls: Type[ModelT]) -> Callable[..., ModelT]:
+    """
+    Resolve the unvalidated constructor used by construct_model
+    
+    Lets hot loops look the constructor up once instead of per model.
+    
+    Args:
+        model_cls: Model class to build
+        
+    Returns:
+        model_cls.model_construct on Pydantic 2, model_cls.construct on 1
+    """
+    return getattr(model_cls, 'model_construct', None) or model_cls.construct
+
+
+# Values dump_model can return without inspecting further
+_SCALAR_TYPES = (str, int, float, bool)
+
+
+@lru_cache(maxsize=None)
+def field_aliases(model_cls: Type[BaseModel]) -> Dict[str, str]:
+    """
+    Field name -> alias of a model class (the name itself if unaliased)
+    
+    Args:
+        model_cls: Model class
+        
+    Returns:
+        Dictionary in field declaration order
+    """
+    fields = getattr(model_cls, 'model_fields', None)
+    if fields is None:  # Pydantic 1
+        return {name: field.alias for name, field in model_cls.__fields__.items()}
+    return {name: field.alias or name for name, field in fields.items()}
+
+
+def dump_model(model: BaseModel) -> Dict[str, Any]:
+    """
+    Equivalent of model.dict(by_alias=True, exclude_none=True)
+    
+    Reads the field values directly and maps names through the cached
+    alias table, skipping Pydantic's per-field serialization machinery.
+    As with dict(), None is dropped from model fields (nested ones too) but
+    kept inside plain dict and list values.
+    
+    Args:
+        model: Model instance
+        
+    Returns:
+        Dictionary keyed by alias
+    """
+    aliases = field_aliases(type(model))
+    return {
+        aliases[name]: value if type(value) in _SCALAR_TYPES else _dump_value(value)
+        for name, value in model.__dict__.items()
+        if value is not None
+    }
+
+
+def _dump_value(value: Any) -> Any:
+    """Convert a nested field value for dump_model"""
+    if isinstance(value, BaseModel):
+        return dump_model(value)
+    if isinstance(value, list):
+        return [v if type(v) in _SCALAR_TYPES else _dump_value(v) for v in value]
+    if isinstance(value, dict):
+        return {k: v if type(v) in _SCALAR_TYPES else _dump_value(v) for k, v in value.items()}
+    return value
@@ -3,10 +3,12 @@
 from renderdoc_tools.exporters.base import BaseExporter
 from renderdoc_tools.exporters.json_exporter import JSONExporter
 from renderdoc_tools.exporters.csv_exporter import CSVExporter
+from renderdoc_tools.exporters.ndjson_exporter import NDJSONExporter
 
 __all__ = [
     "BaseExporter",
     "JSONExporter",
     "CSVExporter",
+    "NDJSONExporter",
 ]
 
@@ -1,16 +1,56 @@
 """CSV export module"""
 
 import csv
+import operator
 from pathlib import Path
-from typing import Any, List, Dict
+from functools import lru_cache
+from typing import Any, Callable, List, Dict, Tuple
 import logging
 
 from renderdoc_tools.exporters.base import BaseExporter
 from renderdoc_tools.core.exceptions import CSVExportError
-from renderdoc_tools.core.models import CaptureData, Action, Resource
+from renderdoc_tools.core.models import (
+    CaptureData, Action, Resource, TextureInfo, BufferInfo, dump_model, field_aliases
+)
 
 logger = logging.getLogger(__name__)
 
+# Write buffer for CSV output (rows are written as they are read)
+_WRITE_BUFFER = 1 << 20
+
+# Columns every flattened resource row has, even when empty
+_RESOURCE_BASE_KEYS = ('resourceId', 'name', 'type')
+
+# Nested resource info flattened into '<section>_<key>' columns
+_RESOURCE_SECTIONS = (('texture', TextureInfo), ('buffer', BufferInfo))
+
+
+@lru_cache(maxsize=None)
+def _attr_getter(names: Tuple[str, ...]) -> Callable[[Any], tuple]:
+    """Getter returning a tuple of the named attributes (always a tuple)"""
+    if len(names) == 1:
+        name = names[0]
+        return lambda obj: (getattr(obj, name),)
+    if not names:
+        return lambda obj: ()
+    return operator.attrgetter(*names)
+
+
+@lru_cache(maxsize=None)
+def _item_getter(indices: Tuple[int, ...]) -> Callable[[tuple], tuple]:
+    """Getter returning a tuple of the given positions (always a tuple)"""
+    if len(indices) == 1:
+        index = indices[0]
+        return lambda seq: (seq[index],)
+    if not indices:
+        return lambda seq: ()
+    return operator.itemgetter(*indices)
+
+
+def _present_fields(model) -> List[str]:
+    """Names of the fields dump_model would keep on a model"""
+    return [name for name, value in model.__dict__.items() if value is not None]
+
 
 class CSVExporter(BaseExporter):
     """Exports data to CSV format"""
@@ -63,82 +103,174 @@ class CSVExporter(BaseExporter):
             self.logger.error(f"Failed to export CSV: {e}")
             raise CSVExportError(f"CSV export failed: {e}") from e
     
+    def export_actions(self, actions: List[Action], output_path: Path) -> None:
+        """
+        Export only actions, without wrapping them in a CaptureData
+        
+        Writes ``<stem>_actions.csv`` next to output_path, as export() does.
+        
+        Args:
+            actions: Action models or dicts
+            output_path: Output CSV file path (base path)
+            
+        Raises:
+            CSVExportError: If export fails
+        """
+        self._export_section(self._export_actions, actions, output_path, 'actions')
+    
+    def export_resources(self, resources: List[Resource], output_path: Path) -> None:
+        """
+        Export only resources, without wrapping them in a CaptureData
+        
+        Writes ``<stem>_resources.csv`` next to output_path, as export() does.
+        
+        Args:
+            resources: Resource models or dicts
+            output_path: Output CSV file path (base path)
+            
+        Raises:
+            CSVExportError: If export fails
+        """
+        self._export_section(self._export_resources, resources, output_path, 'resources')
+    
+    def _export_section(self, writer, items: List[Any], output_path: Path, section: str):
+        """Validate the path and write one section with export()'s error handling"""
+        if not self.validate_output_path(output_path):
+            raise CSVExportError(f"Invalid output path: {output_path}")
+        
+        self.logger.info(f"Exporting {section} to CSV: {output_path}")
+        
+        try:
+            writer(items, output_path.parent / f"{output_path.stem}_{section}.csv")
+        except Exception as e:
+            self.logger.error(f"Failed to export CSV: {e}")
+            raise CSVExportError(f"CSV export failed: {e}") from e
+    
     def _export_actions(self, actions: List[Action], output_path: Path):
-        """Export actions to CSV"""
+        """Export actions to CSV, converting one row at a time"""
         if not actions:
             return
         
-        # Convert to dicts
-        action_dicts = []
+        # Header is every column present on any row, so gather keys first;
+        # models can stop once every field has been seen
+        aliases = field_aliases(Action)
+        models_only = all(isinstance(action, Action) for action in actions)
+        fields = set()
+        keys = set()
         for action in actions:
             if isinstance(action, Action):
-                action_dict = action.dict(by_alias=True, exclude_none=True)
+                fields.update(_present_fields(action))
+                if models_only and len(fields) == len(aliases):
+                    break
             else:
-                action_dict = action
-            action_dicts.append(action_dict)
+                keys.update(action.keys())
+        keys.update(aliases[name] for name in fields)
+        fieldnames = sorted(keys)
+        
+        # Models are read straight into header order instead of via .dict()
+        names = {alias: name for name, alias in aliases.items()}
+        if all(key in names for key in fieldnames):
+            read_action = _attr_getter(tuple(names[key] for key in fieldnames))
+        else:
+            read_action = None
         
-        # Get all unique keys
-        fieldnames = sorted(set().union(*[a.keys() for a in action_dicts]))
+        def action_row(action):
+            if read_action is not None and isinstance(action, Action):
+                return read_action(action)
+            if isinstance(action, Action):
+                action = dump_model(action)
+            return [action.get(key, '') for key in fieldnames]
         
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(action_dicts)
+        with open(output_path, 'w', newline='', encoding='utf-8', buffering=_WRITE_BUFFER) as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(map(action_row, actions))
         
-        self.logger.debug(f"Exported {len(action_dicts)} actions to {output_path}")
+        self.logger.debug(f"Exported {len(actions)} actions to {output_path}")
     
     def _export_resources(self, resources: List[Resource], output_path: Path):
-        """Export resources to CSV"""
+        """Export resources to CSV, flattening one row at a time"""
         if not resources:
             return
         
-        # Flatten nested dicts for CSV
-        flat_resources = []
+        # Header is every column present on any row, so gather keys first;
+        # a section is skipped once all its fields have been seen
+        models_only = all(isinstance(res, Resource) for res in resources)
+        section_fields = {section: set() for section, _ in _RESOURCE_SECTIONS}
+        pending = {section: len(field_aliases(model_cls)) for section, model_cls in _RESOURCE_SECTIONS}
+        keys = set(_RESOURCE_BASE_KEYS)  # Every row has these
         for res in resources:
+            if models_only and not pending:
+                break
             if isinstance(res, Resource):
-                res_dict = res.dict(by_alias=True, exclude_none=True)
+                for section in tuple(pending):
+                    info = getattr(res, section)
+                    if info:
+                        fields = section_fields[section]
+                        fields.update(_present_fields(info))
+                        if len(fields) == pending[section]:
+                            del pending[section]
             else:
-                res_dict = res
-            
-            flat_res = {
-                'resourceId': res_dict.get('resourceId', ''),
-                'name': res_dict.get('name', ''),
-                'type': res_dict.get('type', ''),
-            }
-            
-            # Flatten texture info
-            if 'texture' in res_dict and res_dict['texture']:
-                tex = res_dict['texture']
-                if isinstance(tex, dict):
-                    for k, v in tex.items():
-                        flat_res[f'texture_{k}'] = v
-                else:
-                    # Pydantic model
-                    for k, v in tex.dict().items():
-                        flat_res[f'texture_{k}'] = v
-            
-            # Flatten buffer info
-            if 'buffer' in res_dict and res_dict['buffer']:
-                buf = res_dict['buffer']
-                if isinstance(buf, dict):
-                    for k, v in buf.items():
-                        flat_res[f'buffer_{k}'] = v
-                else:
-                    # Pydantic model
-                    for k, v in buf.dict().items():
-                        flat_res[f'buffer_{k}'] = v
+                keys.update(self._flatten_resource(res).keys())
+        
+        # Plan: base columns, then each section's present fields (sorted)
+        plan = []
+        natural = list(_RESOURCE_BASE_KEYS)
+        for section, model_cls in _RESOURCE_SECTIONS:
+            names = tuple(sorted(section_fields[section]))
+            aliases = field_aliases(model_cls)
+            plan.append((section, _attr_getter(names), (None,) * len(names)))
+            natural += [f'{section}_{aliases[name]}' for name in names]
+        keys.update(natural[len(_RESOURCE_BASE_KEYS):])
+        fieldnames = sorted(keys)
+        
+        if models_only:
+            # Read models straight into header order; None (or a missing
+            # texture/buffer) writes as ''
+            read_base = _attr_getter(('resource_id', 'name', 'resource_type'))
+            reorder = _item_getter(tuple(natural.index(key) for key in fieldnames))
             
-            flat_resources.append(flat_res)
+            def resource_row(res):
+                row = read_base(res)
+                for section, read, missing in plan:
+                    info = getattr(res, section)
+                    row += read(info) if info else missing
+                return reorder(row)
+        else:
+            def resource_row(res):
+                flat_res = self._flatten_resource(res)
+                return [flat_res.get(key, '') for key in fieldnames]
+        
+        with open(output_path, 'w', newline='', encoding='utf-8', buffering=_WRITE_BUFFER) as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(map(resource_row, resources))
+        
+        self.logger.debug(f"Exported {len(resources)} resources to {output_path}")
+    
+    def _flatten_resource(self, res: Any) -> Dict[str, Any]:
+        """Flatten a resource's nested texture/buffer info into one CSV row"""
+        if isinstance(res, Resource):
+            res_dict = dump_model(res)
+        else:
+            res_dict = res
         
-        # Get all unique keys
-        fieldnames = sorted(set().union(*[r.keys() for r in flat_resources]))
+        flat_res = {
+            'resourceId': res_dict.get('resourceId', ''),
+            'name': res_dict.get('name', ''),
+            'type': res_dict.get('type', ''),
+        }
         
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(flat_resources)
+        # Flatten texture/buffer info
+        for section, _ in _RESOURCE_SECTIONS:
+            info = res_dict.get(section)
+            if info:
+                if not isinstance(info, dict):
+                    info = info.dict()  # Pydantic model
+                for k, v in info.items():
+                    flat_res[f'{section}_{k}'] = v
         
-        self.logger.debug(f"Exported {len(flat_resources)} resources to {output_path}")
+        return flat_res
     
     @property
     def format_name(self) -> str:
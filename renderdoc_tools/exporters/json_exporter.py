@@ -5,9 +5,14 @@ from pathlib import Path
 from typing import Any, Dict
 import logging
 
+try:
+    import orjson
+except ImportError:  # Optional: pip install renderdoc-tools[fast]
+    orjson = None
+
 from renderdoc_tools.exporters.base import BaseExporter
 from renderdoc_tools.core.exceptions import JSONExportError
-from renderdoc_tools.core.models import CaptureData
+from renderdoc_tools.core.models import CaptureData, dump_model
 
 logger = logging.getLogger(__name__)
 
@@ -15,17 +20,19 @@ logger = logging.getLogger(__name__)
 class JSONExporter(BaseExporter):
     """Exports data to JSON format"""
     
-    def __init__(self, pretty: bool = True, indent: int = 2):
+    def __init__(self, pretty: bool = True, indent: int = 2, use_orjson: bool = True):
         """
         Initialize JSON exporter
         
         Args:
             pretty: Whether to pretty-print JSON
             indent: Indentation level for pretty printing
+            use_orjson: Encode with orjson when it is installed
         """
         super().__init__()
         self.pretty = pretty
         self.indent = indent if pretty else None
+        self.use_orjson = use_orjson and orjson is not None
     
     def export(self, data: Any, output_path: Path) -> None:
         """
@@ -44,16 +51,41 @@ class JSONExporter(BaseExporter):
         self.logger.info(f"Exporting to JSON: {output_path}")
         
         try:
-            # Convert Pydantic models to dict if needed
-            if isinstance(data, CaptureData):
-                json_data = data.dict(by_alias=True, exclude_none=True)
-            elif isinstance(data, dict):
-                json_data = data
+            if isinstance(data, CaptureData) and hasattr(data, 'model_dump_json'):
+                # Pydantic 2 serializes the model in Rust, skipping the dict
+                Path(output_path).write_text(
+                    data.model_dump_json(by_alias=True, exclude_none=True, indent=self.indent),
+                    encoding='utf-8'
+                )
             else:
-                # Try to serialize other types
-                json_data = self._serialize(data)
+                self._write_json(self._to_json_data(data), output_path)
+            
+            self.logger.info(f"Successfully exported to {output_path}")
             
-            # Write JSON file
+        except Exception as e:
+            self.logger.error(f"Failed to export JSON: {e}")
+            raise JSONExportError(f"JSON export failed: {e}") from e
+    
+    def _to_json_data(self, data: Any) -> Any:
+        """Convert data to JSON-serializable objects"""
+        # Convert Pydantic models to dict if needed
+        if isinstance(data, CaptureData):
+            return dump_model(data)
+        if isinstance(data, dict):
+            return data
+        # Try to serialize other types
+        return self._serialize(data)
+    
+    def _write_json(self, json_data: Any, output_path: Path) -> None:
+        """Write JSON-serializable data, with orjson when available"""
+        # orjson only supports two-space indentation
+        if self.use_orjson and self.indent in (None, 2):
+            # Reflection/counter blobs may hold NumPy arrays; serialize natively
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            if self.indent:
+                option |= orjson.OPT_INDENT_2
+            Path(output_path).write_bytes(orjson.dumps(json_data, option=option))
+        else:
             with open(output_path, 'w', encoding='utf-8') as f:
                 json.dump(
                     json_data,
@@ -61,12 +93,6 @@ class JSONExporter(BaseExporter):
                     indent=self.indent,
                     ensure_ascii=False
                 )
-            
-            self.logger.info(f"Successfully exported to {output_path}")
-            
-        except Exception as e:
-            self.logger.error(f"Failed to export JSON: {e}")
-            raise JSONExportError(f"JSON export failed: {e}") from e
     
     def _serialize(self, obj: Any) -> Dict:
         """Serialize object to JSON-serializable dict"""
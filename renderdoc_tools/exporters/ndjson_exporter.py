@@ -0,0 +1,93 @@
+"""Newline-delimited JSON export module"""
+
+import json
+from pathlib import Path
+from typing import Any, Callable
+import logging
+
+try:
+    import orjson
+except ImportError:  # Optional: pip install renderdoc-tools[fast]
+    orjson = None
+
+from renderdoc_tools.exporters.base import BaseExporter
+from renderdoc_tools.core.exceptions import JSONExportError
+from renderdoc_tools.core.models import CaptureData, dump_model
+
+logger = logging.getLogger(__name__)
+
+# Output buffer size; records are small, so batch them into large writes
+_WRITE_BUFFER = 1 << 20
+
+# CaptureData list fields written one record per item, in output order
+_RECORD_SECTIONS = (
+    ('actions', 'action'),
+    ('resources', 'resource'),
+    ('shaders', 'shader'),
+    ('pipeline_states', 'pipeline_state'),
+)
+
+
+def _line_encoder() -> Callable[[Any], bytes]:
+    """Encoder for one JSON record followed by a newline"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+        return lambda record: orjson.dumps(record, option=option)
+    return lambda record: (json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8')
+
+
+class NDJSONExporter(BaseExporter):
+    """
+    Exports capture data as newline-delimited JSON
+    
+    Each line is an object {"type": ..., "data": ...}: the capture info
+    first, then one line per action, resource, shader and pipeline state,
+    then the performance counters if present. Records are encoded one at a
+    time, so the whole capture is never held as a dict tree, and readers
+    can stream the file line by line.
+    """
+    
+    def export(self, data: Any, output_path: Path) -> None:
+        """
+        Export capture data to an NDJSON file
+        
+        Args:
+            data: CaptureData model
+            output_path: Output NDJSON file path
+        
+        Raises:
+            JSONExportError: If export fails
+        """
+        if not isinstance(data, CaptureData):
+            raise JSONExportError(f"NDJSON export needs CaptureData, got {type(data).__name__}")
+        if not self.validate_output_path(output_path):
+            raise JSONExportError(f"Invalid output path: {output_path}")
+        
+        self.logger.info(f"Exporting to NDJSON: {output_path}")
+        
+        try:
+            encode = _line_encoder()
+            with open(output_path, 'wb', buffering=_WRITE_BUFFER) as f:
+                write = f.write
+                write(encode({'type': 'capture_info', 'data': dump_model(data.capture_info)}))
+                
+                for field, record_type in _RECORD_SECTIONS:
+                    for item in getattr(data, field) or ():
+                        write(encode({'type': record_type, 'data': dump_model(item)}))
+                
+                if data.performance_counters is not None:
+                    write(encode({'type': 'performance_counters', 'data': data.performance_counters}))
+            
+            self.logger.info(f"Successfully exported to {output_path}")
+        
+        except Exception as e:
+            self.logger.error(f"Failed to export NDJSON: {e}")
+            raise JSONExportError(f"NDJSON export failed: {e}") from e
+    
+    @property
+    def format_name(self) -> str:
+        return "ndjson"
+    
+    @property
+    def file_extension(self) -> str:
+        return "ndjson"
@@ -1,15 +1,27 @@
 """Action extraction module"""
 
-from typing import List
+from typing import Dict, List
 import logging
 
 from renderdoc_tools.extractors.base import BaseExtractor
-from renderdoc_tools.core.models import Action
+from renderdoc_tools.core.models import Action, model_constructor
 from renderdoc_tools.core.exceptions import ActionExtractionError
+from renderdoc_tools.utils.renderdoc_loader import get_renderdoc_module
 
 logger = logging.getLogger(__name__)
 
 
+def _dimension_dict(dimension):
+    """Convert a RenderDoc (x, y, z) tuple/list to a dict, passing others through"""
+    if isinstance(dimension, (list, tuple)):
+        return {
+            'x': dimension[0] if len(dimension) > 0 else 0,
+            'y': dimension[1] if len(dimension) > 1 else 0,
+            'z': dimension[2] if len(dimension) > 2 else 0,
+        }
+    return dimension
+
+
 class ActionExtractor(BaseExtractor):
     """Extracts actions (draw calls, dispatches, etc.) from capture"""
     
@@ -34,12 +46,10 @@ class ActionExtractor(BaseExtractor):
         
         try:
             # Get RenderDoc module for constants
-            from renderdoc_tools.utils.renderdoc_loader import get_renderdoc_module
             rd = get_renderdoc_module()
             
             root_actions = controller.GetRootActions()
-            for action in root_actions:
-                self._process_action(action, actions, rd, depth=0)
+            self._process_actions(root_actions, actions, rd)
             
             self.logger.info(f"Extracted {len(actions)} actions")
             return actions
@@ -48,65 +58,68 @@ class ActionExtractor(BaseExtractor):
             self.logger.error(f"Failed to extract actions: {e}")
             raise ActionExtractionError(f"Action extraction failed: {e}") from e
     
-    def _process_action(
-        self,
-        action,
-        actions: List[Action],
-        rd,
-        depth: int = 0
-    ):
-        """Recursively process an action and its children"""
-        action_data = {
-            'eventId': action.eventId,
-            'actionId': action.actionId,
-            'name': action.customName,
-            'flags': str(action.flags),
-            'depth': depth,
-        }
+    def _process_actions(self, root_actions, actions: List[Action], rd):
+        """
+        Walk the action tree in pre-order, appending an Action per node
         
-        # Add draw call specific info
-        if action.flags & rd.ActionFlags.Drawcall:
-            action_data.update({
-                'numIndices': action.numIndices,
-                'numInstances': action.numInstances,
-                'indexOffset': action.indexOffset,
-                'vertexOffset': action.vertexOffset,
-                'instanceOffset': action.instanceOffset,
-            })
+        Uses an explicit stack rather than recursion so deeply nested
+        captures cannot hit the interpreter's recursion limit.
+        """
+        drawcall = int(rd.ActionFlags.Drawcall)
+        dispatch = int(rd.ActionFlags.Dispatch)
+        make_action = model_constructor(Action)
+        flag_names: Dict[int, str] = {}  # Flag values repeat heavily; format each once
+        stack = [(action, 0) for action in reversed(root_actions)]
         
-        # Add dispatch info
-        if action.flags & rd.ActionFlags.Dispatch:
-            # Convert tuple/list to dict if needed
-            dispatch_dim = action.dispatchDimension
-            if isinstance(dispatch_dim, (list, tuple)):
-                action_data['dispatchDimension'] = {
-                    'x': dispatch_dim[0] if len(dispatch_dim) > 0 else 0,
-                    'y': dispatch_dim[1] if len(dispatch_dim) > 1 else 0,
-                    'z': dispatch_dim[2] if len(dispatch_dim) > 2 else 0,
-                }
+        while stack:
+            action, depth = stack.pop()
+            flags = action.flags
+            flag_bits = int(flags)
+            flags_str = flag_names.get(flag_bits)
+            if flags_str is None:
+                flags_str = flag_names[flag_bits] = str(flags)
+            
+            # Draw call specific info
+            if flag_bits & drawcall:
+                num_indices = action.numIndices
+                num_instances = action.numInstances
+                index_offset = action.indexOffset
+                vertex_offset = action.vertexOffset
+                instance_offset = action.instanceOffset
             else:
-                action_data['dispatchDimension'] = dispatch_dim
+                num_indices = num_instances = None
+                index_offset = vertex_offset = instance_offset = None
             
-            dispatch_threads = action.dispatchThreadsDimension
-            if isinstance(dispatch_threads, (list, tuple)):
-                action_data['dispatchThreadsDimension'] = {
-                    'x': dispatch_threads[0] if len(dispatch_threads) > 0 else 0,
-                    'y': dispatch_threads[1] if len(dispatch_threads) > 1 else 0,
-                    'z': dispatch_threads[2] if len(dispatch_threads) > 2 else 0,
-                }
+            # Dispatch info
+            if flag_bits & dispatch:
+                dispatch_dimension = _dimension_dict(action.dispatchDimension)
+                dispatch_threads_dimension = _dimension_dict(action.dispatchThreadsDimension)
             else:
-                action_data['dispatchThreadsDimension'] = dispatch_threads
-        
-        # Create Action model
-        try:
-            action_model = Action(**action_data)
-            actions.append(action_model)
-        except Exception as e:
-            self.logger.warning(f"Failed to create Action model: {e}")
-        
-        # Process children
-        for child in action.children:
-            self._process_action(child, actions, rd, depth + 1)
+                dispatch_dimension = dispatch_threads_dimension = None
+            
+            # Create Action model (values come straight from RenderDoc, so skip validation)
+            try:
+                actions.append(make_action(
+                    event_id=action.eventId,
+                    action_id=action.actionId,
+                    name=action.customName,
+                    flags=flags_str,
+                    depth=depth,
+                    num_indices=num_indices,
+                    num_instances=num_instances,
+                    index_offset=index_offset,
+                    vertex_offset=vertex_offset,
+                    instance_offset=instance_offset,
+                    dispatch_dimension=dispatch_dimension,
+                    dispatch_threads_dimension=dispatch_threads_dimension,
+                ))
+            except Exception as e:
+                self.logger.warning(f"Failed to create Action model: {e}")
+            
+            # Push children reversed so the first child is processed next
+            children = action.children
+            if children:
+                stack.extend((child, depth + 1) for child in reversed(children))
     
     @property
     def name(self) -> str:
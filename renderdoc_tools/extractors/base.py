@@ -1,12 +1,32 @@
 """Base classes for data extractors"""
 
 from abc import ABC, abstractmethod
-from typing import List, Any
+from typing import Any, Dict, List
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def cached_str(cache: Dict[Any, str], value: Any) -> str:
+    """
+    str(value), memoized in cache
+    
+    For RenderDoc enum values, which repeat across a capture and cost a
+    C++ -> Python string conversion each time they are formatted.
+    
+    Args:
+        cache: Dictionary owned by the caller (usually one per extract call)
+        value: Hashable value to format
+        
+    Returns:
+        String form of value
+    """
+    text = cache.get(value)
+    if text is None:
+        text = cache[value] = str(value)
+    return text
+
+
 class BaseExtractor(ABC):
     """Abstract base class for all data extractors"""
     
@@ -4,7 +4,7 @@ from typing import Dict, Any, List
 import logging
 
 from renderdoc_tools.extractors.base import BaseExtractor
-from renderdoc_tools.core.models import PerformanceCounter
+from renderdoc_tools.core.models import PerformanceCounter, construct_model
 from renderdoc_tools.core.exceptions import CounterExtractionError
 
 logger = logging.getLogger(__name__)
@@ -43,10 +43,11 @@ class CounterExtractor(BaseExtractor):
                     counters_data['available'] = True
                     for counter in counters:
                         try:
-                            counter_model = PerformanceCounter(
-                                counterId=counter.counter,
-                                name=counter.name,
-                                description=counter.description,
+                            counter_model = construct_model(
+                                PerformanceCounter,
+                                counter_id=int(counter.counter),
+                                name=str(counter.name),
+                                description=str(counter.description),
                                 category=str(counter.category),
                                 unit=str(counter.unit)
                             )
@@ -4,8 +4,10 @@ from typing import List, Optional
 import logging
 
 from renderdoc_tools.extractors.base import BaseExtractor
-from renderdoc_tools.core.models import PipelineState
+from renderdoc_tools.extractors.actions import ActionExtractor
+from renderdoc_tools.core.models import Action, PipelineState, model_constructor
 from renderdoc_tools.core.exceptions import PipelineExtractionError
+from renderdoc_tools.utils.renderdoc_loader import get_renderdoc_module
 
 logger = logging.getLogger(__name__)
 
@@ -24,12 +26,18 @@ class PipelineExtractor(BaseExtractor):
         super().__init__()
         self.event_ids = event_ids
     
-    def extract(self, controller) -> List[PipelineState]:
+    def extract(
+        self,
+        controller,
+        actions: Optional[List[Action]] = None
+    ) -> List[PipelineState]:
         """
         Extract pipeline states from the capture
         
         Args:
             controller: RenderDoc ReplayController instance
+            actions: Already-extracted actions to take event IDs from when
+                    no event_ids were given; extracted here if omitted
             
         Returns:
             List of PipelineState models
@@ -44,38 +52,45 @@ class PipelineExtractor(BaseExtractor):
         pipeline_states = []
         
         try:
-            from renderdoc_tools.utils.renderdoc_loader import get_renderdoc_module
             rd = get_renderdoc_module()
             
             # Get event IDs to process
             if self.event_ids is None:
-                # Extract for all actions
-                from renderdoc_tools.extractors.actions import ActionExtractor
-                action_extractor = ActionExtractor()
-                actions = action_extractor.extract(controller)
+                # Extract for all actions, reusing the caller's if provided
+                if actions is None:
+                    actions = ActionExtractor().extract(controller)
                 event_ids = [action.event_id for action in actions]
             else:
                 event_ids = self.event_ids
             
+            # Stages to inspect, with their names resolved once for all events.
+            # The controller is stateful (SetFrameEvent moves its current
+            # event), so events are replayed one at a time.
+            try:
+                stages = [
+                    (stage, str(stage))
+                    for stage in (rd.ShaderStage.Vertex, rd.ShaderStage.Pixel, rd.ShaderStage.Compute)
+                ]
+            except Exception as e:
+                self.logger.debug(f"Could not extract shader stages: {e}")
+                stages = []
+            make_state = model_constructor(PipelineState)
+            
             for event_id in event_ids:
                 try:
                     controller.SetFrameEvent(event_id, False)
                     state = controller.GetPipelineState()
                     
-                    pipeline_data = {
-                        'eventId': event_id,
-                        'graphicsShaderStages': [],
-                    }
-                    
                     # Extract bound shaders (API-agnostic approach)
+                    shader_stages = []
                     try:
                         if hasattr(state, 'GetShaderReflection'):
-                            for stage in [rd.ShaderStage.Vertex, rd.ShaderStage.Pixel, rd.ShaderStage.Compute]:
+                            for stage, stage_name in stages:
                                 try:
                                     shader_ref = state.GetShaderReflection(stage)
                                     if shader_ref:
-                                        pipeline_data['graphicsShaderStages'].append({
-                                            'stage': str(stage),
+                                        shader_stages.append({
+                                            'stage': stage_name,
                                             'resourceId': str(shader_ref.resourceId),
                                         })
                                 except Exception:
@@ -83,8 +98,9 @@ class PipelineExtractor(BaseExtractor):
                     except Exception as e:
                         self.logger.debug(f"Could not extract shader stages: {e}")
                     
-                    pipeline_model = PipelineState(**pipeline_data)
-                    pipeline_states.append(pipeline_model)
+                    pipeline_states.append(
+                        make_state(event_id=event_id, graphics_shader_stages=shader_stages)
+                    )
                     
                 except Exception as e:
                     self.logger.warning(f"Failed to extract pipeline state for event {event_id}: {e}")
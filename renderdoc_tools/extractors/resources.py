@@ -1,11 +1,12 @@
 """Resource extraction module"""
 
-from typing import List
+from typing import List, Optional
 import logging
 
-from renderdoc_tools.extractors.base import BaseExtractor
-from renderdoc_tools.core.models import Resource, TextureInfo, BufferInfo
+from renderdoc_tools.extractors.base import BaseExtractor, cached_str
+from renderdoc_tools.core.models import Resource, TextureInfo, BufferInfo, model_constructor
 from renderdoc_tools.core.exceptions import ResourceExtractionError
+from renderdoc_tools.utils.renderdoc_loader import get_renderdoc_module
 
 logger = logging.getLogger(__name__)
 
@@ -13,12 +14,14 @@ logger = logging.getLogger(__name__)
 class ResourceExtractor(BaseExtractor):
     """Extracts resources (textures, buffers) from capture"""
     
-    def extract(self, controller) -> List[Resource]:
+    def extract(self, controller, resource_descriptions: Optional[list] = None) -> List[Resource]:
         """
         Extract all resources from the capture
         
         Args:
             controller: RenderDoc ReplayController instance
+            resource_descriptions: Result of controller.GetResources() if the
+                    caller already fetched it; fetched here if omitted
             
         Returns:
             List of Resource models
@@ -33,57 +36,78 @@ class ResourceExtractor(BaseExtractor):
         resources = []
         
         try:
-            from renderdoc_tools.utils.renderdoc_loader import get_renderdoc_module
             rd = get_renderdoc_module()
+            texture_type = rd.ResourceType.Texture
+            buffer_type = rd.ResourceType.Buffer
             
-            for res in controller.GetResources():
+            # Texture descriptions by resource ID, fetched with a single
+            # GetTextures() call the first time a texture is seen
+            textures_by_id = None
+            
+            # Values come straight from RenderDoc, so models skip validation
+            make_resource = model_constructor(Resource)
+            make_texture = model_constructor(TextureInfo)
+            make_buffer = model_constructor(BufferInfo)
+            
+            # Enum values repeat across resources; format each once. Separate
+            # caches, since IntEnum members of different enums compare equal
+            resource_type_names = {}
+            texture_type_names = {}
+            
+            if resource_descriptions is None:
+                resource_descriptions = controller.GetResources()
+            
+            for res in resource_descriptions:
+                resource_id = str(res.resourceId)
+                res_type = res.type
+                # Keys are field names, as the models are built unvalidated
                 res_data = {
-                    'resourceId': str(res.resourceId),
+                    'resource_id': resource_id,
                     'name': res.name,
-                    'type': str(res.type),
+                    'resource_type': cached_str(resource_type_names, res_type),
                 }
                 
                 # Get texture info if applicable
-                if res.type == rd.ResourceType.Texture:
+                if res_type == texture_type:
                     try:
-                        textures = controller.GetTextures()
-                        tex_desc = None
-                        for tex in textures:
-                            if tex.resourceId == res.resourceId:
-                                tex_desc = tex
-                                break
+                        if textures_by_id is None:
+                            index = {}
+                            for tex in controller.GetTextures():
+                                index.setdefault(str(tex.resourceId), tex)
+                            textures_by_id = index
+                        tex_desc = textures_by_id.get(resource_id)
                         
                         if tex_desc:
-                            texture_info = TextureInfo(
+                            texture_info = make_texture(
                                 width=tex_desc.width,
                                 height=tex_desc.height,
                                 depth=tex_desc.depth,
                                 mips=tex_desc.mips,
-                                arraysize=tex_desc.arraysize,
+                                array_size=tex_desc.arraysize,
                                 format=str(tex_desc.format.Name()) if hasattr(tex_desc.format, 'Name') else str(tex_desc.format),
-                                type=str(tex_desc.type)
+                                texture_type=cached_str(texture_type_names, tex_desc.type)
                             )
                             res_data['texture'] = texture_info
                         else:
-                            self.logger.warning(f"Texture not found in GetTextures() list: {res.name}")
+                            self.logger.warning("Texture not found in GetTextures() list: %s", res.name)
                     except Exception as e:
-                        self.logger.warning(f"Failed to extract texture info for {res.name}: {e}")
+                        self.logger.warning("Failed to extract texture info for %s: %s", res.name, e)
                 
                 # Get buffer info if applicable
-                elif res.type == rd.ResourceType.Buffer:
+                elif res_type == buffer_type:
                     try:
                         if hasattr(controller, 'GetBuffer'):
                             buf_desc = controller.GetBuffer(res.resourceId)
-                            buffer_info = BufferInfo(length=buf_desc.length)
+                            buffer_info = make_buffer(length=buf_desc.length)
                             res_data['buffer'] = buffer_info
                         else:
-                            buffer_info = BufferInfo(
+                            buffer_info = make_buffer(
                                 length=None,
                                 note='Buffer details not available in this RenderDoc version'
                             )
                             res_data['buffer'] = buffer_info
                     except Exception as e:
-                        buffer_info = BufferInfo(
+                        buffer_info = make_buffer(
                             length=None,
                             error=f'Could not extract buffer information: {e}'
                         )
@@ -91,16 +115,15 @@ class ResourceExtractor(BaseExtractor):
                 
                 # Create Resource model
                 try:
-                    resource_model = Resource(**res_data)
-                    resources.append(resource_model)
+                    resources.append(make_resource(**res_data))
                 except Exception as e:
-                    self.logger.warning(f"Failed to create Resource model: {e}")
+                    self.logger.warning("Failed to create Resource model: %s", e)
             
-            self.logger.info(f"Extracted {len(resources)} resources")
+            self.logger.info("Extracted %s resources", len(resources))
             return resources
             
         except Exception as e:
-            self.logger.error(f"Failed to extract resources: {e}")
+            self.logger.error("Failed to extract resources: %s", e)
             raise ResourceExtractionError(f"Resource extraction failed: {e}") from e
     
     @property
@@ -1,11 +1,12 @@
 """Shader extraction module"""
 
-from typing import List
+from typing import List, Optional
 import logging
 
-from renderdoc_tools.extractors.base import BaseExtractor
-from renderdoc_tools.core.models import Shader
+from renderdoc_tools.extractors.base import BaseExtractor, cached_str
+from renderdoc_tools.core.models import Shader, model_constructor
 from renderdoc_tools.core.exceptions import ShaderExtractionError
+from renderdoc_tools.utils.renderdoc_loader import get_renderdoc_module
 
 logger = logging.getLogger(__name__)
 
@@ -13,12 +14,14 @@ logger = logging.getLogger(__name__)
 class ShaderExtractor(BaseExtractor):
     """Extracts shader information from capture"""
     
-    def extract(self, controller) -> List[Shader]:
+    def extract(self, controller, resource_descriptions: Optional[list] = None) -> List[Shader]:
         """
         Extract all shaders from the capture
         
         Args:
             controller: RenderDoc ReplayController instance
+            resource_descriptions: Result of controller.GetResources() if the
+                    caller already fetched it; fetched here if omitted
             
         Returns:
             List of Shader models
@@ -33,49 +36,65 @@ class ShaderExtractor(BaseExtractor):
         shaders = []
         
         try:
-            resources = controller.GetResources()
-            for res in resources:
+            rd = get_renderdoc_module()
+            # Only shader resources can have reflection; older bindings without
+            # ResourceType.Shader fall back to probing every resource
+            shader_type = getattr(rd.ResourceType, 'Shader', None)
+            make_shader = model_constructor(Shader)
+            stage_names = {}  # Stages repeat across shaders; format each once
+            
+            if resource_descriptions is None:
+                resource_descriptions = controller.GetResources()
+            
+            for res in resource_descriptions:
+                if shader_type is not None and res.type != shader_type:
+                    continue
+                
                 try:
-                    # Try to get shader reflection - if it works, it's a shader
                     reflection = controller.GetShader(res.resourceId)
-                    if reflection:
-                        shader_data = {
-                            'resourceId': str(res.resourceId),
-                            'name': res.name,
-                            'stage': str(reflection.stage) if hasattr(reflection, 'stage') else 'Unknown',
-                            'entryPoint': reflection.entryPoint if hasattr(reflection, 'entryPoint') else None,
-                        }
-                        
-                        # Get reflection details
-                        reflection_data = {}
-                        try:
-                            if hasattr(reflection, 'debugInfo') and reflection.debugInfo:
-                                reflection_data['debugInfo'] = reflection.debugInfo.compileFlags
-                            if hasattr(reflection, 'inputSignature'):
-                                reflection_data['inputSig_count'] = len(reflection.inputSignature)
-                            if hasattr(reflection, 'outputSignature'):
-                                reflection_data['outputSig_count'] = len(reflection.outputSignature)
-                        except Exception as e:
-                            self.logger.debug(f"Could not extract full reflection: {e}")
-                        
-                        if reflection_data:
-                            shader_data['reflection'] = reflection_data
-                        
-                        # Create Shader model
-                        try:
-                            shader_model = Shader(**shader_data)
-                            shaders.append(shader_model)
-                        except Exception as e:
-                            self.logger.warning(f"Failed to create Shader model: {e}")
-                except Exception:
-                    # Not a shader or GetShader failed, skip
-                    pass
+                except Exception as e:
+                    self.logger.debug("GetShader failed for %s: %s", res.name, e)
+                    continue
+                if not reflection:
+                    continue
+                
+                stage = getattr(reflection, 'stage', None)
+                shader_data = {
+                    'resource_id': str(res.resourceId),
+                    'name': res.name,
+                    'stage': cached_str(stage_names, stage) if stage is not None else 'Unknown',
+                    'entry_point': getattr(reflection, 'entryPoint', None),
+                }
+                
+                # Get reflection details
+                reflection_data = {}
+                try:
+                    debug_info = getattr(reflection, 'debugInfo', None)
+                    if debug_info:
+                        reflection_data['debugInfo'] = debug_info.compileFlags
+                    input_signature = getattr(reflection, 'inputSignature', None)
+                    if input_signature is not None:
+                        reflection_data['inputSig_count'] = len(input_signature)
+                    output_signature = getattr(reflection, 'outputSignature', None)
+                    if output_signature is not None:
+                        reflection_data['outputSig_count'] = len(output_signature)
+                except Exception as e:
+                    self.logger.debug("Could not extract full reflection: %s", e)
+                
+                if reflection_data:
+                    shader_data['reflection'] = reflection_data
+                
+                # Create Shader model (values come straight from RenderDoc, so skip validation)
+                try:
+                    shaders.append(make_shader(**shader_data))
+                except Exception as e:
+                    self.logger.warning("Failed to create Shader model: %s", e)
             
-            self.logger.info(f"Extracted {len(shaders)} shaders")
+            self.logger.info("Extracted %s shaders", len(shaders))
             return shaders
             
         except Exception as e:
-            self.logger.error(f"Failed to extract shaders: {e}")
+            self.logger.error("Failed to extract shaders: %s", e)
             raise ShaderExtractionError(f"Shader extraction failed: {e}") from e
     
     @property
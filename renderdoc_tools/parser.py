@@ -7,8 +7,11 @@ from pathlib import Path
 from typing import Optional, List
 import logging
 
+from renderdoc_tools import __version__
+from renderdoc_tools.config import settings
 from renderdoc_tools.core import CaptureFile, CaptureInfoExtractor
-from renderdoc_tools.core.models import CaptureData
+from renderdoc_tools.core.cache import cache_path, load_cached, store_cached
+from renderdoc_tools.core.models import CaptureData, construct_model
 from renderdoc_tools.extractors import (
     ActionExtractor,
     ResourceExtractor,
@@ -28,7 +31,9 @@ class Parser:
         self,
         include_pipeline: bool = False,
         include_counters: bool = False,
-        log_level: str = "INFO"
+        log_level: str = "INFO",
+        use_cache: bool = False,
+        cache_dir: Optional[Path] = None
     ):
         """
         Initialize parser
@@ -37,10 +42,14 @@ class Parser:
             include_pipeline: Whether to include pipeline state extraction
             include_counters: Whether to include performance counters
             log_level: Logging level
+            use_cache: Reuse parse results for captures with identical contents
+            cache_dir: Cache directory (defaults to settings.cache_dir)
         """
         setup_logging(level=log_level)
         self.include_pipeline = include_pipeline
         self.include_counters = include_counters
+        self.use_cache = use_cache
+        self.cache_dir = Path(cache_dir) if cache_dir else settings.cache_dir
         
         # Initialize extractors
         self.capture_info_extractor = CaptureInfoExtractor()
@@ -54,6 +63,10 @@ class Parser:
         """
         Parse an RDC capture file
         
+        With use_cache, a capture whose contents were parsed before (by the
+        same package version and extractor options) is loaded from the
+        cache instead of being replayed.
+        
         Args:
             rdc_path: Path to RDC capture file
             
@@ -61,6 +74,26 @@ class Parser:
             CaptureData model with extracted data
         """
         rdc_path = Path(rdc_path)
+        
+        entry = None
+        if self.use_cache and rdc_path.exists():
+            entry = cache_path(self.cache_dir, rdc_path, self._cache_variant())
+            capture_data = load_cached(entry)
+            if capture_data is not None:
+                logger.info(f"Loaded cached parse of {rdc_path} from {entry}")
+                return capture_data
+        
+        capture_data = self._parse_capture(rdc_path)
+        if entry is not None:
+            store_cached(entry, capture_data)
+        return capture_data
+    
+    def _cache_variant(self) -> str:
+        """Cache tag for the package version and enabled extractors"""
+        return f"{__version__}-p{int(self.include_pipeline)}c{int(self.include_counters)}"
+    
+    def _parse_capture(self, rdc_path: Path) -> CaptureData:
+        """Replay the capture and run the extractors"""
         logger.info(f"Parsing capture: {rdc_path}")
         
         with CaptureFile(rdc_path) as capture:
@@ -70,24 +103,33 @@ class Parser:
             # Extract actions
             actions = self.action_extractor.extract(capture.controller)
             
+            # Resources and shaders both walk the resource list; fetch it once
+            resource_descriptions = capture.controller.GetResources()
+            
             # Extract resources
-            resources = self.resource_extractor.extract(capture.controller)
+            resources = self.resource_extractor.extract(
+                capture.controller, resource_descriptions=resource_descriptions
+            )
             
             # Extract shaders
-            shaders = self.shader_extractor.extract(capture.controller)
+            shaders = self.shader_extractor.extract(
+                capture.controller, resource_descriptions=resource_descriptions
+            )
             
             # Extract pipeline states (optional)
             pipeline_states = None
             if self.pipeline_extractor:
-                pipeline_states = self.pipeline_extractor.extract(capture.controller)
+                pipeline_states = self.pipeline_extractor.extract(capture.controller, actions=actions)
             
             # Extract performance counters (optional)
             performance_counters = None
             if self.counter_extractor:
                 performance_counters = self.counter_extractor.extract(capture.controller)
             
-            # Build capture data
-            capture_data = CaptureData(
+            # Build capture data; children are already-built models, so skip
+            # re-validating (and copying) them
+            capture_data = construct_model(
+                CaptureData,
                 capture_info=capture_info,
                 actions=actions,
                 resources=resources,
@@ -0,0 +1,45 @@
+"""Unit tests for the Numba analytics kernels"""
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("numba")
+
+from renderdoc_tools.analytics_fast import draw_stats, texture_vram  # noqa: E402
+
+
+def test_draw_stats_matches_stable_sort():
+    """Test totals and top-k match a stable descending sort over draws"""
+    flags = np.array([1, 0, 1, 1, 1, 1, 1], dtype='u4')
+    num_indices = np.array([10, 99, 30, 30, 5, 0, 30], dtype='u4')
+    num_instances = np.array([2, 9, 1, 0, 1, 0, 1], dtype='u4')
+    
+    count, total_idx, total_inst, costs, idx = draw_stats(flags, num_indices, num_instances, 1, 3)
+    
+    assert count == 6
+    assert total_idx == 105
+    assert total_inst == 5
+    # Ties at cost 30 keep the earliest actions
+    assert costs.tolist() == [30, 30, 30]
+    assert idx.tolist() == [2, 3, 6]
+
+
+def test_draw_stats_fewer_draws_than_k():
+    """Test only real draws are returned when there are fewer than k"""
+    flags = np.array([0, 1], dtype='u4')
+    values = np.array([4, 4], dtype='u4')
+    
+    count, _, _, costs, idx = draw_stats(flags, values, values, 1, 5)
+    
+    assert count == 1
+    assert costs.tolist() == [16]
+    assert idx.tolist() == [1]
+
+
+def test_texture_vram():
+    """Test VRAM estimate sums width * height * depth * mips * 4"""
+    width = np.array([256, 1024], dtype=np.int64)
+    height = np.array([256, 512], dtype=np.int64)
+    depth = np.array([1, 1], dtype=np.int64)
+    mips = np.array([9, 1], dtype=np.int64)
+    
+    assert texture_vram(width, height, depth, mips) == (256 * 256 * 9 + 1024 * 512) * 4
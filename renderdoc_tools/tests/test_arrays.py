@@ -0,0 +1,66 @@
+"""Unit tests for struct-of-arrays capture views"""
+import pytest
+from renderdoc_tools.core.arrays import (
+    DRAWCALL,
+    DISPATCH,
+    INDEXED,
+    flag_mask,
+    actions_to_array,
+    textures_to_array,
+    top_k_indices,
+)
+from renderdoc_tools.core.models import Action, Resource, TextureInfo
+
+np = pytest.importorskip("numpy")
+
+
+def test_flag_mask():
+    """Test flags strings fold into bitmasks"""
+    assert flag_mask("ActionFlags.Drawcall|Indexed") == DRAWCALL | INDEXED
+    assert flag_mask("ActionFlags.Dispatch") == DISPATCH
+    assert flag_mask("ActionFlags.NoFlags") == 0
+
+
+def test_actions_to_array():
+    """Test action fields map to array columns, with None as 0"""
+    actions = [
+        Action(eventId=1, actionId=1, name="Draw", flags="Drawcall", numIndices=36, numInstances=2),
+        Action(eventId=2, actionId=2, name="Dispatch", flags="Dispatch"),
+    ]
+    arr = actions_to_array(actions)
+    
+    assert len(arr) == 2
+    assert arr['event_id'].tolist() == [1, 2]
+    assert arr['num_indices'].tolist() == [36, 0]
+    assert arr['num_instances'].tolist() == [2, 0]
+    assert ((arr['flags'] & DRAWCALL) != 0).tolist() == [True, False]
+
+
+def test_textures_to_array_skips_non_textures():
+    """Test only texture resources are included and indexed back"""
+    tex = TextureInfo(width=256, height=128, mips=9, format="RGBA8", type="Texture2D")
+    resources = [
+        Resource(resourceId="1", name="buf", type="Buffer"),
+        Resource(resourceId="2", name="albedo", type="Texture", texture=tex),
+    ]
+    arr = textures_to_array(resources)
+    
+    assert len(arr) == 1
+    assert arr['index'].tolist() == [1]
+    assert arr['width'].tolist() == [256]
+    assert arr['mips'].tolist() == [9]
+    assert arr['array_size'].tolist() == [1]
+
+
+def test_empty_inputs():
+    """Test empty inputs give empty arrays"""
+    assert len(actions_to_array([])) == 0
+    assert len(textures_to_array([])) == 0
+
+
+def test_top_k_indices_stable_ties():
+    """Test top-k is largest first and ties keep input order"""
+    values = np.array([5, 9, 7, 9, 7, 1, 7])
+    assert top_k_indices(values, 4).tolist() == [1, 3, 2, 4]
+    assert top_k_indices(values, 10).tolist() == [1, 3, 2, 4, 6, 0, 5]
+    assert top_k_indices(values[:0], 5).tolist() == []
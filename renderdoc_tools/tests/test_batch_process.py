@@ -0,0 +1,33 @@
+"""Unit tests for the batch processing script"""
+from batch_process import _strip_options
+
+SLURM_OPTIONS = ['--slurm-script', '--slurm-nodes', '--slurm-tasks-per-node', '--backend', '--jobs', '-j']
+
+
+def test_strip_options_removes_all_spellings():
+    """Test exact, '=' and attached-value forms are all dropped"""
+    argv = [
+        'captures/', '--slurm-script', 'job.sh', '--slurm-nodes=3',
+        '--jobs', '4', '-j8', '-j', '2', '--backend=thread', '--preset', 'quick',
+    ]
+    
+    assert _strip_options(argv, SLURM_OPTIONS) == ['captures/', '--preset', 'quick']
+
+
+def test_strip_options_removes_abbreviations():
+    """Test abbreviated options argparse accepts don't survive"""
+    argv = [
+        '/tmp/sl', '--slurm-scr', '/tmp/sl/job.sh', '--slurm-n', '3',
+        '--slurm-t=8', '--jo', '4', '--back', 'process', '--recursive',
+    ]
+    
+    stripped = _strip_options(argv, SLURM_OPTIONS)
+    
+    assert stripped == ['/tmp/sl', '--recursive']
+
+
+def test_strip_options_keeps_positionals_after_separator():
+    """Test arguments after '--' are left alone"""
+    argv = ['--preset', 'quick', '--', '--slurm-n']
+    
+    assert _strip_options(argv, SLURM_OPTIONS) == argv
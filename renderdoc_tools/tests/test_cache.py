@@ -0,0 +1,84 @@
+"""Unit tests for the parse cache"""
+from renderdoc_tools.core.cache import cache_path, load_cached, store_cached
+from renderdoc_tools.core.models import (
+    CaptureData, CaptureInfo, Action, Resource, TextureInfo
+)
+from renderdoc_tools.parser import Parser
+
+
+def _capture_data():
+    return CaptureData(
+        capture_info=CaptureInfo(api=2, frame_info={'frameNumber': 7}),
+        actions=[
+            Action(eventId=1, actionId=1, name="Draw", flags="Drawcall", numIndices=6),
+            Action(eventId=2, actionId=2, name="Dispatch", flags="Dispatch",
+                   dispatchDimension={'x': 8, 'y': 8, 'z': 1}),
+        ],
+        resources=[
+            Resource(
+                resourceId="ResourceId::1",
+                name="Albedo",
+                type="Texture",
+                texture=TextureInfo(width=64, height=64, format="R8G8B8A8_UNORM", type="Texture2D")
+            )
+        ]
+    )
+
+
+def test_store_and_load_round_trip(tmp_path):
+    """Test cached capture data loads back equal"""
+    rdc = tmp_path / "a.rdc"
+    rdc.write_bytes(b"capture")
+    entry = cache_path(tmp_path / "cache", rdc, "v1")
+    data = _capture_data()
+    
+    assert load_cached(entry) is None
+    store_cached(entry, data)
+    
+    assert load_cached(entry) == data
+    assert list((tmp_path / "cache").iterdir()) == [entry]
+
+
+def test_cache_path_follows_contents(tmp_path):
+    """Test the entry depends on file contents and variant, not the file name"""
+    a = tmp_path / "a.rdc"
+    b = tmp_path / "b.rdc"
+    a.write_bytes(b"same")
+    b.write_bytes(b"same")
+    
+    assert cache_path(tmp_path, a, "v1") == cache_path(tmp_path, b, "v1")
+    assert cache_path(tmp_path, a, "v1") != cache_path(tmp_path, a, "v2")
+    b.write_bytes(b"changed")
+    assert cache_path(tmp_path, a, "v1") != cache_path(tmp_path, b, "v1")
+
+
+def test_invalid_entry_is_ignored(tmp_path):
+    """Test a corrupt cache entry reads as a miss"""
+    entry = tmp_path / "entry.json"
+    entry.write_bytes(b"{not json")
+    
+    assert load_cached(entry) is None
+
+
+def test_parser_reuses_cached_parse(tmp_path, monkeypatch):
+    """Test a second parse of the same capture skips replay"""
+    rdc = tmp_path / "a.rdc"
+    rdc.write_bytes(b"capture")
+    calls = []
+    
+    def fake_parse_capture(self, rdc_path):
+        calls.append(rdc_path)
+        return _capture_data()
+    
+    monkeypatch.setattr(Parser, '_parse_capture', fake_parse_capture)
+    parser = Parser(use_cache=True, cache_dir=tmp_path / "cache")
+    
+    first = parser.parse(rdc)
+    second = parser.parse(rdc)
+    
+    assert len(calls) == 1
+    assert second == first
+    
+    # Different extractor options use a separate entry
+    Parser(include_pipeline=True, use_cache=True, cache_dir=tmp_path / "cache").parse(rdc)
+    assert len(calls) == 2
@@ -0,0 +1,55 @@
+"""Unit tests for capture file handling"""
+import pytest
+from unittest.mock import MagicMock
+from renderdoc_tools.core import capture
+from renderdoc_tools.core.capture import CaptureFile, _ReplayGlobal
+from renderdoc_tools.core.exceptions import CaptureOpenError
+
+
+@pytest.fixture
+def mock_rd(monkeypatch):
+    """Mock RenderDoc module whose captures open successfully"""
+    rd = MagicMock()
+    rd.ResultCode.Succeeded = 0
+    cap = rd.OpenCaptureFile.return_value
+    cap.OpenFile.return_value = 0
+    cap.LocalReplaySupport.return_value = True
+    cap.OpenCapture.return_value = (0, MagicMock())
+    monkeypatch.setattr(capture, 'get_renderdoc_module', lambda: rd)
+    monkeypatch.setattr(_ReplayGlobal, '_rd', None)
+    monkeypatch.setattr(_ReplayGlobal, '_refs', 0)
+    monkeypatch.setattr(_ReplayGlobal, '_atexit_registered', True)
+    return rd
+
+
+def test_replay_initialised_once(tmp_path, mock_rd):
+    """Test sequential and nested captures share one replay initialisation"""
+    rdc = tmp_path / "a.rdc"
+    rdc.touch()
+    
+    with CaptureFile(rdc):
+        with CaptureFile(rdc):
+            pass
+    with CaptureFile(rdc):
+        pass
+    
+    assert mock_rd.InitialiseReplay.call_count == 1
+    assert mock_rd.ShutdownReplay.call_count == 0
+    
+    _ReplayGlobal.shutdown()
+    assert mock_rd.ShutdownReplay.call_count == 1
+
+
+def test_failed_open_releases_replay(tmp_path, mock_rd):
+    """Test a capture that fails to open drops its replay reference"""
+    rdc = tmp_path / "a.rdc"
+    rdc.touch()
+    mock_rd.OpenCaptureFile.return_value.OpenFile.return_value = 1
+    
+    with pytest.raises(CaptureOpenError):
+        with CaptureFile(rdc):
+            pass
+    
+    assert _ReplayGlobal._refs == 0
+    _ReplayGlobal.shutdown()
+    assert mock_rd.ShutdownReplay.call_count == 1
@@ -1,10 +1,13 @@
 """Unit tests for exporters"""
 import pytest
+import csv
 import json
 import tempfile
 from pathlib import Path
-from renderdoc_tools.exporters import JSONExporter, CSVExporter
-from renderdoc_tools.core.models import CaptureData, CaptureInfo, Action
+from renderdoc_tools.exporters import JSONExporter, CSVExporter, NDJSONExporter
+from renderdoc_tools.core.models import (
+    CaptureData, CaptureInfo, Action, Resource, TextureInfo, BufferInfo
+)
 
 
 class TestJSONExporter:
@@ -41,6 +44,80 @@ class TestJSONExporter:
                 assert "captureInfo" in data or "capture_info" in data
                 assert "actions" in data
 
+    
+    def test_export_numpy_blob_with_orjson(self):
+        """Test NumPy arrays in dict blobs are written as JSON lists"""
+        np = pytest.importorskip("numpy")
+        pytest.importorskip("orjson")
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "blob.json"
+            JSONExporter().export(
+                {'reflection': {'constants': np.arange(3, dtype=np.float32)}},
+                output_path
+            )
+            
+            with open(output_path) as f:
+                assert json.load(f) == {'reflection': {'constants': [0.0, 1.0, 2.0]}}
+    
+    def test_orjson_and_stdlib_output_match(self):
+        """Test the orjson and stdlib encoders write the same JSON"""
+        pytest.importorskip("orjson")
+        capture_data = CaptureData(
+            capture_info=CaptureInfo(api=2),
+            actions=[
+                Action(eventId=i, actionId=i, name=f"Draw {i}", flags="Drawcall", numIndices=3 * i)
+                for i in range(1, 4)
+            ]
+        )
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fast_path = Path(tmpdir) / "fast.json"
+            slow_path = Path(tmpdir) / "slow.json"
+            JSONExporter().export(capture_data, fast_path)
+            JSONExporter(use_orjson=False).export(capture_data, slow_path)
+            
+            with open(fast_path) as f_fast, open(slow_path) as f_slow:
+                assert json.load(f_fast) == json.load(f_slow)
+
+
+class TestNDJSONExporter:
+    """Tests for NDJSONExporter"""
+    
+    def test_export_one_record_per_line(self):
+        """Test each model is written as its own line, matching the JSON export"""
+        capture_data = CaptureData(
+            capture_info=CaptureInfo(api=2),
+            actions=[
+                Action(eventId=i, actionId=i, name=f"Draw {i}", flags="Drawcall")
+                for i in range(1, 3)
+            ],
+            resources=[
+                Resource(resourceId="ResourceId::1", name="VB", type="Buffer",
+                         buffer=BufferInfo(length=256))
+            ],
+            performance_counters={'available': False}
+        )
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ndjson_path = Path(tmpdir) / "capture.ndjson"
+            json_path = Path(tmpdir) / "capture.json"
+            NDJSONExporter().export(capture_data, ndjson_path)
+            JSONExporter().export(capture_data, json_path)
+            
+            with open(ndjson_path, encoding='utf-8') as f:
+                records = [json.loads(line) for line in f]
+            with open(json_path, encoding='utf-8') as f:
+                full = json.load(f)
+        
+        assert [r['type'] for r in records] == [
+            'capture_info', 'action', 'action', 'resource', 'performance_counters'
+        ]
+        assert records[0]['data'] == full['captureInfo']
+        assert [r['data'] for r in records[1:3]] == full['actions']
+        assert records[3]['data'] == full['resources'][0]
+        assert records[4]['data'] == full['performanceCounters']
+
 
 class TestCSVExporter:
     """Tests for CSVExporter"""
@@ -50,3 +127,60 @@ class TestCSVExporter:
         exporter = CSVExporter()
         assert exporter.format_name == "csv"
         assert exporter.file_extension == "csv"
+    
+    def test_export_actions_matches_export(self):
+        """Test export_actions writes the same file as export on a CaptureData"""
+        actions = [
+            Action(eventId=1, actionId=1, name="DrawIndexed", flags="Drawcall", numIndices=36),
+            Action(eventId=2, actionId=2, name="Dispatch", flags="Dispatch"),
+        ]
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            exporter = CSVExporter()
+            exporter.export(
+                CaptureData(capture_info=CaptureInfo(api=2), actions=actions),
+                Path(tmpdir) / "full.csv"
+            )
+            exporter.export_actions(actions, Path(tmpdir) / "direct.csv")
+            
+            full = (Path(tmpdir) / "full_actions.csv").read_text()
+            direct = (Path(tmpdir) / "direct_actions.csv").read_text()
+            assert direct == full
+            assert not (Path(tmpdir) / "direct_resources.csv").exists()
+    
+    def test_model_rows_match_dict_rows(self):
+        """Test rows read from models match rows exported from their dicts"""
+        data = CaptureData(
+            capture_info=CaptureInfo(api=2),
+            actions=[
+                Action(eventId=1, actionId=1, name="DrawIndexed", flags="Drawcall",
+                       numIndices=36, numInstances=2),
+                Action(eventId=2, actionId=2, name="Dispatch", flags="Dispatch", depth=1,
+                       dispatchDimension={'x': 8, 'y': 4, 'z': 1}),
+            ],
+            resources=[
+                Resource(resourceId="1", name="Albedo", type="Texture",
+                         texture=TextureInfo(width=512, height=256, mips=10,
+                                             format="RGBA8", type="Texture2D")),
+                Resource(resourceId="2", name="Vertices", type="Buffer",
+                         buffer=BufferInfo(length=4096)),
+                Resource(resourceId="3", name="Empty", type="Buffer", buffer=BufferInfo()),
+            ],
+        )
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            exporter = CSVExporter()
+            exporter.export(data, Path(tmpdir) / "models.csv")
+            exporter.export(data.dict(by_alias=True, exclude_none=True), Path(tmpdir) / "dicts.csv")
+            
+            for section in ("actions", "resources"):
+                models = (Path(tmpdir) / f"models_{section}.csv").read_text()
+                dicts = (Path(tmpdir) / f"dicts_{section}.csv").read_text()
+                assert models == dicts
+            
+            with open(Path(tmpdir) / "models_resources.csv", newline='') as f:
+                rows = list(csv.DictReader(f))
+            assert rows[0]["texture_arraysize"] == "1"
+            assert rows[0]["buffer_length"] == ""
+            assert rows[1]["buffer_length"] == "4096"
+            assert rows[1]["texture_width"] == ""
@@ -1,7 +1,12 @@
 """Unit tests for extractors"""
+import sys
 import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock, MagicMock
-from renderdoc_tools.extractors import ActionExtractor, ResourceExtractor
+from renderdoc_tools.extractors import (
+    ActionExtractor, ResourceExtractor, PipelineExtractor, ShaderExtractor
+)
+from renderdoc_tools.core.models import Action, Resource, TextureInfo
 
 
 class TestActionExtractor:
@@ -28,6 +33,92 @@ class TestActionExtractor:
         extractor = ActionExtractor()
         # This will fail without actual RenderDoc but demonstrates structure
         # In real tests, we'd need more comprehensive mocking
+    
+    def test_extract_builds_same_models_as_validation(self, monkeypatch):
+        """Test unvalidated Action construction matches validated models"""
+        rd = Mock()
+        rd.ActionFlags.Drawcall = 1
+        rd.ActionFlags.Dispatch = 2
+        monkeypatch.setattr(
+            "renderdoc_tools.extractors.actions.get_renderdoc_module", lambda: rd
+        )
+        
+        dispatch = Mock(eventId=2, actionId=2, customName="Dispatch", flags=2,
+                        dispatchDimension=(8, 4, 1), dispatchThreadsDimension=(64, 1, 1),
+                        children=[])
+        draw = Mock(eventId=1, actionId=1, customName="DrawIndexed", flags=1,
+                    numIndices=36, numInstances=2, indexOffset=0, vertexOffset=0,
+                    instanceOffset=0, children=[dispatch])
+        controller = Mock()
+        controller.GetRootActions.return_value = [draw]
+        
+        actions = ActionExtractor().extract(controller)
+        
+        assert actions == [
+            Action(eventId=1, actionId=1, name="DrawIndexed", flags="1", depth=0,
+                   numIndices=36, numInstances=2, indexOffset=0, vertexOffset=0,
+                   instanceOffset=0),
+            Action(eventId=2, actionId=2, name="Dispatch", flags="2", depth=1,
+                   dispatchDimension={'x': 8, 'y': 4, 'z': 1},
+                   dispatchThreadsDimension={'x': 64, 'y': 1, 'z': 1}),
+        ]
+        assert actions[0].dict(by_alias=True) == Action(
+            eventId=1, actionId=1, name="DrawIndexed", flags="1",
+            numIndices=36, numInstances=2, indexOffset=0, vertexOffset=0,
+            instanceOffset=0
+        ).dict(by_alias=True)
+
+    
+    def test_extract_preorder_beyond_recursion_limit(self, monkeypatch):
+        """Test actions come out in pre-order and deep trees do not overflow"""
+        rd = Mock()
+        rd.ActionFlags.Drawcall = 1
+        rd.ActionFlags.Dispatch = 2
+        monkeypatch.setattr(
+            "renderdoc_tools.extractors.actions.get_renderdoc_module", lambda: rd
+        )
+        
+        def node(event_id, children=()):
+            return SimpleNamespace(eventId=event_id, actionId=event_id,
+                                   customName=f"marker{event_id}", flags=0,
+                                   children=list(children))
+        
+        depth = sys.getrecursionlimit() + 100
+        deep = node(100)
+        for event_id in range(101, 100 + depth):
+            deep = node(event_id, [deep])
+        roots = [node(1, [node(2, [node(3)]), node(4)]), node(5), deep]
+        controller = Mock()
+        controller.GetRootActions.return_value = roots
+        
+        actions = ActionExtractor().extract(controller)
+        
+        assert [a.event_id for a in actions[:5]] == [1, 2, 3, 4, 5]
+        assert [a.depth for a in actions[:5]] == [0, 1, 2, 1, 0]
+        assert len(actions) == 5 + depth
+        assert actions[-1].depth == depth - 1
+
+
+class TestPipelineExtractor:
+    """Tests for PipelineExtractor"""
+    
+    def test_extract_reuses_given_actions(self, monkeypatch):
+        """Test passed-in actions supply event IDs without re-walking the tree"""
+        rd = Mock()
+        monkeypatch.setattr(
+            "renderdoc_tools.extractors.pipeline.get_renderdoc_module", lambda: rd
+        )
+        controller = Mock()
+        controller.GetPipelineState.return_value = SimpleNamespace()
+        actions = [
+            Action(eventId=3, actionId=1, name="Draw", flags="Drawcall"),
+            Action(eventId=7, actionId=2, name="Draw", flags="Drawcall"),
+        ]
+        
+        states = PipelineExtractor().extract(controller, actions=actions)
+        
+        assert [state.event_id for state in states] == [3, 7]
+        controller.GetRootActions.assert_not_called()
 
 
 class TestResourceExtractor:
@@ -37,3 +128,71 @@ class TestResourceExtractor:
         """Test extractor has correct name"""
         extractor = ResourceExtractor()
         assert extractor.name == "resources"
+    
+    def test_extract_fetches_textures_once(self, monkeypatch):
+        """Test texture descriptions are looked up by ID from one GetTextures() call"""
+        rd = SimpleNamespace(ResourceType=SimpleNamespace(Texture="Texture", Buffer="Buffer"))
+        monkeypatch.setattr(
+            "renderdoc_tools.extractors.resources.get_renderdoc_module", lambda: rd
+        )
+        
+        def texture(resource_id, width):
+            return SimpleNamespace(resourceId=resource_id, width=width, height=64, depth=1,
+                                   mips=1, arraysize=1, format="RGBA8", type="Texture2D")
+        
+        controller = Mock()
+        controller.GetResources.return_value = [
+            SimpleNamespace(resourceId=i, name=f"tex{i}", type="Texture") for i in (3, 1, 2)
+        ]
+        controller.GetTextures.return_value = [texture(1, 16), texture(2, 32), texture(3, 48)]
+        
+        resources = ResourceExtractor().extract(controller)
+        
+        assert [(r.resource_id, r.texture.width) for r in resources] == [
+            ("3", 48), ("1", 16), ("2", 32)
+        ]
+        assert controller.GetTextures.call_count == 1
+        assert resources[0] == Resource(
+            resourceId="3", name="tex3", type="Texture",
+            texture=TextureInfo(width=48, height=64, format="RGBA8", type="Texture2D")
+        )
+
+
+class TestShaderExtractor:
+    """Tests for ShaderExtractor"""
+    
+    def test_extract_only_queries_shader_resources(self, monkeypatch):
+        """Test GetShader is only called for resources of the Shader type"""
+        rd = SimpleNamespace(ResourceType=SimpleNamespace(Shader="Shader"))
+        monkeypatch.setattr(
+            "renderdoc_tools.extractors.shaders.get_renderdoc_module", lambda: rd
+        )
+        controller = Mock()
+        controller.GetResources.return_value = [
+            SimpleNamespace(resourceId=1, name="Albedo", type="Texture"),
+            SimpleNamespace(resourceId=2, name="MainVS", type="Shader"),
+        ]
+        controller.GetShader.return_value = SimpleNamespace(
+            stage="Vertex", entryPoint="main", inputSignature=[1, 2], outputSignature=[1]
+        )
+        
+        shaders = ShaderExtractor().extract(controller)
+        
+        controller.GetShader.assert_called_once_with(2)
+        assert [(s.resource_id, s.stage, s.entry_point) for s in shaders] == [("2", "Vertex", "main")]
+        assert shaders[0].reflection == {'inputSig_count': 2, 'outputSig_count': 1}
+    
+    def test_extract_uses_given_resource_descriptions(self, monkeypatch):
+        """Test a pre-fetched GetResources() list is used instead of a new call"""
+        rd = SimpleNamespace(ResourceType=SimpleNamespace(Shader="Shader"))
+        monkeypatch.setattr(
+            "renderdoc_tools.extractors.shaders.get_renderdoc_module", lambda: rd
+        )
+        controller = Mock()
+        controller.GetShader.return_value = SimpleNamespace(stage="Pixel", entryPoint="main")
+        descriptions = [SimpleNamespace(resourceId=5, name="MainPS", type="Shader")]
+        
+        shaders = ShaderExtractor().extract(controller, resource_descriptions=descriptions)
+        
+        controller.GetResources.assert_not_called()
+        assert [s.name for s in shaders] == ["MainPS"]
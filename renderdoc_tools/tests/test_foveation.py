@@ -0,0 +1,30 @@
+"""Unit tests for the foveation analyzer's render pass scan"""
+from renderdoc_tools.analyzers.quest import foveation
+from renderdoc_tools.analyzers.quest.foveation import FoveationAnalyzer, _render_pass_indices
+
+
+def test_render_pass_indices():
+    """Test joined scan maps matches back to name positions"""
+    names = ['vkCmdDraw', 'vkCmdBeginRenderPass', 'Renderpass 2', '',
+             'RenderPassRenderPass', 'vkCmdDispatch', 'EndRenderPass']
+    assert _render_pass_indices(names) == [1, 2, 4, 6]
+    assert _render_pass_indices([]) == []
+
+
+def test_render_pass_indices_with_delimiter_in_name():
+    """Test names containing NUL fall back to per-name search"""
+    assert _render_pass_indices(['a\0b', 'RenderPass']) == [1]
+
+
+def test_bulk_scan_matches_per_name_scan(monkeypatch):
+    """Test both scan paths give the same result"""
+    actions = [
+        {'eventId': i, 'name': 'vkCmdBeginRenderPass' if i % 3 == 0 else 'vkCmdDraw'}
+        for i in range(30)
+    ]
+    analyzer = FoveationAnalyzer()
+    expected = analyzer.analyze({'actions': actions})
+    
+    monkeypatch.setattr(foveation, 'BULK_SCAN_THRESHOLD', 10)
+    assert analyzer.analyze({'actions': actions}) == expected
+    assert expected['summary']['render_pass_count'] == 10
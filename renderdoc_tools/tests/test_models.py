@@ -41,3 +41,41 @@ def test_action_with_aliases():
     )
     assert action.event_id == 100
     assert action.num_indices == 36
+
+
+def test_construct_model_matches_validated():
+    """Test construct_model builds the same model as validation for trusted values"""
+    from renderdoc_tools.core.models import construct_model
+    
+    built = construct_model(CaptureInfo, api=2, is_meta_fork=True, frame_info={'frame_number': 7})
+    assert built == CaptureInfo(api=2, is_meta_fork=True, frame_info={'frame_number': 7})
+    
+    defaults = construct_model(Action, event_id=1, action_id=2, name="Draw", flags="Drawcall")
+    assert defaults.dict() == Action(eventId=1, actionId=2, name="Draw", flags="Drawcall").dict()
+
+
+def test_dump_model_matches_dict():
+    """Test dump_model equals dict(by_alias=True, exclude_none=True)"""
+    from renderdoc_tools.core.models import (
+        dump_model, Resource, TextureInfo, BufferInfo
+    )
+    
+    data = CaptureData(
+        captureInfo=CaptureInfo(api=2, frame_info={'frame_number': 7, 'title': None}),
+        actions=[
+            Action(eventId=1, actionId=1, name="Draw", flags="Drawcall", numIndices=36),
+            Action(eventId=2, actionId=2, name="Dispatch", flags="Dispatch",
+                   dispatchDimension={'x': 8, 'y': 1, 'z': 1}),
+        ],
+        resources=[
+            Resource(resourceId="1", name="Albedo", type="Texture",
+                     texture=TextureInfo(width=4, height=4, format="RGBA8", type="Texture2D")),
+            Resource(resourceId="2", name="Vertices", type="Buffer", buffer=BufferInfo(length=64)),
+        ],
+    )
+    
+    dumped = dump_model(data)
+    assert dumped == data.dict(by_alias=True, exclude_none=True)
+    assert list(dumped) == list(data.dict(by_alias=True, exclude_none=True))
+    assert dumped['captureInfo']['frame_info'] == {'frame_number': 7, 'title': None}
+    assert 'numInstances' not in dumped['actions'][0]
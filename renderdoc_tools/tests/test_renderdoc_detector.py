@@ -0,0 +1,37 @@
+"""Tests for RenderDoc installation detection"""
+
+from renderdoc_tools.utils import renderdoc_detector
+from renderdoc_tools.utils.renderdoc_detector import find_renderdoc_installations
+
+
+def test_scan_runs_once_until_cache_clear(monkeypatch):
+    """Repeated calls reuse the first scan until cache_clear()"""
+    calls = []
+    monkeypatch.setattr(renderdoc_detector.os.path, 'exists',
+                        lambda path: calls.append(path) or False)
+    
+    find_renderdoc_installations.cache_clear()
+    try:
+        assert find_renderdoc_installations() == []
+        probes = len(calls)
+        find_renderdoc_installations()
+        assert len(calls) == probes
+        
+        find_renderdoc_installations.cache_clear()
+        find_renderdoc_installations()
+        assert len(calls) == 2 * probes
+    finally:
+        find_renderdoc_installations.cache_clear()
+
+
+def test_results_are_copies(monkeypatch):
+    """Mutating a returned installation does not affect later calls"""
+    cached = ({'type': 'standard', 'path': '/opt/renderdoc',
+               'pymodules_path': '/opt/renderdoc', 'name': 'RenderDoc (Standard)'},)
+    monkeypatch.setattr(renderdoc_detector, '_scan_installations', lambda: cached)
+    
+    first = find_renderdoc_installations()
+    first[0]['path'] = 'changed'
+    first.clear()
+    
+    assert find_renderdoc_installations()[0]['path'] == '/opt/renderdoc'
@@ -0,0 +1,93 @@
+"""Tests for RenderDoc module loading helpers"""
+
+import os
+import threading
+import time
+
+import pytest
+
+from renderdoc_tools.core.exceptions import RenderDocNotFoundError
+from renderdoc_tools.utils import renderdoc_loader
+from renderdoc_tools.utils.renderdoc_loader import _dll_subdirectories, _prepend_to_path
+
+
+def test_dll_subdirectories_two_levels(tmp_path):
+    """Children and grandchildren directories are listed, files and deeper levels are not"""
+    (tmp_path / "plugins" / "d3d12" / "deeper").mkdir(parents=True)
+    (tmp_path / "qtplugins").mkdir()
+    (tmp_path / "renderdoc.dll").write_bytes(b"")
+    (tmp_path / "plugins" / "readme.txt").write_text("")
+    
+    dirs = _dll_subdirectories(str(tmp_path))
+    
+    assert sorted(dirs) == sorted([
+        os.path.join(str(tmp_path), "plugins"),
+        os.path.join(str(tmp_path), "plugins", "d3d12"),
+        os.path.join(str(tmp_path), "qtplugins"),
+    ])
+
+
+def test_dll_subdirectories_missing_base(tmp_path):
+    """A missing base directory yields no directories"""
+    assert _dll_subdirectories(str(tmp_path / "missing")) == []
+
+
+def test_prepend_to_path_skips_existing_entries(monkeypatch):
+    """Only entries missing from PATH are prepended, in order"""
+    a, b, c = (os.path.join("base", name) for name in ("a", "b", "c"))
+    old_path = os.pathsep.join([b, os.path.join("base", "a_suffix")])
+    monkeypatch.setenv("PATH", old_path)
+    
+    _prepend_to_path([a, b, c])
+    assert os.environ["PATH"] == os.pathsep.join([a, c]) + os.pathsep + old_path
+    
+    # Second call is a no-op
+    _prepend_to_path([a, b, c])
+    assert os.environ["PATH"] == os.pathsep.join([a, c]) + os.pathsep + old_path
+
+
+def test_load_renderdoc_searches_once_across_threads(monkeypatch):
+    """Concurrent first calls share a single search and its result"""
+    calls = []
+    module = object()
+    
+    def fake_find():
+        calls.append(1)
+        time.sleep(0.05)
+        return module
+    
+    monkeypatch.setattr(renderdoc_loader, "_rd_module", None)
+    monkeypatch.setattr(renderdoc_loader, "_rd_error", None)
+    monkeypatch.setattr(renderdoc_loader, "_find_renderdoc", fake_find)
+    
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(renderdoc_loader.load_renderdoc()))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    
+    assert len(calls) == 1
+    assert results == [module] * 8
+
+
+def test_load_renderdoc_remembers_failure(monkeypatch):
+    """A failed search is not repeated; later calls raise the same error"""
+    calls = []
+    
+    def fake_find():
+        calls.append(1)
+        raise RenderDocNotFoundError("RenderDoc module not found!")
+    
+    monkeypatch.setattr(renderdoc_loader, "_rd_module", None)
+    monkeypatch.setattr(renderdoc_loader, "_rd_error", None)
+    monkeypatch.setattr(renderdoc_loader, "_find_renderdoc", fake_find)
+    
+    for _ in range(3):
+        with pytest.raises(RenderDocNotFoundError, match="not found"):
+            renderdoc_loader.load_renderdoc()
+    
+    assert len(calls) == 1
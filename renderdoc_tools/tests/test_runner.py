@@ -0,0 +1,92 @@
+"""Unit tests for the workflow runner"""
+import dataclasses
+import pytest
+from unittest.mock import Mock
+from renderdoc_tools.exporters import JSONExporter
+from renderdoc_tools.core.models import Action, CaptureInfo
+from renderdoc_tools.workflows import Workflow, WorkflowRunner, get_preset
+from renderdoc_tools.workflows import runner as runner_module
+
+
+class _StubExtractor:
+    """Extractor returning a fixed result"""
+    
+    def __init__(self, name, result):
+        self.name = name
+        self.result = result
+    
+    def extract(self, controller):
+        return self.result
+
+
+def test_extract_data_stores_results_by_extractor_name():
+    """Test each extractor's result lands in its CaptureData field"""
+    actions = [Action(eventId=1, actionId=1, name="Draw", flags="Drawcall")]
+    counters = {'available': False}
+    workflow = Workflow(
+        name='test',
+        description='test',
+        extractors=[
+            _StubExtractor('actions', actions),
+            _StubExtractor('counters', counters),
+            _StubExtractor('unknown', ['ignored']),
+        ]
+    )
+    
+    capture_data = WorkflowRunner(workflow)._extract_data(Mock(), CaptureInfo(api=2))
+    
+    assert capture_data.actions == actions
+    assert capture_data.performance_counters == counters
+    assert capture_data.resources == []
+    assert capture_data.shaders == []
+    assert capture_data.pipeline_states is None
+
+
+class _StubCapture:
+    """CaptureFile stand-in that opens nothing"""
+    
+    def __init__(self, rdc_path):
+        self.controller = Mock()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        return False
+
+
+def test_run_attaches_analysis_to_result(tmp_path, monkeypatch):
+    """Test analyzer results come back on the returned capture data"""
+    monkeypatch.setattr(runner_module, 'CaptureFile', _StubCapture)
+    info_extractor = Mock()
+    info_extractor.extract.return_value = CaptureInfo(api=2)
+    analyzer = Mock()
+    analyzer.name = 'stub'
+    analyzer.analyze.return_value = {'score': 1}
+    workflow = Workflow(
+        name='test',
+        description='test',
+        analyzers=[analyzer],
+        capture_info_extractor=info_extractor
+    )
+    
+    capture_data = WorkflowRunner(workflow).run(tmp_path / "a.rdc", tmp_path / "out")
+    
+    assert capture_data.analysis == {'stub': {'score': 1}}
+    
+    # Workflows without analyzers leave the field unset
+    plain = Workflow(name='plain', description='plain', capture_info_extractor=info_extractor)
+    assert WorkflowRunner(plain).run(tmp_path / "b.rdc", tmp_path / "out").analysis is None
+
+
+def test_workflow_is_immutable():
+    """Test shared preset workflows can't be modified by callers"""
+    workflow = get_preset('quick')
+    
+    assert isinstance(workflow.extractors, tuple)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        workflow.name = 'changed'
+    
+    # Lists are still accepted and stored as tuples
+    custom = Workflow(name='custom', description='custom', exporters=[JSONExporter()])
+    assert isinstance(custom.exporters, tuple) and len(custom.exporters) == 1
@@ -6,6 +6,9 @@ from typing import Optional
 from pathlib import Path
 import json
 
+# Arguments and handlers of the last setup_logging() call
+_configured = None
+
 
 def setup_logging(
     level: str = "INFO",
@@ -20,6 +23,14 @@ def setup_logging(
         format_type: Format type ('text' or 'json')
         log_file: Optional log file path
     """
+    global _configured
+    
+    # Repeat calls with the same settings (and stdout) keep the existing handlers
+    root_logger = logging.getLogger()
+    key = (level.upper(), format_type, log_file, sys.stdout)
+    if _configured is not None and _configured[0] == key and _configured[1] == root_logger.handlers:
+        return
+    
     # Convert string level to logging constant
     log_level = getattr(logging, level.upper(), logging.INFO)
     
@@ -33,7 +44,6 @@ def setup_logging(
         )
     
     # Configure root logger
-    root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
     
     # Remove existing handlers
@@ -52,6 +62,8 @@ def setup_logging(
         file_handler.setLevel(log_level)
         file_handler.setFormatter(formatter)
         root_logger.addHandler(file_handler)
+    
+    _configured = (key, list(root_logger.handlers))
 
 
 class JSONFormatter(logging.Formatter):
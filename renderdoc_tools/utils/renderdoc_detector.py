@@ -1,8 +1,8 @@
 """RenderDoc installation detector"""
 
+import functools
 import os
 import sys
-from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 import logging
 
@@ -13,76 +13,92 @@ def find_renderdoc_installations() -> List[Dict[str, str]]:
     """
     Find all RenderDoc installations (standard and Meta Fork)
     
+    The filesystem is probed once per process; call
+    find_renderdoc_installations.cache_clear() to rescan.
+    
     Returns:
         List of dicts with 'type', 'path', 'pymodules_path', 'name'
     """
+    # Copies, so callers can't mutate the cached result
+    return [dict(inst) for inst in _scan_installations()]
+
+
+@functools.lru_cache(maxsize=1)
+def _scan_installations() -> Tuple[Dict[str, str], ...]:
+    """Probe known install locations; cached by find_renderdoc_installations()"""
     installations = []
     
+    # Candidates are plain strings probed with os.path; Path objects would
+    # only be built and discarded
     if sys.platform == "win32":
+        program_files = os.environ.get("PROGRAMFILES", "")
+        program_files_x86 = os.environ.get("PROGRAMFILES(X86)", "")
+        
         # Standard RenderDoc locations
         standard_paths = [
-            Path("C:/Program Files/RenderDoc"),
-            Path("C:/Program Files (x86)/RenderDoc"),
-            Path(os.environ.get("PROGRAMFILES", "")) / "RenderDoc",
-            Path(os.environ.get("PROGRAMFILES(X86)", "")) / "RenderDoc",
+            "C:/Program Files/RenderDoc",
+            "C:/Program Files (x86)/RenderDoc",
+            os.path.join(program_files, "RenderDoc"),
+            os.path.join(program_files_x86, "RenderDoc"),
         ]
         
         # Meta Fork locations
         meta_fork_paths = [
-            Path("C:/Program Files/RenderDocForMetaQuest"),
-            Path(os.environ.get("PROGRAMFILES", "")) / "RenderDocForMetaQuest",
+            "C:/Program Files/RenderDocForMetaQuest",
+            os.path.join(program_files, "RenderDocForMetaQuest"),
         ]
         
         # Check standard RenderDoc
         for path in standard_paths:
-            if path.exists():
+            if os.path.exists(path):
                 # Check for renderdoc.pyd or pymodules
-                pymodules = path / "pymodules"
-                renderdoc_pyd = path / "renderdoc.pyd"
+                pymodules = os.path.join(path, "pymodules")
+                has_pymodules = os.path.exists(pymodules)
                 
-                if pymodules.exists() or renderdoc_pyd.exists():
+                if has_pymodules or os.path.exists(os.path.join(path, "renderdoc.pyd")):
+                    path = os.path.normpath(path)
                     installations.append({
                         'type': 'standard',
-                        'path': str(path),
-                        'pymodules_path': str(pymodules) if pymodules.exists() else str(path),
+                        'path': path,
+                        'pymodules_path': os.path.normpath(pymodules) if has_pymodules else path,
                         'name': 'RenderDoc (Standard)'
                     })
                     break  # Only need one standard installation
         
         # Check Meta Fork
         for path in meta_fork_paths:
-            if path.exists():
-                pymodules = path / "pymodules"
-                if pymodules.exists():
-                    installations.append({
-                        'type': 'meta_fork',
-                        'path': str(path),
-                        'pymodules_path': str(pymodules),
-                        'name': 'RenderDoc Meta Fork'
-                    })
-                    break  # Only need one Meta Fork installation
+            pymodules = os.path.join(path, "pymodules")
+            if os.path.exists(pymodules):
+                installations.append({
+                    'type': 'meta_fork',
+                    'path': os.path.normpath(path),
+                    'pymodules_path': os.path.normpath(pymodules),
+                    'name': 'RenderDoc Meta Fork'
+                })
+                break  # Only need one Meta Fork installation
     
     elif sys.platform == "linux":
         # Linux locations
         linux_paths = [
-            Path("/usr/share/renderdoc"),
-            Path("/usr/local/share/renderdoc"),
-            Path.home() / ".local/share/renderdoc",
+            "/usr/share/renderdoc",
+            "/usr/local/share/renderdoc",
+            os.path.join(os.path.expanduser("~"), ".local", "share", "renderdoc"),
         ]
         
         for path in linux_paths:
-            if path.exists():
-                renderdoc_so = path / "renderdoc.so"
-                if renderdoc_so.exists():
-                    installations.append({
-                        'type': 'standard',
-                        'path': str(path),
-                        'pymodules_path': str(path),
-                        'name': 'RenderDoc (Standard)'
-                    })
-                    break
+            if os.path.exists(os.path.join(path, "renderdoc.so")):
+                installations.append({
+                    'type': 'standard',
+                    'path': path,
+                    'pymodules_path': path,
+                    'name': 'RenderDoc (Standard)'
+                })
+                break
     
-    return installations
+    return tuple(installations)
+
+
+find_renderdoc_installations.cache_clear = _scan_installations.cache_clear
 
 
 def get_preferred_renderdoc() -> Optional[Dict[str, str]]:
@@ -2,8 +2,9 @@
 
 import sys
 import os
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, List, Optional
 import logging
 
 from renderdoc_tools.core.exceptions import RenderDocNotFoundError
@@ -13,6 +14,55 @@ logger = logging.getLogger(__name__)
 
 # Global variable to store the loaded module
 _rd_module: Optional[object] = None
+_rd_error: Optional[str] = None  # Message of a failed search, raised again on later calls
+_rd_lock = threading.Lock()  # Serializes the first load
+
+
+def _dll_subdirectories(base_path: str) -> List[str]:
+    """
+    List the directories one and two levels below base_path
+    
+    Uses os.scandir so directory checks come from the listing itself
+    rather than a separate stat per entry.
+    
+    Args:
+        base_path: Directory to scan
+        
+    Returns:
+        Directory paths, each child followed by its own subdirectories
+    """
+    dirs = []
+    try:
+        with os.scandir(base_path) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                dirs.append(entry.path)
+                # Add nested subdirectories
+                try:
+                    with os.scandir(entry.path) as nested_entries:
+                        dirs.extend(nested.path for nested in nested_entries if nested.is_dir())
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    return dirs
+
+
+def _prepend_to_path(path_parts: List[str]) -> None:
+    """
+    Prepend directories to PATH, skipping any already present
+    
+    Membership is tested per entry on normalized case, not by substring.
+    
+    Args:
+        path_parts: Directories to add, in search order
+    """
+    old_path = os.environ.get('PATH', '')
+    existing = set(map(os.path.normcase, old_path.split(os.pathsep)))
+    new_parts = [p for p in path_parts if os.path.normcase(p) not in existing]
+    if new_parts:
+        os.environ['PATH'] = os.pathsep.join(new_parts) + os.pathsep + old_path
 
 
 def _try_load_from_path(pymodules_path: Path) -> Optional[object]:
@@ -28,32 +78,10 @@ def _try_load_from_path(pymodules_path: Path) -> Optional[object]:
         # For Windows Meta Fork, also need to update PATH for DLLs
         if sys.platform == "win32" and "RenderDocForMetaQuest" in str(pymodules_path):
             base_path = pymodules_path.parent
-            path_parts = [str(base_path)]
-            
-            # Add subdirectories for DLLs
-            try:
-                for item in os.listdir(base_path):
-                    subdir = base_path / item
-                    if subdir.is_dir():
-                        path_parts.append(str(subdir))
-                        # Add nested subdirectories
-                        try:
-                            for nested_item in os.listdir(subdir):
-                                nested_subdir = subdir / nested_item
-                                if nested_subdir.is_dir():
-                                    path_parts.append(str(nested_subdir))
-                        except Exception:
-                            pass
-            except Exception:
-                pass
+            path_parts = [str(base_path)] + _dll_subdirectories(str(base_path))
             
             # Update PATH
-            old_path = os.environ.get('PATH', '')
-            new_path = os.pathsep.join(path_parts)
-            if new_path not in old_path:
-                path_list = old_path.split(os.pathsep)
-                path_list = [p for p in path_list if str(base_path) not in p]
-                os.environ['PATH'] = new_path + os.pathsep + os.pathsep.join(path_list)
+            _prepend_to_path(path_parts)
             
             # Set Qt plugin paths
             qt_plugin_path = base_path / "qtplugins"
@@ -65,12 +93,12 @@ def _try_load_from_path(pymodules_path: Path) -> Optional[object]:
             os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
             os.environ.setdefault('QT_LOGGING_RULES', '*.debug=false')
             
-            # Add DLL directories for Python 3.8+
+            # Add DLL directories for Python 3.8+ (all were just listed, so
+            # no existence check is needed)
             if sys.version_info >= (3, 8):
                 for path_part in path_parts:
                     try:
-                        if os.path.exists(path_part):
-                            os.add_dll_directory(path_part)
+                        os.add_dll_directory(path_part)
                     except Exception:
                         pass
         
@@ -85,26 +113,50 @@ def _try_load_from_path(pymodules_path: Path) -> Optional[object]:
         return None
 
 
+def _meta_fork_first(installations: List[dict]) -> Iterator[dict]:
+    """Yield Meta Fork installations, then the rest, each in detection order"""
+    yield from (inst for inst in installations if inst['type'] == 'meta_fork')
+    yield from (inst for inst in installations if inst['type'] != 'meta_fork')
+
+
 def load_renderdoc() -> object:
     """
     Load and return the RenderDoc module
     Automatically detects and tries both standard RenderDoc and Meta Fork
     
+    Safe to call from several threads: the search (and its sys.path and
+    PATH changes) runs once, and later calls return the cached module
+    without taking the lock. A failed search is also remembered, so later
+    calls raise the same error without probing the filesystem again.
+    
     Returns:
         RenderDoc module object
         
     Raises:
         RenderDocNotFoundError: If RenderDoc module cannot be loaded
     """
-    global _rd_module
+    global _rd_module, _rd_error
     
     if _rd_module is not None:
         return _rd_module
     
+    with _rd_lock:
+        if _rd_module is None:
+            if _rd_error is not None:
+                raise RenderDocNotFoundError(_rd_error)
+            try:
+                _rd_module = _find_renderdoc()
+            except RenderDocNotFoundError as e:
+                _rd_error = str(e)
+                raise
+    return _rd_module
+
+
+def _find_renderdoc() -> object:
+    """Search the standard import path and known installations for RenderDoc"""
     # First try standard import (if already in path)
     try:
         import renderdoc as rd
-        _rd_module = rd
         logger.info("Loaded RenderDoc module from standard location")
         return rd
     except ImportError:
@@ -113,15 +165,12 @@ def load_renderdoc() -> object:
     # Find all RenderDoc installations and try each one
     installations = find_renderdoc_installations()
     
-    # Try each installation (prefer Meta Fork if both available)
-    # Sort so Meta Fork comes first
-    installations_sorted = sorted(installations, key=lambda x: 0 if x['type'] == 'meta_fork' else 1)
-    
-    for inst in installations_sorted:
+    # Try each installation (prefer Meta Fork if both available); stops at
+    # the first one that loads
+    for inst in _meta_fork_first(installations):
         pymodules_path = Path(inst['pymodules_path'])
         rd_module = _try_load_from_path(pymodules_path)
         if rd_module:
-            _rd_module = rd_module
             logger.info(f"Successfully loaded {inst['name']} from {pymodules_path}")
             return rd_module
     
@@ -133,7 +182,6 @@ def load_renderdoc() -> object:
         logger.info(f"Trying fallback Meta Fork location: {meta_quest_pymodules}")
         rd_module = _try_load_from_path(meta_quest_pymodules)
         if rd_module:
-            _rd_module = rd_module
             return rd_module
     
     # If still not found, raise error
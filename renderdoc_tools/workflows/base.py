@@ -1,7 +1,7 @@
 """Base workflow classes"""
 
-from typing import List, Optional
-from dataclasses import dataclass, field
+from typing import Optional, Tuple
+from dataclasses import dataclass
 
 from renderdoc_tools.extractors.base import BaseExtractor
 from renderdoc_tools.exporters.base import BaseExporter
@@ -9,13 +9,23 @@ from renderdoc_tools.analyzers.base import BaseAnalyzer
 from renderdoc_tools.core.capture_info import CaptureInfoExtractor
 
 
-@dataclass
+@dataclass(frozen=True)
 class Workflow:
-    """Workflow definition"""
+    """
+    Workflow definition
+    
+    Immutable, since get_preset() hands the same instance to every caller.
+    Extractor, exporter and analyzer sequences are stored as tuples (lists
+    are accepted and converted).
+    """
     name: str
     description: str
-    extractors: List[BaseExtractor] = field(default_factory=list)
-    exporters: List[BaseExporter] = field(default_factory=list)
-    analyzers: List[BaseAnalyzer] = field(default_factory=list)
+    extractors: Tuple[BaseExtractor, ...] = ()
+    exporters: Tuple[BaseExporter, ...] = ()
+    analyzers: Tuple[BaseAnalyzer, ...] = ()
     capture_info_extractor: Optional[CaptureInfoExtractor] = None
+    
+    def __post_init__(self):
+        for name in ('extractors', 'exporters', 'analyzers'):
+            object.__setattr__(self, name, tuple(getattr(self, name)))
 
@@ -1,5 +1,7 @@
 """Workflow preset definitions"""
 
+import functools
+
 from renderdoc_tools.workflows.base import Workflow
 from renderdoc_tools.core import CaptureInfoExtractor
 from renderdoc_tools.extractors import (
@@ -10,13 +12,26 @@ from renderdoc_tools.extractors import (
     CounterExtractor
 )
 from renderdoc_tools.exporters import JSONExporter, CSVExporter
-from renderdoc_tools.analyzers.quest.report import QuestReportGenerator
 
 
+# Preset name -> description, in display order
+PRESET_DESCRIPTIONS = {
+    'quick': 'Quick export - JSON only, no pipeline state',
+    'full': 'Full analysis - JSON with pipeline state and counters',
+    'quest': 'Quest analysis - Full Quest-specific profiling',
+    'csv-only': 'CSV export only - Actions and resources to CSV',
+    'performance': 'Performance analysis - Counters and optimization report',
+}
+
+
+@functools.lru_cache(maxsize=None)
 def get_preset(name: str) -> Workflow:
     """
     Get workflow preset by name
     
+    Only the requested preset is built, once per process; later calls with
+    the same name return the same Workflow.
+    
     Args:
         name: Preset name
         
@@ -26,19 +41,13 @@ def get_preset(name: str) -> Workflow:
     Raises:
         ValueError: If preset not found
     """
-    presets = {
-        'quick': _create_quick_preset(),
-        'full': _create_full_preset(),
-        'quest': _create_quest_preset(),
-        'csv-only': _create_csv_only_preset(),
-        'performance': _create_performance_preset(),
-    }
+    factory = _PRESET_FACTORIES.get(name)
     
-    if name not in presets:
-        available = ', '.join(presets.keys())
+    if factory is None:
+        available = ', '.join(_PRESET_FACTORIES)
         raise ValueError(f"Unknown preset: {name}. Available: {available}")
     
-    return presets[name]
+    return factory()
 
 
 def list_presets() -> dict:
@@ -48,13 +57,7 @@ def list_presets() -> dict:
     Returns:
         Dictionary mapping preset names to descriptions
     """
-    return {
-        'quick': 'Quick export - JSON only, no pipeline state',
-        'full': 'Full analysis - JSON with pipeline state and counters',
-        'quest': 'Quest analysis - Full Quest-specific profiling',
-        'csv-only': 'CSV export only - Actions and resources to CSV',
-        'performance': 'Performance analysis - Counters and optimization report',
-    }
+    return dict(PRESET_DESCRIPTIONS)
 
 
 def _create_quick_preset() -> Workflow:
@@ -62,14 +65,14 @@ def _create_quick_preset() -> Workflow:
     return Workflow(
         name='quick',
         description='Quick export - JSON only, no pipeline state',
-        extractors=[
+        extractors=(
             ActionExtractor(),
             ResourceExtractor(),
-        ],
-        exporters=[
+        ),
+        exporters=(
             JSONExporter(),
-        ],
-        analyzers=[],
+        ),
+        analyzers=(),
         capture_info_extractor=CaptureInfoExtractor()
     )
 
@@ -79,38 +82,41 @@ def _create_full_preset() -> Workflow:
     return Workflow(
         name='full',
         description='Full analysis - JSON with pipeline state and counters',
-        extractors=[
+        extractors=(
             ActionExtractor(),
             ResourceExtractor(),
             ShaderExtractor(),
-        ],
-        exporters=[
+        ),
+        exporters=(
             JSONExporter(),
             CSVExporter(),
-        ],
-        analyzers=[],
+        ),
+        analyzers=(),
         capture_info_extractor=CaptureInfoExtractor()
     )
 
 
 def _create_quest_preset() -> Workflow:
     """Create Quest workflow preset"""
+    # Only the quest and performance presets need the Quest analyzer stack
+    from renderdoc_tools.analyzers.quest import report_generator
+    
     return Workflow(
         name='quest',
         description='Quest analysis - Full Quest-specific profiling',
-        extractors=[
+        extractors=(
             ActionExtractor(),
             ResourceExtractor(),
             ShaderExtractor(),
             CounterExtractor(),
-        ],
-        exporters=[
+        ),
+        exporters=(
             JSONExporter(),
             CSVExporter(),
-        ],
-        analyzers=[
-            QuestReportGenerator(),
-        ],
+        ),
+        analyzers=(
+            report_generator,
+        ),
         capture_info_extractor=CaptureInfoExtractor()
     )
 
@@ -120,34 +126,45 @@ def _create_csv_only_preset() -> Workflow:
     return Workflow(
         name='csv-only',
         description='CSV export only - Actions and resources to CSV',
-        extractors=[
+        extractors=(
             ActionExtractor(),
             ResourceExtractor(),
-        ],
-        exporters=[
+        ),
+        exporters=(
             CSVExporter(),
-        ],
-        analyzers=[],
+        ),
+        analyzers=(),
         capture_info_extractor=CaptureInfoExtractor()
     )
 
 
 def _create_performance_preset() -> Workflow:
     """Create performance workflow preset"""
+    # Only the quest and performance presets need the Quest analyzer stack
+    from renderdoc_tools.analyzers.quest import report_generator
+    
     return Workflow(
         name='performance',
         description='Performance analysis - Counters and optimization report',
-        extractors=[
+        extractors=(
             ActionExtractor(),
             ResourceExtractor(),
             CounterExtractor(),
-        ],
-        exporters=[
+        ),
+        exporters=(
             JSONExporter(),
-        ],
-        analyzers=[
-            QuestReportGenerator(),
-        ],
+        ),
+        analyzers=(
+            report_generator,
+        ),
         capture_info_extractor=CaptureInfoExtractor()
     )
 
+
+_PRESET_FACTORIES = {
+    'quick': _create_quick_preset,
+    'full': _create_full_preset,
+    'quest': _create_quest_preset,
+    'csv-only': _create_csv_only_preset,
+    'performance': _create_performance_preset,
+}
@@ -4,8 +4,9 @@ from pathlib import Path
 from typing import Optional, Callable, Dict, Any
 import logging
 
-from renderdoc_tools.core import CaptureFile
-from renderdoc_tools.core.models import CaptureData
+from renderdoc_tools.core import CaptureFile, CaptureInfoExtractor
+from renderdoc_tools.core.models import CaptureData, construct_model
+from renderdoc_tools.extractors import PipelineExtractor, ResourceExtractor, ShaderExtractor
 from renderdoc_tools.workflows.base import Workflow
 from renderdoc_tools.exporters import JSONExporter
 
@@ -15,6 +16,15 @@ logger = logging.getLogger(__name__)
 class WorkflowRunner:
     """Executes workflows on capture files"""
     
+    # Extractor name -> CaptureData field its result is stored in
+    _SLOT_FOR_NAME = {
+        'actions': 'actions',
+        'resources': 'resources',
+        'shaders': 'shaders',
+        'pipeline': 'pipeline_states',
+        'counters': 'performance_counters',
+    }
+    
     def __init__(
         self,
         workflow: Workflow,
@@ -44,7 +54,8 @@ class WorkflowRunner:
             output_dir: Output directory (default: rdc_output/)
             
         Returns:
-            Extracted capture data
+            Extracted capture data, with analyzer results (if any) in
+            its analysis field
         """
         rdc_path = Path(rdc_path)
         output_dir = output_dir or Path('rdc_output')
@@ -69,11 +80,8 @@ class WorkflowRunner:
             # Run analyzers
             if self.workflow.analyzers:
                 self._update_progress("Running analyzers...")
-                analysis_results = self._run_analyzers(capture_data, capture.controller)
-                # Store analysis results
-                if analysis_results:
-                    capture_data_dict = capture_data.dict(by_alias=True) if hasattr(capture_data, 'dict') else capture_data
-                    capture_data_dict['analysis'] = analysis_results
+                # Set on the model in place; the runner keeps no per-run state
+                capture_data.analysis = self._run_analyzers(capture_data, capture.controller)
             
             # Export data
             if self.workflow.exporters:
@@ -85,37 +93,36 @@ class WorkflowRunner:
     
     def _extract_data(self, controller, capture_info) -> CaptureData:
         """Extract data using configured extractors"""
-        actions = []
-        resources = []
-        shaders = []
-        pipeline_states = None
-        performance_counters = None
+        # CaptureData field for each extractor's result
+        slots = {
+            'actions': [],
+            'resources': [],
+            'shaders': [],
+            'pipeline_states': None,
+            'performance_counters': None,
+        }
+        resource_descriptions = None  # Shared GetResources() result
         
         for extractor in self.workflow.extractors:
             self.logger.debug(f"Running extractor: {extractor.name}")
             self._update_progress(f"Extracting {extractor.name}...")
             
-            extracted = extractor.extract(controller)
+            if isinstance(extractor, PipelineExtractor) and slots['actions']:
+                # Reuse the actions already extracted for their event IDs
+                extracted = extractor.extract(controller, actions=slots['actions'])
+            elif isinstance(extractor, (ResourceExtractor, ShaderExtractor)):
+                if resource_descriptions is None:
+                    resource_descriptions = controller.GetResources()
+                extracted = extractor.extract(controller, resource_descriptions=resource_descriptions)
+            else:
+                extracted = extractor.extract(controller)
             
-            if extractor.name == "actions":
-                actions = extracted
-            elif extractor.name == "resources":
-                resources = extracted
-            elif extractor.name == "shaders":
-                shaders = extracted
-            elif extractor.name == "pipeline":
-                pipeline_states = extracted
-            elif extractor.name == "counters":
-                performance_counters = extracted
+            slot = self._SLOT_FOR_NAME.get(extractor.name)
+            if slot is not None:
+                slots[slot] = extracted
         
-        capture_data = CaptureData(
-            capture_info=capture_info,
-            actions=actions,
-            resources=resources,
-            shaders=shaders,
-            pipeline_states=pipeline_states,
-            performance_counters=performance_counters
-        )
+        # Children are already-built models, so skip re-validating (and copying) them
+        capture_data = construct_model(CaptureData, capture_info=capture_info, **slots)
         
         return capture_data
     
@@ -127,16 +134,11 @@ class WorkflowRunner:
         """Run configured analyzers"""
         results = {}
         
-        # Convert CaptureData to dict for analyzers
-        if hasattr(capture_data, 'dict'):
-            capture_data_dict = capture_data.dict(by_alias=True)
-        else:
-            capture_data_dict = capture_data
-        
+        # Analyzers read the model directly; no .dict() deep copy
         for analyzer in self.workflow.analyzers:
             self.logger.debug(f"Running analyzer: {analyzer.name}")
             try:
-                analysis_result = analyzer.analyze(capture_data_dict, controller)
+                analysis_result = analyzer.analyze(capture_data, controller)
                 results[analyzer.name] = analysis_result
             except Exception as e:
                 self.logger.warning(f"Analyzer {analyzer.name} failed: {e}")
@@ -1,20 +1,22 @@
 """Setup script for renderdoc-tools"""
 
+import re
 from setuptools import setup, find_packages
 from pathlib import Path
 
-# Read version from package
+# Read version from package source; executing __init__.py would import the
+# whole package (and pydantic) just for one string
 __version__ = "2.0.0"
 try:
-    import importlib.util
     init_file = Path(__file__).parent / "renderdoc_tools" / "__init__.py"
-    if init_file.exists():
-        spec = importlib.util.spec_from_file_location("renderdoc_tools", init_file)
-        if spec and spec.loader:
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            __version__ = getattr(module, "__version__", "2.0.0")
-except Exception:
+    match = re.search(
+        r'^__version__\s*=\s*["\']([^"\']+)["\']',
+        init_file.read_text(encoding="utf-8"),
+        re.MULTILINE
+    )
+    if match:
+        __version__ = match.group(1)
+except OSError:
     pass
 
 # Read README
@@ -55,6 +57,21 @@ setup(
             "rich>=13.0.0",
             "tqdm>=4.65.0",
         ],
+        "analysis": [
+            "numpy>=1.19.0",
+            "pandas>=1.1.0",
+        ],
+        "fast": [
+            "orjson>=3.0.0",
+        ],
+        "cluster": [
+            "mpi4py>=3.0.0",
+            "distributed>=2.0.0",
+        ],
+        "jit": [
+            "numpy>=1.19.0",
+            "numba>=0.50.0",
+        ],
     },
     entry_points={
         "console_scripts": [
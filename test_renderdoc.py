@@ -19,40 +19,39 @@ if os.path.exists(meta_quest_pymodules):
     print("Adding pymodules to sys.path...")
     sys.path.insert(0, meta_quest_pymodules)
     
-    # Collect all directories
+    # Collect the base and its directories two levels deep; scandir
+    # entries carry their type, so no extra stat per item
     path_parts = [meta_quest_base]
     try:
-        for item in os.listdir(meta_quest_base):
-            subdir = os.path.join(meta_quest_base, item)
-            if os.path.isdir(subdir):
-                path_parts.append(subdir)
-                # Add nested subdirectories too
-                try:
-                    for nested_item in os.listdir(subdir):
-                        nested_subdir = os.path.join(subdir, nested_item)
-                        if os.path.isdir(nested_subdir):
-                            path_parts.append(nested_subdir)
-                except:
-                    pass
-    except:
+        with os.scandir(meta_quest_base) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    path_parts.append(entry.path)
+                    # Add nested subdirectories too
+                    try:
+                        with os.scandir(entry.path) as nested_entries:
+                            path_parts.extend(n.path for n in nested_entries if n.is_dir())
+                    except OSError:
+                        pass
+    except OSError:
         pass
     
     if sys.version_info >= (3, 8):
         print("Python 3.8+ detected, adding DLL directories...")
+        # Every part was just listed, so no existence check is needed
         for path_part in path_parts:
             try:
-                if os.path.exists(path_part):
-                    os.add_dll_directory(path_part)
-                    print(f"  Added: {path_part}")
+                os.add_dll_directory(path_part)
+                print(f"  Added: {path_part}")
             except Exception as e:
                 print(f"  Failed to add {path_part}: {e}")
     
     print("Adding to PATH environment variable...")
     old_path = os.environ.get('PATH', '')
-    new_path = os.pathsep.join(path_parts)
-    path_list = old_path.split(os.pathsep)
-    path_list = [p for p in path_list if meta_quest_base not in p]
-    os.environ['PATH'] = new_path + os.pathsep + os.pathsep.join(path_list)
+    existing = set(map(os.path.normcase, old_path.split(os.pathsep)))
+    new_parts = [p for p in path_parts if os.path.normcase(p) not in existing]
+    if new_parts:
+        os.environ['PATH'] = os.pathsep.join(new_parts) + os.pathsep + old_path
     
     # Set Qt plugin path and use offscreen platform
     qt_plugin_path = os.path.join(meta_quest_base, "qtplugins")